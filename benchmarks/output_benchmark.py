@@ -0,0 +1,71 @@
+"""Compares the raw socket output of the nodes with the asyncio datagram transport output.
+
+The frames are sent to a local UDP socket, so the result shows the overhead of the output
+and not the speed of the network. Usage:
+
+    python benchmarks/output_benchmark.py [--universes 64] [--frames 200] [--uvloop]
+"""
+import argparse
+import asyncio
+import socket
+from time import perf_counter
+
+from pyartnet import ArtNetNode
+
+
+def create_node(port: int, universes: int) -> ArtNetNode:
+    node = ArtNetNode('127.0.0.1', port, start_refresh_task=False)
+    for nr in range(universes):
+        node.add_universe(nr).add_channel(1, 512)
+    return node
+
+
+async def run(name: str, port: int, universes: int, frames: int, transport: bool):
+    node = create_node(port, universes)
+    if transport:
+        await node.use_datagram_transport()
+
+    start = perf_counter()
+    for _ in range(frames):
+        for universe in node._universes:
+            universe.send_data()
+        # let the event loop flush pending frames
+        await asyncio.sleep(0)
+    duration = perf_counter() - start
+
+    packets = universes * frames
+    print(f'{name:>10s}: {packets / duration:10.0f} packets/s, {duration / packets * 1e6:6.2f} us/packet, '
+          f'{node.dropped_frames:d} dropped')
+
+    if transport:
+        node._output._transport.close()     # type: ignore[union-attr]
+        await asyncio.sleep(0)
+    else:
+        node._socket.close()
+
+
+async def main(universes: int, frames: int):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 * 1024 * 1024)
+    port = receiver.getsockname()[1]
+
+    try:
+        await run('socket', port, universes, frames, transport=False)
+        await run('transport', port, universes, frames, transport=True)
+    finally:
+        receiver.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--universes', type=int, default=64)
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--uvloop', action='store_true', help='use the event loop of uvloop')
+    args = parser.parse_args()
+
+    if args.uvloop:
+        import uvloop
+        uvloop.install()
+
+    asyncio.run(main(args.universes, args.frames))
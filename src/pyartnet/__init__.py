@@ -1,4 +1,4 @@
-from . import errors, fades, output_correction
+from . import effects, errors, fades, output_correction
 from .__version__ import __version__
 
 # isort: split
@@ -7,6 +7,6 @@ from .base import BaseUniverse, Channel
 
 # isort: split
 
-from .impl_artnet import ArtNetNode
-from .impl_kinet import KiNetNode
-from .impl_sacn import SacnNode
+from .impl_artnet import ArtNetNode, ArtNetReceiver
+from .impl_kinet import KiNetNode, KiNetReceiver
+from .impl_sacn import SacnNode, SacnReceiver
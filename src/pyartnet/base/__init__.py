@@ -1,4 +1,6 @@
 from .base_node import BaseNode
+from .base_receiver import BaseReceiver
 from .channel import Channel, ChannelBoundFade
+from .process_job import ProcessJob
 from .seq_counter import SequenceCounter
 from .universe import BaseUniverse
@@ -1,9 +1,10 @@
 import logging
 from asyncio import create_task, sleep, Task
-from time import monotonic
 from traceback import format_exc
 from typing import Any, Callable, Coroutine, Final, Optional, Set
 
+from .clock import monotonic
+
 log = logging.getLogger('pyartnet.Task')
 
 
@@ -1,20 +1,30 @@
 import logging
 import socket
-from asyncio import sleep
-from time import monotonic
-from typing import Dict, Final, Generic, List, Optional, Tuple, TypeVar, Union
+from asyncio import get_running_loop, sleep
+from typing import Any, Callable, Dict, Final, Generic, List, Optional, Tuple, TypeVar, Union
 
 import pyartnet
 
 from ..errors import DuplicateUniverseError, UniverseNotFoundError
 from .background_task import ExceptionIgnoringTask, SimpleBackgroundTask
+from .clock import monotonic, TIMER_TOLERANCE
 from .output_correction import OutputCorrection
+from .socket_output import SocketOutput
+from .transport_output import DatagramTransportOutput
 
 log = logging.getLogger('pyartnet.ArtNetNode')
 
 
 TYPE_U = TypeVar('TYPE_U', bound='pyartnet.base.BaseUniverse')
 
+# adaptive frame rate: ticks before the rate is lowered/raised and the maximum divider of the frame rate
+ADAPT_OVERRUN_TICKS: Final = 3
+ADAPT_RECOVER_TICKS: Final = 25
+ADAPT_MAX_THROTTLE: Final = 8
+
+# pacing: minimum time between two batches, the timer resolution of the event loop is ~1ms
+PACING_MIN_INTERVAL: Final = 0.001
+
 
 # noinspection PyProtectedMember
 class BaseNode(Generic[TYPE_U], OutputCorrection):
@@ -38,6 +48,8 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._socket.bind(source_address)
 
+        self._output: Union[SocketOutput, DatagramTransportOutput] = SocketOutput(self._socket, self._dst)
+
         # Name used for the Tasks (e.g. in error msg)
         name: Final = f'{self._ip:s}:{self._port}'
 
@@ -50,12 +62,33 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
         # fade task
         self._process_every: float = 1 / max(1, max_fps)
         self._process_task: Final = SimpleBackgroundTask(self._process_values_task, f'Refresh task {name:s}')
-        self._process_jobs: List['pyartnet.base.ChannelBoundFade'] = []
+        self._process_jobs: List['pyartnet.base.ProcessJob'] = []
+
+        # adaptive frame rate
+        self._adaptive_fps: bool = False
+        self._overrun_ct: int = 0
+        self._underrun_ct: int = 0
+
+        # pacing: fraction of the frame period over which the universes of one frame are sent
+        self._pacing: float = 0
+
+        # immediate send
+        self._immediate_send: bool = False
+        self._immediate_fps: float = 44
+        self._immediate_burst: int = 1
 
-        # packet data
-        self._packet_base: Union[bytearray, bytes] = bytearray()
+        # protocol header which is the same for all universes, the universes build their packets from it
+        self._packet_base: bytes = b''
         self._last_send: float = 0
 
+        # grand master for the intensity channels of all universes
+        self._master: float = 1
+
+        # set by the FrameRecorder
+        self._record_frame: Optional[Callable[[int, bytearray], Any]] = None
+        # set by the FrameTap
+        self._tap_packet: Optional[Callable[[int, Union[bytearray, bytes]], Any]] = None
+
         # containing universes
         self._universes: Tuple[TYPE_U, ...] = ()
         self._universe_map: Dict[int, TYPE_U] = {}
@@ -67,13 +100,169 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
     def _send_universe(self, id: int, byte_size: int, values: bytearray, universe: TYPE_U):
         raise NotImplementedError()
 
-    def _send_data(self, data: Union[bytearray, bytes]) -> int:
+    def _send_data(self, packet: Union[bytearray, bytes], universe: int) -> int:
 
-        ret = self._socket.sendto(self._packet_base + data, self._dst)
+        ret = self._output.send(packet, universe)
+        if self._tap_packet is not None:
+            self._tap_packet(universe, packet)
 
         self._last_send = monotonic()
         return ret
 
+    def _format_packet(self, packet: bytes) -> str:
+        """Human-readable representation of a packet which was sent by the node"""
+        return packet.hex()
+
+    async def use_datagram_transport(self):
+        """Send the frames through an asyncio datagram transport instead of directly through the socket.
+        With uvloop this uses the UDP implementation of libuv."""
+        if isinstance(self._output, DatagramTransportOutput):
+            return None
+        if not isinstance(self._output, SocketOutput):
+            raise ValueError(f'Node {self._ip}:{self._port} sends through a {self._output.__class__.__name__:s}!')
+
+        output = DatagramTransportOutput(self._dst)
+        await get_running_loop().create_datagram_endpoint(lambda: output, sock=self._socket)
+
+        # move pending frames to the new output
+        old = self._output
+        old.close()
+        for universe, packet in old._pending.items():
+            output.send(packet, universe)
+        output._dropped = old._dropped
+        self._output = output
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames which could not be sent because the socket buffer was full
+        and a newer frame for the same universe was available"""
+        return self._output._dropped
+
+    @property
+    def master(self) -> float:
+        """Grand master of the node"""
+        return self._master
+
+    def set_master(self, master: float):
+        """Set the grand master of the node. The master is applied to all channels which are marked as
+        intensity channels (see :meth:`Channel.set_intensity`) when the universes are sent
+        and is combined with the master of the universe. The channel values are not changed.
+
+        :param master: master value (0..1)
+        """
+        if not 0 <= master <= 1:
+            raise ValueError('Master must be between 0 and 1!')
+        self._master = master
+        for u in self._universes:
+            u._update_master()
+        return self
+
+    def set_immediate_send(self, enabled: bool = True, max_fps: float = 44, burst: int = 1):
+        """Send changes of a universe right away instead of waiting for the next frame of the node.
+        The frames of every universe are limited by a token bucket, changes which exceed the rate
+        are sent with the next frame of the node.
+
+        :param enabled: enable or disable immediate send
+        :param max_fps: maximum frames per second of a universe (44 is the maximum refresh rate of DMX512)
+        :param burst: how many frames may be sent back to back
+        """
+        if max_fps <= 0:
+            raise ValueError('max_fps must be > 0!')
+        if burst < 1:
+            raise ValueError('burst must be >= 1!')
+
+        self._immediate_send = enabled
+        self._immediate_fps = max_fps
+        self._immediate_burst = burst
+        return self
+
+    def set_pacing(self, fraction: Optional[float] = 0.5):
+        """Spread the packets of one frame evenly over a part of the frame period instead of sending them
+        back to back. This prevents packet loss on slow controllers or switches when many universes are sent.
+
+        :param fraction: part of the frame period which is used to send the packets (0..1), None to disable pacing
+        """
+        if fraction is None:
+            fraction = 0
+        if not 0 <= fraction <= 1:
+            raise ValueError('Pacing fraction must be between 0 and 1!')
+        self._pacing = fraction
+        return self
+
+    async def _send_paced(self, universes: List[TYPE_U]):
+        count = len(universes)
+        duration = self._process_every * self._pacing
+        batches = max(1, min(count, int(duration / PACING_MIN_INTERVAL)))
+        batch_size = -(-count // batches)
+        interval = duration / batches
+
+        deadline = monotonic()
+        for start in range(0, count, batch_size):
+            if start:
+                deadline += interval
+                delay = deadline - monotonic()
+                if delay > 0:
+                    await sleep(delay)
+
+            for universe in universes[start: start + batch_size]:
+                # the universe might have already been sent immediately
+                if universe._data_changed:
+                    universe.send_data()
+
+    def set_adaptive_fps(self, enabled: bool = True):
+        """When the frame loop keeps overrunning its time budget the output rate of the universes is lowered,
+        starting with the universes with the lowest priority. When the load drops the rate is raised again.
+
+        :param enabled: enable or disable the adaptive frame rate
+        """
+        self._adaptive_fps = enabled
+        self._overrun_ct = 0
+        self._underrun_ct = 0
+        if not enabled:
+            for u in self._universes:
+                u._set_throttle(1)
+        return self
+
+    def _adapt_fps(self, duration: float):
+        budget = self._process_every
+
+        if duration > budget:
+            self._underrun_ct = 0
+            self._overrun_ct += 1
+            if self._overrun_ct < ADAPT_OVERRUN_TICKS:
+                return None
+            self._overrun_ct = 0
+
+            # slow down the universes with the lowest priority which can still be slowed down
+            candidates = [u for u in self._universes if u._throttle < ADAPT_MAX_THROTTLE]
+            if not candidates:
+                return None
+            prio = min(u._priority for u in candidates)
+            for u in candidates:
+                if u._priority == prio:
+                    u._set_throttle(min(u._throttle * 2, ADAPT_MAX_THROTTLE))
+            log.debug(f'Frame loop overrun ({duration * 1000:.1f}ms), slowed down universes with priority {prio}')
+            return None
+
+        self._overrun_ct = 0
+        if duration > budget / 2:
+            self._underrun_ct = 0
+            return None
+
+        self._underrun_ct += 1
+        if self._underrun_ct < ADAPT_RECOVER_TICKS:
+            return None
+        self._underrun_ct = 0
+
+        # speed up the universes with the highest priority first
+        candidates = [u for u in self._universes if u._throttle > 1]
+        if not candidates:
+            return None
+        prio = max(u._priority for u in candidates)
+        for u in candidates:
+            if u._priority == prio:
+                u._set_throttle(u._throttle // 2)
+
     async def _process_values_task(self):
         # wait a little, so we can schedule multiple tasks/updates, and they all start together
         await sleep(0.01)
@@ -81,6 +270,7 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
         idle_ct = 0
         while idle_ct < 10:
             idle_ct += 1
+            tick_start = monotonic()
 
             # process jobs
             to_remove = []
@@ -92,17 +282,33 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
                     to_remove.append(job)
 
             # send data of universe
+            paced: List[TYPE_U] = []
             for universe in self._universes:
                 if not universe._data_changed:
                     continue
-                universe.send_data()
                 idle_ct = 0
+                # rate limit: the universe stays changed and will be sent in a later tick
+                if not universe._can_send(tick_start):
+                    continue
+                if self._pacing:
+                    paced.append(universe)
+                else:
+                    universe.send_data()
 
             if to_remove:
                 for job in to_remove:
                     self._process_jobs.remove(job)
                     job.fade_complete()
 
+            if self._adaptive_fps:
+                self._adapt_fps(monotonic() - tick_start)
+
+            if paced:
+                paced_start = monotonic()
+                await self._send_paced(paced)
+                await sleep(max(0.0, self._process_every - (monotonic() - paced_start)))
+                continue
+
             await sleep(self._process_every)
 
     def start_refresh(self):
@@ -121,8 +327,8 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
                 next_refresh = min(next_refresh, u._last_send)
 
             diff = monotonic() - next_refresh
-            if diff < self._refresh_every:
-                await sleep(diff)
+            if diff < self._refresh_every - TIMER_TOLERANCE:
+                await sleep(self._refresh_every - diff)
                 continue
 
             for u in self._universes:
@@ -168,7 +374,7 @@ class BaseNode(Generic[TYPE_U], OutputCorrection):
     def __await__(self):
         while self._process_jobs:
             for job in self._process_jobs:
-                yield from job.channel.__await__()
+                yield from job.event.wait().__await__()
 
     def __getitem__(self, nr: int) -> TYPE_U:
         return self.get_universe(nr)
@@ -0,0 +1,109 @@
+import logging
+from asyncio import BaseTransport, DatagramProtocol, DatagramTransport, Event, get_running_loop
+from typing import Any, Callable, cast, Dict, Final, Optional, Tuple
+
+log = logging.getLogger('pyartnet.Receiver')
+
+
+class BaseReceiver(DatagramProtocol):
+    """Receives DMX frames. The frames are copied into a preallocated buffer for every universe.
+    Received frames can be processed through the callback or by iterating asynchronously over the receiver
+    (``async for universe, data in receiver``).
+    The passed data is a view into the universe buffer and will change when the next frame for the universe arrives.
+
+    :param callback: function which will be called with the universe number and the data for every received frame
+    """
+
+    def __init__(self, callback: Optional[Callable[[int, memoryview], Any]] = None):
+        super().__init__()
+        self._callback: Final = callback
+        self._transport: Optional[DatagramTransport] = None
+
+        # universe -> buffer, view with the size of the last frame
+        self._buffers: Dict[int, Tuple[bytearray, memoryview]] = {}
+
+        # universes with new frames for the async iterator
+        self._pending: Dict[int, None] = {}
+        # created in the running loop, on Python < 3.10 the event is bound to the loop when it's created
+        self._pending_event: Optional[Event] = None
+
+    async def listen(self, host: str, port: int):
+        """Start receiving
+
+        :param host: local address, e.g. ``0.0.0.0``
+        :param port: local port
+        """
+        if self._transport is not None:
+            raise ValueError('Receiver is already listening!')
+        await get_running_loop().create_datagram_endpoint(lambda: self, local_addr=(host, port))
+
+    def close(self):
+        """Stop receiving"""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def connection_made(self, transport: BaseTransport):
+        self._transport = cast(DatagramTransport, transport)
+        if self._pending_event is None:
+            self._pending_event = Event()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._transport = None
+
+    def error_received(self, exc: Exception):
+        log.error(f'Error in {self.__class__.__name__:s}: {exc}')
+
+    def _parse(self, data: memoryview) -> Optional[Tuple[int, memoryview]]:
+        """Return universe and universe data of a valid packet or None"""
+        raise NotImplementedError()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        ret = self._parse(memoryview(data))
+        if ret is None:
+            return None
+        universe, values = ret
+
+        size = len(values)
+        if size > 512:
+            return None
+
+        buffers = self._buffers.get(universe)
+        if buffers is None or len(buffers[1]) != size:
+            buf = bytearray(512) if buffers is None else buffers[0]
+            self._buffers[universe] = buffers = buf, memoryview(buf)[:size]
+
+        view = buffers[1]
+        view[:] = values
+
+        self._pending[universe] = None
+        if self._pending_event is not None:
+            self._pending_event.set()
+
+        if self._callback is not None:
+            self._callback(universe, view)
+
+    def get_data(self, universe: int) -> Optional[memoryview]:
+        """Return the data of the last received frame of a universe
+
+        :param universe: universe number
+        :return: View into the universe buffer or None if nothing was received yet
+        """
+        buffers = self._buffers.get(universe)
+        return buffers[1] if buffers is not None else None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Tuple[int, memoryview]:
+        while not self._pending:
+            event = self._pending_event
+            if event is None:
+                self._pending_event = event = Event()
+            event.clear()
+            await event.wait()
+
+        # oldest universe with new data, multiple frames of the same universe are coalesced
+        universe = next(iter(self._pending))
+        del self._pending[universe]
+        return universe, self._buffers[universe][1]
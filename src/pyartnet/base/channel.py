@@ -1,9 +1,11 @@
 import logging
 import warnings
 from array import array
+from collections import deque
 from logging import DEBUG as LVL_DEBUG
 from math import ceil
-from typing import Any, Callable, Collection, Final, List, Literal, Optional, Type, Union
+from sys import byteorder as sys_byteorder
+from typing import Any, Callable, Collection, Deque, Final, List, Literal, Optional, Tuple, Type, Union
 
 from pyartnet.errors import ChannelOutOfUniverseError, ChannelValueOutOfBoundsError, \
     ChannelWidthError, ValueCountDoesNotMatchChannelWidthError
@@ -11,7 +13,7 @@ from pyartnet.output_correction import linear
 
 from ..fades import FadeBase, LinearFade
 from .channel_fade import ChannelBoundFade
-from .output_correction import OutputCorrection
+from .output_correction import get_correction_lut, OutputCorrection
 from .universe import BaseUniverse
 
 log = logging.getLogger('pyartnet.Channel')
@@ -24,6 +26,9 @@ ARRAY_TYPE: Final = {
     4: 'L'   # unsigned long : min size 4 bytes
 }
 
+# formats of integer buffers which can be copied directly into the channel values
+BUFFER_INT_FORMATS: Final = frozenset('bBhHiIlLqQ')
+
 
 class Channel(OutputCorrection):
     def __init__(self, universe: BaseUniverse,
@@ -70,9 +75,14 @@ class Channel(OutputCorrection):
         self._parent_node: Final = universe._node
 
         self._correction_current: Callable[[float, int], float] = linear
+        self._correction_lut: Union[bytes, List[int], None] = None
+
+        # intensity channels are scaled by the master dimmers
+        self._intensity: bool = False
 
         # Fade
         self._current_fade: Optional[ChannelBoundFade] = None
+        self._fade_queue: Deque[Tuple[Collection[Union[int, FadeBase]], int, Type[FadeBase]]] = deque()
 
         # ---------------------------------------------------------------------
         # Values that can be set by the user
@@ -83,6 +93,7 @@ class Channel(OutputCorrection):
     def _apply_output_correction(self):
         # default correction is linear
         self._correction_current = linear
+        self._correction_lut = None
 
         # inherit correction if it is not set first from universe and then from the node
         for obj in (self, self._parent_universe, self._parent_node):
@@ -90,6 +101,15 @@ class Channel(OutputCorrection):
                 self._correction_current = obj._correction_output
                 return None
 
+    def set_intensity(self, intensity: bool = True):
+        """Mark the channel as intensity channel, so it is scaled by the master of the universe and the node
+
+        :param intensity: True if the channel is an intensity channel
+        """
+        self._intensity = intensity
+        self._parent_universe._update_intensity()
+        return self
+
     def get_values(self) -> List[int]:
         """Get the current (uncorrected) channel values
 
@@ -98,7 +118,8 @@ class Channel(OutputCorrection):
         return self._values_raw.tolist()
 
     def set_values(self, values: Collection[Union[int, float]]):
-        """Set values for a channel without a fade
+        """Set values for a channel without a fade.
+        Integer buffers (e.g. ``array.array``, ``memoryview`` or numpy arrays) are validated and copied in bulk.
 
         :param values: Iterable of values with the same size as the channel width
         """
@@ -107,6 +128,16 @@ class Channel(OutputCorrection):
             raise ValueCountDoesNotMatchChannelWidthError(
                 f'Not enough fade values specified, expected {self._width} but got {len(values)}!')
 
+        # fast path for integer buffers
+        if not isinstance(values, (list, tuple)):
+            try:
+                buf = memoryview(values)  # type: ignore[arg-type]
+            except TypeError:
+                pass
+            else:
+                if buf.ndim == 1 and buf.format in BUFFER_INT_FORMATS:
+                    return self._set_values_buffer(buf)
+
         correction = self._correction_current
         value_max = self._value_max
 
@@ -126,12 +157,56 @@ class Channel(OutputCorrection):
             self._parent_universe.channel_changed(self)
         return self
 
+    def _set_values_buffer(self, buf: memoryview):
+        value_max = self._value_max
+        byte_size = self._byte_size
+
+        # unsigned values which are not wider than the channel are always in range
+        if buf.format.islower() or buf.itemsize > byte_size:
+            for val in (min(buf), max(buf)):
+                if not 0 <= val <= value_max:
+                    raise ChannelValueOutOfBoundsError(f'Channel value out of bounds! 0 <= {val} <= {value_max:d}')
+
+        type_code = self._values_raw.typecode
+        raw_new = array(type_code, buf.tobytes()) if buf.format == type_code else array(type_code, buf)
+
+        correction = self._correction_current
+        if correction is linear:
+            act_new = raw_new[:]
+        elif byte_size <= 2:
+            lut = self._correction_lut
+            if lut is None:
+                lut = self._correction_lut = get_correction_lut(correction, value_max)
+            if isinstance(lut, bytes):
+                act_new = array(type_code, raw_new.tobytes().translate(lut))
+            else:
+                act_new = array(type_code, map(lut.__getitem__, raw_new))
+        else:
+            act_new = array(type_code, [round(correction(val, value_max)) for val in raw_new])
+
+        changed = act_new != self._values_act
+        self._values_raw = raw_new
+        self._values_act = act_new
+
+        if changed:
+            self._parent_universe.channel_changed(self)
+        return self
+
     def to_buffer(self, buf: bytearray):
+        return self._to_buffer(self._values_act, buf)
+
+    def _to_buffer(self, values: 'array[int]', buf: bytearray):
         byte_order = self._byte_order
         byte_size = self._byte_size
 
         start = self._buf_start
-        for value in self._values_act:
+
+        # the array can be copied directly if the item size matches and the byte order is native
+        if values.itemsize == byte_size and (byte_size == 1 or byte_order == sys_byteorder):
+            buf[start: start + self._width * byte_size] = values
+            return self
+
+        for value in values:
             buf[start: start + byte_size] = value.to_bytes(byte_size, byte_order, signed=False)
             start += byte_size
         return self
@@ -156,10 +231,38 @@ class Channel(OutputCorrection):
             raise ValueCountDoesNotMatchChannelWidthError(
                 f'Not enough fade values specified, expected {self._width} but got {len(values)}!')
 
+        self._fade_queue.clear()
         if self._current_fade is not None:
             self._current_fade.cancel()
             self._current_fade = None
 
+        return self._start_fade(values, duration_ms, fade_class)
+
+    def queue_fade(self, values: Collection[Union[int, FadeBase]], duration_ms: int,
+                   fade_class: Type[FadeBase] = LinearFade):
+        """Add a fade which starts directly after the current and all previously queued fades are complete.
+        If there is no running fade it will be started immediately.
+
+        :param values: Target values for the fade
+        :param duration_ms: Duration for the fade in ms
+        :param fade_class: What kind of fade
+        """
+        if self._current_fade is None:
+            return self.set_fade(values, duration_ms, fade_class)
+
+        if len(values) != self._width:
+            raise ValueCountDoesNotMatchChannelWidthError(
+                f'Not enough fade values specified, expected {self._width} but got {len(values)}!')
+        for target in values:
+            if not isinstance(target, FadeBase) and not 0 <= target <= self._value_max:
+                raise ChannelValueOutOfBoundsError(
+                    f'Target value out of bounds! 0 <= {target} <= {self._value_max}')
+
+        self._fade_queue.append((values, duration_ms, fade_class))
+        return self
+
+    # noinspection PyProtectedMember
+    def _start_fade(self, values: Collection[Union[int, FadeBase]], duration_ms: int, fade_class: Type[FadeBase]):
         # calculate how much steps we will be having
         step_time_ms = int(self._parent_node._process_every * 1000)
         duration_ms = max(duration_ms, step_time_ms)
@@ -195,7 +298,10 @@ class Channel(OutputCorrection):
     def __await__(self):
         if self._current_fade is None:
             return False
-        yield from self._current_fade.event.wait().__await__()
+
+        # queued fades are started when the previous fade is complete
+        while self._current_fade is not None:
+            yield from self._current_fade.event.wait().__await__()
         return True
 
     def __repr__(self):
@@ -1,6 +1,7 @@
 import logging
-from asyncio import Event
-from typing import Final, Iterable, List, Tuple, TYPE_CHECKING
+from typing import Iterable, List, Tuple, TYPE_CHECKING
+
+from .process_job import ProcessJob
 
 if TYPE_CHECKING:
     import pyartnet
@@ -10,7 +11,7 @@ log = logging.getLogger('pyartnet.DmxChannel')
 
 
 # noinspection PyProtectedMember
-class ChannelBoundFade:
+class ChannelBoundFade(ProcessJob):
     def __init__(self, channel: 'pyartnet.base.Channel', fades: Iterable['pyartnet.fades.FadeBase']):
         super().__init__()
         self.channel: 'pyartnet.base.Channel' = channel
@@ -18,9 +19,6 @@ class ChannelBoundFade:
         self.fades: Tuple['pyartnet.fades.FadeBase', ...] = tuple(fades)
         self.values: List[float] = [0 for _ in fades]
 
-        self.is_done = False
-        self.event: Final = Event()
-
     def process(self):
         finished = True
         for i, fade in enumerate(self.fades):
@@ -52,9 +50,13 @@ class ChannelBoundFade:
         self.channel = None  # type: ignore[assignment]
         c._current_fade = None
 
+        # start the next queued fade directly, so it is processed in the next frame
+        if c._fade_queue:
+            c._start_fade(*c._fade_queue.popleft())
+
         self.event.set()
 
-        if c.callback_fade_finished is not None:
+        if c._current_fade is None and c.callback_fade_finished is not None:
             c.callback_fade_finished(c)
 
     def __repr__(self):
@@ -0,0 +1,18 @@
+from asyncio import get_running_loop
+from time import monotonic as _monotonic
+from typing import Final
+
+# timers of the event loop can fire slightly early (e.g. because of the float resolution),
+# so a deadline is considered as reached when it's closer than this
+TIMER_TOLERANCE: Final = 0.001
+
+
+def monotonic() -> float:
+    """Current time in seconds. Inside a running event loop the time of the loop is used,
+    so all time calculations follow the clock of the loop (e.g. the virtual time of
+    :class:`~pyartnet.virtual_time.VirtualTimeEventLoop`).
+    The default event loop uses :func:`time.monotonic` so this is the same as the system time."""
+    try:
+        return get_running_loop().time()
+    except RuntimeError:
+        return _monotonic()
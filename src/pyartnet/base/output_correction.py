@@ -1,4 +1,5 @@
-from typing import Callable, Optional
+from functools import lru_cache
+from typing import Callable, List, Optional, Union
 
 
 class OutputCorrection:
@@ -17,3 +18,35 @@ class OutputCorrection:
 
     def _apply_output_correction(self) -> None:
         raise NotImplementedError()
+
+
+@lru_cache(maxsize=32)
+def get_correction_lut(func: Callable[[float, int], float], max_val: int) -> Union[bytes, List[int]]:
+    """Lookup table with the corrected output value for every possible input value.
+
+    :param func: output correction function
+    :param max_val: max value of the channel (0xFF or 0xFFFF)
+    :return: bytes for 8bit values (usable with ``bytes.translate``) else a list
+    """
+    assert max_val <= 0xFFFF, max_val
+    lut = [round(func(i, max_val)) for i in range(max_val + 1)]
+    return bytes(lut) if max_val <= 0xFF else lut
+
+
+def get_correction_table(func: Callable[[float, int], float]) -> bytes:
+    """Lookup table with the corrected output value for every 8bit value (usable with ``bytes.translate``)
+
+    :param func: output correction function
+    """
+    lut = get_correction_lut(func, 0xFF)
+    assert isinstance(lut, bytes)
+    return lut
+
+
+@lru_cache(maxsize=32)
+def get_master_lut(master: float) -> bytes:
+    """Lookup table which scales 8bit values with the master (usable with ``bytes.translate``)
+
+    :param master: master value (0..1)
+    """
+    return bytes(round(i * master) for i in range(256))
@@ -0,0 +1,17 @@
+from asyncio import Event
+from typing import Final
+
+
+class ProcessJob:
+    """Job which is processed by the node every frame"""
+
+    def __init__(self):
+        super().__init__()
+        self.is_done = False
+        self.event: Final = Event()
+
+    def process(self):
+        raise NotImplementedError()
+
+    def fade_complete(self):
+        raise NotImplementedError()
@@ -0,0 +1,62 @@
+import logging
+import socket
+from asyncio import get_running_loop
+from typing import Dict, Final, Tuple, Union
+
+log = logging.getLogger('pyartnet.SocketOutput')
+
+
+class SocketOutput:
+    """Sends the packets through a non-blocking socket.
+    If the socket buffer is full at most one pending packet per universe is kept, a newer packet replaces the
+    pending one. The pending packets are sent as soon as the socket is writable again.
+    """
+
+    def __init__(self, sock: socket.socket, dst: Tuple[str, int]):
+        self._socket: Final = sock
+        self._dst: Final = dst
+
+        self._pending: Dict[int, bytes] = {}
+        self._writer_active = False
+
+        # frames which were replaced by a newer frame before they could be sent
+        self._dropped: int = 0
+
+    def send(self, packet: Union[bytearray, bytes], universe: int) -> int:
+        # keep the order if there are already pending packets
+        if self._pending:
+            self._queue(packet, universe)
+            return 0
+
+        try:
+            return self._socket.sendto(packet, self._dst)
+        except BlockingIOError:
+            self._queue(packet, universe)
+            return 0
+
+    def _queue(self, packet: Union[bytearray, bytes], universe: int):
+        if universe in self._pending:
+            self._dropped += 1
+        self._pending[universe] = bytes(packet)
+
+        if not self._writer_active:
+            get_running_loop().add_writer(self._socket, self._flush)
+            self._writer_active = True
+            log.debug(f'Socket buffer full, {len(self._pending):d} frame(s) pending')
+
+    def _flush(self):
+        pending = self._pending
+        while pending:
+            universe = next(iter(pending))
+            try:
+                self._socket.sendto(pending[universe], self._dst)
+            except BlockingIOError:
+                return None
+            del pending[universe]
+
+        self.close()
+
+    def close(self):
+        if self._writer_active:
+            get_running_loop().remove_writer(self._socket)
+            self._writer_active = False
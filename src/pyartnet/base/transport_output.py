@@ -0,0 +1,66 @@
+import logging
+from asyncio import BaseTransport, DatagramProtocol, DatagramTransport
+from typing import cast, Dict, Final, Optional, Tuple, Union
+
+log = logging.getLogger('pyartnet.TransportOutput')
+
+
+class DatagramTransportOutput(DatagramProtocol):
+    """Sends the packets through an asyncio datagram transport, so the event loop (e.g. uvloop)
+    does the buffering and error reporting. While the transport buffer is full
+    at most one pending packet per universe is kept, a newer packet replaces the pending one.
+    """
+
+    def __init__(self, dst: Tuple[str, int]):
+        super().__init__()
+        self._dst: Final = dst
+        self._transport: Optional[DatagramTransport] = None
+
+        self._pending: Dict[int, bytes] = {}
+        self._paused = False
+        self._closed = False
+
+        # frames which were replaced by a newer frame before they could be sent
+        self._dropped: int = 0
+
+    def send(self, packet: Union[bytearray, bytes], universe: int) -> int:
+        if self._paused or self._closed or self._transport is None:
+            if universe in self._pending:
+                self._dropped += 1
+            self._pending[universe] = bytes(packet)
+            return 0
+
+        self._transport.sendto(packet, self._dst)
+        return len(packet)
+
+    def connection_made(self, transport: BaseTransport):
+        self._transport = cast(DatagramTransport, transport)
+        if self._closed:
+            transport.close()
+            return None
+        self._flush()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._transport = None
+
+    def error_received(self, exc: Exception):
+        log.error(f'Error while sending to {self._dst[0]:s}:{self._dst[1]:d}: {exc}')
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        self._flush()
+
+    def _flush(self):
+        pending = self._pending
+        while pending and not self._paused and not self._closed and self._transport is not None:
+            universe = next(iter(pending))
+            self._transport.sendto(pending.pop(universe), self._dst)
+
+    def close(self):
+        # the pending packets are kept so they can be moved to another output
+        self._closed = True
+        if self._transport is not None:
+            self._transport.close()
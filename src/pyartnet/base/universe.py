@@ -1,12 +1,13 @@
 import logging
-from time import monotonic
-from typing import Dict, Final, Literal
+from asyncio import get_running_loop
+from typing import Any, Dict, Final, Iterable, List, Literal, Optional, Tuple
 
 import pyartnet
-from pyartnet.errors import ChannelExistsError, ChannelNotFoundError, \
-    InvalidUniverseAddressError, OverlappingChannelError
+from pyartnet.errors import BufferOutOfUniverseError, ChannelExistsError, \
+    ChannelNotFoundError, InvalidUniverseAddressError, OverlappingChannelError
 
-from .output_correction import OutputCorrection
+from .clock import monotonic
+from .output_correction import get_master_lut, OutputCorrection
 
 log = logging.getLogger('pyartnet.Universe')
 
@@ -16,7 +17,8 @@ class BaseUniverse(OutputCorrection):
     def __init__(self, node: 'pyartnet.base.BaseNode', universe: int = 0):
         super().__init__()
 
-        if not 0 <= universe <= 32767:
+        # the range of the protocol is checked by the node
+        if not 0 <= universe <= 65535:
             raise InvalidUniverseAddressError()
 
         self._node: Final = node
@@ -24,11 +26,39 @@ class BaseUniverse(OutputCorrection):
 
         self._data: bytearray = bytearray()
         self._data_size: int = 0
+        self._data_size_min: int = 0   # minimum size requested through raw buffer writes
         self._data_changed = True
         self._last_send: float = 0
 
+        # rate limit: minimum time between two frames
+        self._priority: int = 0
+        self._max_fps_every: float = 0
+        self._throttle: int = 1         # set by the adaptive frame rate of the node
+        self._send_every: float = 0
+
+        # immediate send: token bucket which limits the frames
+        self._send_scheduled: bool = False
+        self._tokens: float = 0
+        self._tokens_time: float = 0
+
         self._channels: Dict[str, 'pyartnet.base.Channel'] = {}
 
+        # master dimmer which is applied to the intensity channels when the universe is sent
+        self._master: float = 1
+        self._master_value: float = 1   # combined with the master of the node
+        self._master_lut: Optional[bytes] = None
+        self._master_bypass: bool = False    # e.g. during the playback of a recording
+        self._intensity_ranges: Tuple[Tuple[int, int, int, Literal['big', 'little']], ...] = ()
+        self._data_out: Final = bytearray()
+
+        # complete packet of the protocol, only the sequence and the data are changed when it is sent
+        self._packet: bytearray = bytearray()
+        self._build_packet()
+
+    def _build_packet(self):
+        """Build the packet template for the current size of the universe"""
+        pass
+
     def _apply_output_correction(self):
         for c in self._channels.values():
             c._apply_output_correction()
@@ -36,19 +66,176 @@ class BaseUniverse(OutputCorrection):
     def channel_changed(self, channel: 'pyartnet.base.Channel'):
         # update universe buffer
         channel.to_buffer(self._data)
+        self._mark_changed()
 
+    def _mark_changed(self):
         # signal that this universe has changed
         self._data_changed = True
 
+        node = self._node
+        if node._immediate_send and not self._send_scheduled:
+            # all changes in this loop iteration are sent together
+            self._send_scheduled = True
+            get_running_loop().call_soon(self._send_immediate)
+
         # start fade/refresh task if necessary
-        # noinspection PyProtectedMember
-        self._node._process_task.start()
+        node._process_task.start()
+
+    def _send_immediate(self):
+        self._send_scheduled = False
+        # if there are no tokens left the changes will be sent by the frame loop of the node
+        if self._data_changed and self._can_send(monotonic()):
+            self.send_data()
+
+    def _can_send(self, now: float) -> bool:
+        if self._send_every and now - self._last_send < self._send_every:
+            return False
+
+        node = self._node
+        if not node._immediate_send:
+            return True
+
+        # token bucket
+        tokens = min(node._immediate_burst, self._tokens + (now - self._tokens_time) * node._immediate_fps)
+        self._tokens_time = now
+        if tokens < 1:
+            self._tokens = tokens
+            return False
+        self._tokens = tokens - 1
+        return True
+
+    def write_buffer(self, start: int, data: Any):
+        """Write raw bytes directly into the universe buffer with a single slice copy.
+        The bytes are sent as they are: channel values and output correction are bypassed for the written range.
+        The universe will be resized if the data does not fit.
+
+        :param start: start position in the universe (1..512)
+        :param data: bytes-like object or any other object that supports the buffer protocol (e.g. a numpy array)
+        """
+        buf = memoryview(data).cast('B')
+
+        buf_start = start - 1
+        buf_stop = buf_start + len(buf)
+        if buf_start < 0 or buf_stop > 512:
+            raise BufferOutOfUniverseError(
+                f'Buffer out of universe (1..512): start: {start} length: {len(buf)} -> {buf_stop}')
+
+        if buf_stop > self._data_size:
+            self._reserve_data(buf_stop)
+        elif self._data[buf_start: buf_stop] == buf:
+            return None
+
+        self._data[buf_start: buf_stop] = buf
+        self._mark_changed()
+
+    def set_max_fps(self, max_fps: Optional[float]):
+        """Limit the rate with which changes of this universe are sent.
+        Changes are not lost, they are sent with the next allowed frame.
+
+        :param max_fps: maximum frames per second or ``None`` to send with the rate of the node
+        """
+        if max_fps is not None and max_fps <= 0:
+            raise ValueError('max_fps must be > 0!')
+        self._max_fps_every = 0 if max_fps is None else 1 / max_fps
+        self._update_send_every()
+        return self
+
+    def set_priority(self, priority: int):
+        """Set the priority of the universe for the adaptive frame rate of the node.
+        Universes with a low priority are slowed down first.
+
+        :param priority: priority, higher is more important
+        """
+        self._priority = priority
+        return self
+
+    @property
+    def output_fps(self) -> float:
+        """Current maximum frames per second of this universe,
+        considering the rate of the node, the rate limit and the adaptive frame rate"""
+        process_every = self._node._process_every
+        return 1 / max(process_every * self._throttle, self._max_fps_every)
+
+    def _set_throttle(self, throttle: int):
+        self._throttle = throttle
+        self._update_send_every()
+
+    def _update_send_every(self):
+        # the throttle is a multiple of the frame loop, allow half a frame jitter so it sends on every n-th tick
+        throttle_every = 0 if self._throttle <= 1 else self._node._process_every * (self._throttle - 0.5)
+        self._send_every = max(self._max_fps_every, throttle_every)
+
+    @property
+    def master(self) -> float:
+        """Master dimmer of the universe"""
+        return self._master
+
+    def set_master(self, master: float):
+        """Set the master dimmer of the universe. The master is applied to all channels which are marked as
+        intensity channels (see :meth:`Channel.set_intensity`) when the universe is sent and is combined
+        with the master of the node. The channel values are not changed.
+
+        :param master: master value (0..1)
+        """
+        if not 0 <= master <= 1:
+            raise ValueError('Master must be between 0 and 1!')
+        self._master = master
+        self._update_master()
+        return self
+
+    def _update_intensity(self):
+        ranges: List[Tuple[int, int, int, Literal['big', 'little']]] = []
+        for c in sorted(self._channels.values(), key=lambda x: x._start):
+            if not c._intensity:
+                continue
+            start = c._buf_start
+            stop = c._stop
+            # merge consecutive 8bit channels so they can be translated in one operation
+            if ranges and c._byte_size == 1 and ranges[-1][2] == 1 and ranges[-1][1] == start:
+                start = ranges.pop()[0]
+            ranges.append((start, stop, c._byte_size, c._byte_order))
+
+        self._intensity_ranges = tuple(ranges)
+        self._update_master()
+
+    def _update_master(self):
+        master = self._master * self._node._master
+        self._master_value = master
+
+        lut = None if master >= 1 or not self._intensity_ranges else get_master_lut(master)
+        if lut is None and self._master_lut is None:
+            return None
+        self._master_lut = lut
+        self._mark_changed()
+
+    def _apply_master(self) -> bytearray:
+        out = self._data_out
+        out[:] = self._data
+
+        lut = self._master_lut
+        assert lut is not None
+        master = self._master_value
+
+        for start, stop, byte_size, byte_order in self._intensity_ranges:
+            if byte_size == 1:
+                out[start: stop] = out[start: stop].translate(lut)
+                continue
+            for pos in range(start, stop, byte_size):
+                value = int.from_bytes(out[pos: pos + byte_size], byte_order)
+                out[pos: pos + byte_size] = round(value * master).to_bytes(byte_size, byte_order)
+        return out
 
     def send_data(self):
-        self._node._send_universe(self._universe, self._data_size, self._data, self)
+        data = self._data if self._master_lut is None or self._master_bypass else self._apply_master()
+
+        node = self._node
+        node._send_universe(self._universe, self._data_size, data, self)
         self._last_send = monotonic()
         self._data_changed = False
 
+        if node._record_frame is not None:
+            node._record_frame(self._universe, data)
+
     def get_channel(self, channel_name: str) -> 'pyartnet.base.Channel':
         """Return a channel by name or raise an exception
 
@@ -103,9 +290,30 @@ class BaseUniverse(OutputCorrection):
         chan._apply_output_correction()
         return chan
 
+    def _add_channels(self, channels: Iterable[Tuple[str, int, int, int, Literal['big', 'little']]]) \
+            -> List['pyartnet.base.Channel']:
+        """Bulk add already validated channels (name, start, width, byte size, byte order).
+        Overlaps are not checked and the universe is resized only once."""
+        created = []
+        for name, start, width, byte_size, byte_order in channels:
+            if name in self._channels:
+                raise ChannelExistsError(f'Channel "{name}" does already exist in the universe!')
+            self._channels[name] = chan = pyartnet.base.Channel(
+                self, start, width, byte_size=byte_size, byte_order=byte_order)
+            chan._apply_output_correction()
+            created.append(chan)
+
+        self._resize_universe(0)
+        return created
+
+    def _reserve_data(self, min_size: int):
+        # raw writes have no channels, so the size has to be kept when the universe gets resized
+        self._data_size_min = max(self._data_size_min, min_size)
+        self._resize_universe(min_size)
+
     def _resize_universe(self, min_size: int):
 
-        new_size = max(min_size, 2)
+        new_size = max(min_size, 2, self._data_size_min)
         for c in self._channels.values():
             new_size = max(new_size, c._stop)
         if new_size % 2:
@@ -117,12 +325,12 @@ class BaseUniverse(OutputCorrection):
 
         self._data_size = new_size
         if diff < 0:
-            for _ in range(- diff):
-                self._data.pop()
+            del self._data[new_size:]
         else:
-            for _ in range(diff):
-                # pad universe data with 0 is it's off
-                self._data.append(0)
+            # pad universe data with 0 is it's off
+            self._data.extend(bytes(diff))
+
+        self._build_packet()
 
     # -----------------------------------------------------------
     # emulate container
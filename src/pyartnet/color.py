@@ -0,0 +1,245 @@
+from functools import lru_cache
+from itertools import repeat
+from math import cos, log, pi
+from operator import add, itemgetter, mod, mul, sub
+from typing import Final, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pyartnet
+from pyartnet.errors import ChannelWidthError
+
+# resolution of the hue lookup tables (6 * 256 -> one step per 8bit value on every edge of the color wheel)
+HUE_STEPS: Final = 1536
+
+TYPE_COLUMN = Union[float, Sequence[float]]
+
+
+def _build_hsv_lut() -> Tuple[List[float], List[float], List[float]]:
+    # 1 - channel value of the fully saturated color for every hue
+    luts: Tuple[List[float], List[float], List[float]] = ([], [], [])
+    for i in range(HUE_STEPS):
+        h = i / HUE_STEPS * 6
+        for lut, offset in zip(luts, (0, 4, 2)):
+            # distance on the hexcone: 0 -> full, >= 2 -> off
+            k = (h + offset) % 6
+            lut.append(1 - max(0.0, min(1.0, abs(k - 3) - 1)))
+    return luts
+
+
+def _build_hsi_lut() -> Tuple[List[float], List[float], List[float]]:
+    # factor k of every channel: value = intensity * (1 + saturation * k)
+    luts: Tuple[List[float], List[float], List[float]] = ([], [], [])
+    for i in range(HUE_STEPS):
+        h = i / HUE_STEPS * 2 * pi
+        sector = int(h // (2 * pi / 3)) % 3
+        h -= sector * 2 * pi / 3
+
+        k_max = cos(h) / cos(pi / 3 - h)
+        k = [0.0, 0.0, 0.0]
+        k[sector] = k_max
+        k[(sector + 1) % 3] = 1 - k_max
+        k[(sector + 2) % 3] = -1
+        for lut, val in zip(luts, k):
+            lut.append(val)
+    return luts
+
+
+HSV_LUT: Final = _build_hsv_lut()
+HSI_LUT: Final = _build_hsi_lut()
+
+
+@lru_cache(maxsize=256)
+def cct_to_rgb(kelvin: int) -> Tuple[float, float, float]:
+    """Color of a black body radiator (approximation from Tanner Helland), normalized to 0..1
+
+    :param kelvin: color temperature in K (1000..40000)
+    """
+    temp = kelvin / 100
+    if temp <= 66:
+        r = 255.0
+        g = 99.4708025861 * log(temp) - 161.1195681661
+        b = 0.0 if temp <= 19 else 138.5177312231 * log(temp - 10) - 305.0447927307
+    else:
+        r = 329.698727446 * (temp - 60) ** -0.1332047592
+        g = 288.1221695283 * (temp - 60) ** -0.0755148492
+        b = 255.0
+    return tuple(max(0.0, min(255.0, c)) / 255 for c in (r, g, b))   # type: ignore[return-value]
+
+
+# noinspection PyProtectedMember
+class ColorStage:
+    """Converts colors for many RGB, RGBW, RGBA or RGBWA fixtures at once and writes the result to the channels.
+    The colors are processed as columns (one sequence per component for all fixtures), so every step of the conversion
+    runs over all fixtures at once. Every value can also be a single number which is used for all fixtures.
+
+    The white (and amber) part is extracted from the RGB color and a calibration matrix and a white balance
+    can be set for every fixture.
+
+    :param layout: order of the components of a fixture, e.g. ``RGB``, ``RGBW``, ``WRGB``, ``RGBA`` or ``RGBWA``
+    :param channels: 8bit channels, every ``len(layout)`` values of a channel are one fixture
+    """
+
+    def __init__(self, layout: str, *channels: 'pyartnet.base.Channel'):
+        layout = layout.upper()
+        if not set('RGB') <= set(layout) <= set('RGBWA') or len(set(layout)) != len(layout):
+            raise ValueError(f'Invalid layout: {layout}')
+
+        width = len(layout)
+        for c in channels:
+            if c._byte_size != 1 or c._width % width:
+                raise ChannelWidthError(f'Channel must be 8bit and the width must be a multiple of {width:d}!')
+
+        self._layout: Final = layout
+        self._channels: Final = channels
+        self._count: Final = sum(c._width for c in channels) // width
+
+        # calibration as columns: matrix coefficients and gain of every component
+        self._matrix: Optional[List[List[float]]] = None
+        self._gains: Optional[List[List[float]]] = None
+
+    def __len__(self):
+        return self._count
+
+    def _column(self, value: TYPE_COLUMN, scale: float = 1) -> List[float]:
+        if isinstance(value, (int, float)):
+            return [value * scale] * self._count
+        ret = list(value) if scale == 1 else list(map(mul, value, repeat(scale)))
+        if len(ret) != self._count:
+            raise ValueError(f'Expected {self._count:d} values but got {len(ret):d}!')
+        return ret
+
+    def set_matrix(self, fixture: int, matrix: Optional[Sequence[float]]):
+        """Set the calibration matrix of a fixture which is applied to the RGB color
+
+        :param fixture: index of the fixture
+        :param matrix: 3x3 matrix (row major) or None to reset the calibration
+        """
+        if matrix is None:
+            matrix = (1, 0, 0, 0, 1, 0, 0, 0, 1)
+        if len(matrix) != 9:
+            raise ValueError('Matrix must have 9 values!')
+
+        if self._matrix is None:
+            self._matrix = [[float(i in (0, 4, 8))] * self._count for i in range(9)]
+        for column, value in zip(self._matrix, matrix):
+            column[fixture] = value
+        return self
+
+    def set_white_balance(self, fixture: int, gains: Optional[Sequence[float]]):
+        """Set the white balance of a fixture. Every component of the output is multiplied with its gain.
+
+        :param fixture: index of the fixture
+        :param gains: gain for every component in the order of the layout or None to reset
+        """
+        width = len(self._layout)
+        if gains is None:
+            gains = (1, ) * width
+        if len(gains) != width:
+            raise ValueError(f'Expected {width:d} gains but got {len(gains):d}!')
+
+        if self._gains is None:
+            self._gains = [[1.0] * self._count for _ in range(width)]
+        for column, value in zip(self._gains, gains):
+            column[fixture] = value
+        return self
+
+    def set_rgb(self, r: TYPE_COLUMN, g: TYPE_COLUMN, b: TYPE_COLUMN):
+        """Set the color of the fixtures
+
+        :param r: red (0..1)
+        :param g: green (0..1)
+        :param b: blue (0..1)
+        """
+        return self._output(self._column(r, 255), self._column(g, 255), self._column(b, 255))
+
+    def set_hsv(self, h: TYPE_COLUMN, s: TYPE_COLUMN, v: TYPE_COLUMN):
+        """Set the color of the fixtures
+
+        :param h: hue (0..1)
+        :param s: saturation (0..1)
+        :param v: value (0..1)
+        """
+        v = self._column(v, 255)
+        vs = list(map(mul, v, self._column(s)))
+        hue = self._hue_index(h)
+        return self._output(*(
+            list(map(sub, v, map(mul, vs, map(lut.__getitem__, hue)))) for lut in HSV_LUT
+        ))
+
+    def set_hsi(self, h: TYPE_COLUMN, s: TYPE_COLUMN, i: TYPE_COLUMN):
+        """Set the color of the fixtures. With hsi the sum of the RGB components is the same for every hue.
+
+        :param h: hue (0..1)
+        :param s: saturation (0..1)
+        :param i: intensity (0..1), mean of the RGB components
+        """
+        i = self._column(i, 255)
+        i_s = list(map(mul, i, self._column(s)))
+        hue = self._hue_index(h)
+        return self._output(*(
+            list(map(add, i, map(mul, i_s, map(lut.__getitem__, hue)))) for lut in HSI_LUT
+        ))
+
+    def set_cct(self, kelvin: TYPE_COLUMN, brightness: TYPE_COLUMN = 1):
+        """Set the color temperature of the fixtures
+
+        :param kelvin: color temperature in K (1000..40000)
+        :param brightness: brightness (0..1)
+        """
+        rgb = list(map(cct_to_rgb, map(round, self._column(kelvin), repeat(-1))))
+        brightness = self._column(brightness, 255)
+        return self._output(*(list(map(mul, brightness, map(itemgetter(i), rgb))) for i in range(3)))
+
+    def _hue_index(self, h: TYPE_COLUMN) -> List[int]:
+        return list(map(int, map(mul, map(mod, self._column(h), repeat(1.0)), repeat(HUE_STEPS))))
+
+    def _output(self, r: List[float], g: List[float], b: List[float]):
+        matrix = self._matrix
+        if matrix is not None:
+            r, g, b = (
+                list(map(add, map(add, map(mul, matrix[row], r), map(mul, matrix[row + 1], g)),
+                         map(mul, matrix[row + 2], b)))
+                for row in (0, 3, 6)
+            )
+        r, g, b = _clamp(r), _clamp(g), _clamp(b)
+        components = {}
+
+        # the white part is the same in all three colors
+        if 'W' in self._layout:
+            w = list(map(min, r, g, b))
+            r, g, b = (list(map(sub, c, w)) for c in (r, g, b))
+            components['W'] = w
+
+        # amber is red with half green
+        if 'A' in self._layout:
+            a = list(map(min, r, map(mul, g, repeat(2.0))))
+            r = list(map(sub, r, a))
+            g = list(map(sub, g, map(mul, a, repeat(0.5))))
+            components['A'] = a
+
+        components.update(R=r, G=g, B=b)
+        self._write(components[c] for c in self._layout)
+        return self
+
+    def _write(self, columns: Iterable[List[float]]):
+        width = len(self._layout)
+        gains = self._gains
+
+        out = bytearray(self._count * width)
+        for i, column in enumerate(columns):
+            if gains is not None:
+                column = _clamp(list(map(mul, column, gains[i])))
+            out[i::width] = bytes(map(round, column))
+
+        view = memoryview(out)
+        start = 0
+        for channel in self._channels:
+            stop = start + channel._width
+            channel.set_values(view[start: stop])
+            start = stop
+
+
+def _clamp(column: List[float]) -> List[float]:
+    # checking the range is much cheaper than clamping every value
+    if column and (min(column) < 0 or max(column) > 255):
+        return list(map(min, repeat(255.0), map(max, repeat(0.0), column)))
+    return column
@@ -0,0 +1,4 @@
+from .effect_base import EffectBase, EffectJob
+from .effect_chase import Chase
+from .effect_rainbow import Rainbow
+from .effect_sine import SineWave
@@ -0,0 +1,125 @@
+from array import array
+from typing import Final, Optional
+
+import pyartnet
+from pyartnet.base import ProcessJob
+from pyartnet.base.clock import monotonic
+from pyartnet.base.output_correction import get_correction_table
+from pyartnet.errors import BufferOutOfUniverseError, ChannelWidthError
+
+
+class EffectBase:
+    """Effects are spatially periodic patterns which move along the pixels.
+    One period of the pattern is calculated once, every frame is then only a slice of the repeated pattern.
+    The position moves in whole pixels, so slow effects move in steps.
+
+    :param size: length of one period of the pattern in pixels
+    :param speed: speed in pixels per second, negative values move the pattern backwards
+    :param components: values per pixel, e.g. 1 for dimmers or 3 for RGB
+    """
+
+    def __init__(self, size: int, speed: float, components: int = 1):
+        if size <= 0:
+            raise ValueError('Size must be > 0!')
+        if components <= 0:
+            raise ValueError('Components must be > 0!')
+
+        self.size: Final = size
+        self.speed: Final = speed
+        self.components: Final = components
+
+    def build_pattern(self) -> bytes:
+        """return the values for one period of the pattern (size * components bytes)"""
+        raise NotImplementedError()
+
+    def _create_job(self, pixels: int, universe: 'pyartnet.base.BaseUniverse', start: int,
+                    channel: Optional['pyartnet.base.Channel']) -> 'EffectJob':
+        pattern = self.build_pattern()
+        assert len(pattern) == self.size * self.components
+
+        # repeat the pattern, so every position can be taken with one slice
+        repeat = -(-pixels // self.size) + 1
+        job = EffectJob(self, pattern * repeat, universe, start, pixels * self.components, channel)
+
+        node = universe._node
+        node._process_jobs.append(job)
+        node._process_task.start()
+        return job
+
+    # noinspection PyProtectedMember
+    def start(self, universe: 'pyartnet.base.BaseUniverse', start: int, pixels: int) -> 'EffectJob':
+        """Run the effect on a range of the universe. The output correction of the universe or node is applied,
+        the values of channels in the range are bypassed.
+
+        :param universe: universe
+        :param start: start address in the universe
+        :param pixels: number of pixels
+        :return: the running effect
+        """
+        if pixels <= 0:
+            raise ValueError('Pixels must be > 0!')
+        stop = start - 1 + pixels * self.components
+        if start < 1 or stop > 512:
+            raise BufferOutOfUniverseError(
+                f'Buffer out of universe (1..512): start: {start} length: {pixels * self.components} -> {stop}')
+
+        job = self._create_job(pixels, universe, start, None)
+
+        # The output correction is applied once on the pattern
+        for obj in (universe, universe._node):
+            correction = obj._correction_output
+            if correction is not None:
+                job.pattern = job.pattern.translate(get_correction_table(correction))
+                break
+        return job
+
+    # noinspection PyProtectedMember
+    def start_channel(self, channel: 'pyartnet.base.Channel') -> 'EffectJob':
+        """Run the effect on a channel. The channel values are set every frame.
+
+        :param channel: 8bit channel with a width which is a multiple of the effect components
+        :return: the running effect
+        """
+        if channel._byte_size != 1 or channel._width % self.components:
+            raise ChannelWidthError(f'Channel must be 8bit and the width must be a multiple of {self.components:d}!')
+        return self._create_job(channel._width // self.components, channel._parent_universe, channel._start, channel)
+
+
+# noinspection PyProtectedMember
+class EffectJob(ProcessJob):
+    def __init__(self, effect: EffectBase, pattern: bytes, universe: 'pyartnet.base.BaseUniverse',
+                 start: int, length: int, channel: Optional['pyartnet.base.Channel']):
+        super().__init__()
+        self.effect: Final = effect
+        self.pattern: bytes = pattern
+        self.universe: Final = universe
+        self.start: Final = start
+        self.length: Final = length
+        self.channel: Final = channel
+
+        self._period_bytes: Final = effect.size * effect.components
+        self._start_time: Final = monotonic()
+
+    def process(self):
+        effect = self.effect
+        shift = int((monotonic() - self._start_time) * effect.speed) % effect.size
+        offset = self._period_bytes - shift * effect.components
+        values = self.pattern[offset: offset + self.length]
+
+        if self.channel is None:
+            self.universe.write_buffer(self.start, values)
+        else:
+            self.channel.set_values(array('B', values))
+
+    def stop(self):
+        """Stop the effect"""
+        jobs = self.universe._node._process_jobs
+        if self in jobs:
+            jobs.remove(self)
+        self.event.set()
+
+    def fade_complete(self):
+        self.event.set()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__:s} {self.effect.__class__.__name__:s} start={self.start:d}>'
@@ -0,0 +1,25 @@
+from .effect_base import EffectBase
+
+
+class Chase(EffectBase):
+    """Chase: a block of pixels which are on, followed by pixels which are off
+
+    :param size: length of one period in pixels
+    :param speed: speed in pixels per second
+    :param components: values per pixel
+    :param width: pixels which are on
+    :param value: value of the pixels which are on
+    """
+
+    def __init__(self, size: int, speed: float, components: int = 1, width: int = 1, value: int = 255):
+        super().__init__(size, speed, components)
+        if not 0 < width <= size:
+            raise ValueError('Width must be > 0 and <= size!')
+        if not 0 <= value <= 255:
+            raise ValueError('Value must be 0 <= value <= 255!')
+        self.width = width
+        self.value = value
+
+    def build_pattern(self) -> bytes:
+        on = bytes([self.value]) * (self.width * self.components)
+        return on + bytes((self.size - self.width) * self.components)
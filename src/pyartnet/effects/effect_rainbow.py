@@ -0,0 +1,23 @@
+from colorsys import hsv_to_rgb
+
+from .effect_base import EffectBase
+
+
+class Rainbow(EffectBase):
+    """Rainbow over RGB pixels
+
+    :param size: length of one rainbow in pixels
+    :param speed: speed in pixels per second
+    :param brightness: value of the colors
+    """
+
+    def __init__(self, size: int, speed: float, brightness: int = 255):
+        super().__init__(size, speed, 3)
+        if not 0 <= brightness <= 255:
+            raise ValueError('Brightness must be 0 <= brightness <= 255!')
+        self.brightness = brightness
+
+    def build_pattern(self) -> bytes:
+        return bytes(
+            round(c * self.brightness) for i in range(self.size) for c in hsv_to_rgb(i / self.size, 1, 1)
+        )
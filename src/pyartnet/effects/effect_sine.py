@@ -0,0 +1,28 @@
+from math import pi, sin
+
+from .effect_base import EffectBase
+
+
+class SineWave(EffectBase):
+    """Sine wave, all components of a pixel have the same value
+
+    :param size: length of one wave in pixels
+    :param speed: speed in pixels per second
+    :param components: values per pixel
+    :param min_value: min value of the wave
+    :param max_value: max value of the wave
+    """
+
+    def __init__(self, size: int, speed: float, components: int = 1, min_value: int = 0, max_value: int = 255):
+        super().__init__(size, speed, components)
+        if not 0 <= min_value <= max_value <= 255:
+            raise ValueError('Values must be 0 <= min_value <= max_value <= 255!')
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def build_pattern(self) -> bytes:
+        amplitude = (self.max_value - self.min_value) / 2
+        return bytes(
+            round(self.min_value + amplitude * (1 + sin(2 * pi * i / self.size)))
+            for i in range(self.size) for _ in range(self.components)
+        )
@@ -24,6 +24,10 @@ class UniverseNotFoundError(PyArtNetError):
     pass
 
 
+class BufferOutOfUniverseError(PyArtNetError):
+    pass
+
+
 # -----------------------------------------------------------------------------
 # Channel Errors
 # -----------------------------------------------------------------------------
@@ -53,3 +57,21 @@ class ChannelValueOutOfBoundsError(PyArtNetError):
 
 class ValueCountDoesNotMatchChannelWidthError(PyArtNetError):
     pass
+
+
+# -----------------------------------------------------------------------------
+# Recording Errors
+# -----------------------------------------------------------------------------
+class InvalidRecordingError(PyArtNetError):
+    pass
+
+
+# -----------------------------------------------------------------------------
+# Rig Errors
+# -----------------------------------------------------------------------------
+class InvalidRigError(PyArtNetError):
+    pass
+
+
+class NodeNotFoundError(PyArtNetError):
+    pass
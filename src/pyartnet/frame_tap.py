@@ -0,0 +1,127 @@
+from array import array
+from functools import partial
+from typing import Final, Iterator, List, NamedTuple, Optional, Union
+
+import pyartnet
+from pyartnet.base.clock import monotonic
+
+# largest packet of the implemented protocols: sACN header + 512 values
+MAX_PACKET_SIZE: Final = 638
+
+
+class TappedPacket(NamedTuple):
+    time: float
+    node: 'pyartnet.base.BaseNode'
+    universe: int
+    data: bytes
+
+    def format(self) -> str:
+        """Human-readable representation of the packet"""
+        # noinspection PyProtectedMember
+        return self.node._format_packet(self.data)
+
+    def __str__(self) -> str:
+        node = self.node
+        return f'{self.time:.3f} {node._ip}:{node._port} Universe {self.universe:d}: {self.format()}'
+
+
+# noinspection PyProtectedMember
+class FrameTap:
+    """Keeps the last packets which were sent by the nodes in a fixed size ring buffer.
+    Every packet is copied as it is together with a timestamp, formatting is only done when the packets are dumped,
+    so the tap can be used on a live system.
+
+    :param size: number of packets which are kept
+    """
+
+    def __init__(self, size: int = 1024):
+        if size < 1:
+            raise ValueError('Size must be >= 1!')
+
+        self._size: Final = size
+        self._buf: Final = bytearray(size * MAX_PACKET_SIZE)
+        self._times: Final = array('d', [0]) * size
+        self._lengths: Final = array('H', [0]) * size
+        self._universes: Final = array('l', [0]) * size
+        self._node_indices: Final = array('B', [0]) * size
+
+        self._pos: int = 0      # next slot
+        self._count: int = 0
+        self._nodes: List['pyartnet.base.BaseNode'] = []
+
+    def add_node(self, node: 'pyartnet.base.BaseNode'):
+        """Start capturing the packets of a node
+
+        :param node: node
+        """
+        if node._tap_packet is not None:
+            raise ValueError(f'Node {node._ip}:{node._port} is already tapped!')
+        if len(self._nodes) >= 256:
+            raise ValueError('Can not tap more than 256 nodes!')
+
+        node._tap_packet = partial(self._tap, len(self._nodes))
+        self._nodes.append(node)
+        return self
+
+    def _tap(self, node_index: int, universe: int, packet: Union[bytearray, bytes]):
+        pos = self._pos
+        size = min(len(packet), MAX_PACKET_SIZE)
+        start = pos * MAX_PACKET_SIZE
+        self._buf[start: start + size] = packet[:size] if size < len(packet) else packet
+
+        self._times[pos] = monotonic()
+        self._lengths[pos] = size
+        self._universes[pos] = universe
+        self._node_indices[pos] = node_index
+
+        pos += 1
+        self._pos = pos if pos < self._size else 0
+        if self._count < self._size:
+            self._count += 1
+
+    def packets(self, universe: Optional[int] = None, start: Optional[float] = None, end: Optional[float] = None,
+                node: Optional['pyartnet.base.BaseNode'] = None) -> Iterator[TappedPacket]:
+        """Return the captured packets, the oldest packet first
+
+        :param universe: only packets of this universe
+        :param start: only packets which were sent at or after this time (:func:`pyartnet.base.clock.monotonic`)
+        :param end: only packets which were sent before this time (:func:`pyartnet.base.clock.monotonic`)
+        :param node: only packets of this node
+        """
+        node_index = None if node is None else self._nodes.index(node)
+
+        first = self._pos - self._count
+        for i in range(first, first + self._count):
+            pos = i % self._size
+            if universe is not None and self._universes[pos] != universe:
+                continue
+            if node_index is not None and self._node_indices[pos] != node_index:
+                continue
+            time = self._times[pos]
+            if start is not None and time < start or end is not None and time >= end:
+                continue
+
+            offset = pos * MAX_PACKET_SIZE
+            yield TappedPacket(time, self._nodes[self._node_indices[pos]], self._universes[pos],
+                               bytes(self._buf[offset: offset + self._lengths[pos]]))
+
+    def dump(self, universe: Optional[int] = None, start: Optional[float] = None, end: Optional[float] = None,
+             node: Optional['pyartnet.base.BaseNode'] = None) -> str:
+        """Return the formatted captured packets, one packet per line.
+        Takes the same filters as :meth:`packets`."""
+        return '\n'.join(str(p) for p in self.packets(universe, start, end, node))
+
+    def clear(self):
+        """Remove all captured packets"""
+        self._pos = 0
+        self._count = 0
+
+    def close(self):
+        """Stop capturing the packets and remove the captured packets"""
+        for node in self._nodes:
+            node._tap_packet = None
+        self._nodes.clear()
+        self.clear()
+
+    def __len__(self):
+        return self._count
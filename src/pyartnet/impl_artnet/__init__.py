@@ -1,2 +1,3 @@
 from .node import ArtNetNode
+from .receiver import ArtNetReceiver
 from .universe import ArtNetUniverse
@@ -1,4 +1,3 @@
-import logging
 from typing import Final, Optional, Tuple, Union
 
 import pyartnet
@@ -11,7 +10,10 @@ from pyartnet.errors import InvalidUniverseAddressError
 # https://artisticlicence.com/support-and-resources/art-net-4/
 # -----------------------------------------------------------------------------
 
-log = logging.getLogger('pyartnet.ArtNetNode')
+
+# Offsets in the ArtDmx packet
+PACKET_SEQUENCE: Final = 12
+PACKET_DATA: Final = 18
 
 
 class ArtNetNode(BaseNode['pyartnet.impl_artnet.ArtNetUniverse']):
@@ -41,91 +43,18 @@ class ArtNetNode(BaseNode['pyartnet.impl_artnet.ArtNetUniverse']):
 
     def _send_universe(self, id: int, byte_size: int, values: bytearray,
                        universe: 'pyartnet.impl_artnet.ArtNetUniverse'):
+        packet = universe._packet
+        packet[PACKET_SEQUENCE] = self._sequence_ctr.value     # 1       | Sequence
+        packet[PACKET_DATA:] = values                           # 0 - 512 | Channel values
 
-        # pre allocate the bytearray
-        _size = 6 + byte_size
-        packet = bytearray(_size)
-
-        packet[0] = self._sequence_ctr.value                    # 1 | Sequence,
-        packet[1] = 0x00                                        # 1 | Physical input port (not used)
-        packet[2:4] = id.to_bytes(2, byteorder='little')        # 2 | Universe
-
-        packet[4:6] = byte_size.to_bytes(2, 'big')              # 2       | Number of channels Big Endian
-        packet[6: _size] = values                               # 0 - 512 | Channel values
+        self._send_data(packet, id)
 
-        self._send_data(packet)
-
-        # log complete packet
-        if log.isEnabledFor(logging.DEBUG):
-            self.__log_artnet_frame(self._packet_base + packet)
+    def _format_packet(self, packet: bytes) -> str:
+        size = packet[16] << 8 | packet[17]
+        values = ' '.join(f'{v:03d}' for v in packet[PACKET_DATA: PACKET_DATA + size])
+        return f'Seq {packet[PACKET_SEQUENCE]:3d} Univ {packet[14] | packet[15] << 8:5d} Len {size:3d}: {values}'
 
     def _create_universe(self, nr: int) -> 'pyartnet.impl_artnet.ArtNetUniverse':
         if nr >= 32_768:
             raise InvalidUniverseAddressError()
         return pyartnet.impl_artnet.ArtNetUniverse(self, nr)
-
-    def __log_artnet_frame(self, p: Union[bytearray, bytes]):
-        """Log Artnet Frame"""
-        assert isinstance(p, (bytearray, bytes))
-
-        # runs the first time
-        if not hasattr(self, '_log_ctr'):
-            self._log_ctr = -1
-            self._log_show = [False for k in range(103)]
-
-        self._log_ctr += 1
-        if self._log_ctr >= 10:
-            self._log_ctr = 0
-        show_description: bool = self._log_ctr == 0
-
-        host_fmt = ' ' * (36 + len(self._ip))
-        out_desc = '{:s} {:2s} {:2s} {:4s} {:4s}'.format(host_fmt, 'Sq', '', 'Univ', ' Len')
-
-        _max_channel = p[16] << 8 | p[17]
-        pre = bytearray(p[:12]).hex().upper()
-        out = f'Packet to {self._ip:s}: {pre} {p[12]:02x} {p[13]:02x} {p[13]:02x}{p[14]:02x} {_max_channel:04x}'
-
-        # check what to print
-        for k in range(_max_channel):
-            if p[18 + k]:
-                # once we change something print channel index
-                if self._log_show[k // 5] is False:
-                    show_description = True
-                self._log_show[k // 5] = True
-
-        for k in range(0, _max_channel, 5):
-
-            # if there was never anything active do not print, but print the last block
-            if not self._log_show[k // 5] and not k + 5 > _max_channel:
-                # do not print multiple dots
-                if out.endswith('...'):
-                    continue
-
-                out_desc += '  - '
-                out += ' ...'
-                continue
-
-            # format block of channels
-            _block_vals = []
-            _block_desc = []
-            for i in range(5):
-                if k + i < _max_channel:
-                    if show_description:
-                        _block_desc.append(f'{k + i + 1:<3d}')
-                    _block_vals.append(f'{p[18 + k + i]:03d}')
-
-            # separator
-            if out.endswith('...'):
-                out_desc += ' '
-                out += ' '
-            else:
-                out_desc += '   '
-                out += '   '
-
-            out += ' '.join(_block_vals)
-            if show_description:
-                out_desc += ' '.join(_block_desc)
-
-        if show_description:
-            log.debug(out_desc)
-        log.debug(out)
@@ -0,0 +1,19 @@
+from typing import Final, Optional, Tuple
+
+from pyartnet.base.base_receiver import BaseReceiver
+
+# ID, Opcode ArtDMX 0x5000 (Little endian) - same as in ArtNetNode
+ARTDMX_HEADER: Final = b'Art-Net\x00\x00\x50'
+
+
+class ArtNetReceiver(BaseReceiver):
+    """Receives ArtDMX packets"""
+
+    def _parse(self, data: memoryview) -> Optional[Tuple[int, memoryview]]:
+        if len(data) < 18 or data[:10] != ARTDMX_HEADER:
+            return None
+
+        # 1 | Sequence, 1 | Physical input port, 2 | Universe (little endian), 2 | Number of channels (big endian)
+        universe = data[14] | data[15] << 8
+        size = data[16] << 8 | data[17]
+        return universe, data[18: 18 + size]
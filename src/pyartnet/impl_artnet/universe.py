@@ -2,4 +2,13 @@ from pyartnet.base import BaseUniverse
 
 
 class ArtNetUniverse(BaseUniverse):
-    pass
+    def _build_packet(self):
+        size = self._data_size
+
+        packet = bytearray(self._node._packet_base)
+        packet.append(0x00)                                     # 1 | Sequence, set when sending
+        packet.append(0x00)                                     # 1 | Physical input port (not used)
+        packet.extend(self._universe.to_bytes(2, 'little'))     # 2 | Universe
+        packet.extend(size.to_bytes(2, 'big'))                  # 2       | Number of channels Big Endian
+        packet.extend(bytes(size))                              # 0 - 512 | Channel values
+        self._packet = packet
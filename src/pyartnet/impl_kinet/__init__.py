@@ -1,2 +1,3 @@
 from .node import KiNetNode
+from .receiver import KiNetReceiver
 from .universe import KiNetUniverse
@@ -1,7 +1,5 @@
-import logging
-from logging import DEBUG as LVL_DEBUG
 from struct import pack as s_pack
-from typing import Optional, Tuple, Union
+from typing import Final, Optional, Tuple, Union
 
 import pyartnet
 from pyartnet.base import BaseNode
@@ -12,37 +10,56 @@ from pyartnet.errors import InvalidUniverseAddressError
 # todo: find links
 # -----------------------------------------------------------------------------
 
-log = logging.getLogger('pyartnet.KiNetNode')
+
+# Offsets in the packet
+PACKET_DATA: Final = 21
+PORTOUT_PACKET_DATA: Final = 24
 
 
 class KiNetNode(BaseNode['pyartnet.impl_kinet.KiNetUniverse']):
     def __init__(self, ip: str, port: int, *,
                  max_fps: int = 25,
                  refresh_every: Union[int, float, None] = 2, start_refresh_task: bool = True,
-                 source_address: Optional[Tuple[str, int]] = None):
+                 source_address: Optional[Tuple[str, int]] = None,
+
+                 # KiNet specific fields
+                 portout: bool = False
+                 ):
         super().__init__(ip=ip, port=port,
                          max_fps=max_fps,
                          refresh_every=refresh_every, start_refresh_task=start_refresh_task,
                          source_address=source_address)
 
-        # build base packet
+        # v2 PORTOUT: the universe number is the port of the power supply
+        self._portout: Final = portout
+        self._packet_data: Final = PORTOUT_PACKET_DATA if portout else PACKET_DATA
+
+        # build base packet, the universes add the rest of the header
         packet = bytearray()
-        packet.extend(s_pack(">IHH", 0x0401DC4A, 0x0100, 0x0101))   # Magic, version, type
-        packet.extend(s_pack(">IBBHI", 0, 0, 0, 0, 0xFFFFFFFF))     # sequence, port, padding, flags, timer
+        if portout:
+            packet.extend(s_pack(">IHH", 0x0401DC4A, 0x0200, 0x0801))   # Magic, version, type
+            packet.extend(s_pack(">II", 0, 0xFFFFFFFF))                  # sequence, universe
+        else:
+            packet.extend(s_pack(">IHH", 0x0401DC4A, 0x0100, 0x0101))   # Magic, version, type
+            packet.extend(s_pack(">IBBHI", 0, 0, 0, 0, 0xFFFFFFFF))     # sequence, port, padding, flags, timer
+            packet.append(0x00)                                         # start code
         self._packet_base = bytes(packet)
 
     def _send_universe(self, id: int, byte_size: int, values: bytearray, universe: 'pyartnet.impl_kinet.KiNetUniverse'):
-        packet = bytearray()
-        packet.append(byte_size)
-        packet.extend(values)
+        packet = universe._packet
+        packet[self._packet_data:] = values
 
-        self._send_data(packet)
+        self._send_data(packet, id)
 
-        if log.isEnabledFor(LVL_DEBUG):
-            # log complete packet
-            log.debug(f"Sending KiNet frame to {self._ip}:{self._port}: {(self._packet_base + packet).hex()}")
+    def _format_packet(self, packet: bytes) -> str:
+        data = self._packet_data
+        values = ' '.join(f'{v:03d}' for v in packet[data:])
+        if self._portout:
+            return f'Port {packet[16]:3d} Len {len(packet) - data:3d}: {values}'
+        return f'Len {len(packet) - data:3d}: {values}'
 
     def _create_universe(self, nr: int) -> 'pyartnet.impl_kinet.KiNetUniverse':
-        if nr >= 32_768:
+        # PORTOUT: the ports of the power supply start at 1
+        if nr >= (256 if self._portout else 32_768) or (self._portout and nr < 1):
             raise InvalidUniverseAddressError()
         return pyartnet.impl_kinet.KiNetUniverse(self, nr)
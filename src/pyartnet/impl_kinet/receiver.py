@@ -0,0 +1,25 @@
+from struct import pack as s_pack
+from typing import Final, Optional, Tuple
+
+from pyartnet.base.base_receiver import BaseReceiver
+
+# Magic, version, type - same as in KiNetNode
+DMXOUT_HEADER: Final = s_pack('>IHH', 0x0401DC4A, 0x0100, 0x0101)
+PORTOUT_HEADER: Final = s_pack('>IHH', 0x0401DC4A, 0x0200, 0x0801)
+
+
+class KiNetReceiver(BaseReceiver):
+    """Receives KiNet DMXOUT and PORTOUT packets. The port is used as the universe number."""
+
+    def _parse(self, data: memoryview) -> Optional[Tuple[int, memoryview]]:
+        header = data[:8]
+        if header == DMXOUT_HEADER and len(data) >= 21:
+            # 4 | sequence, 1 | port, 1 | padding, 2 | flags, 4 | timer, 1 | start code
+            return data[12], data[21:]
+
+        if header == PORTOUT_HEADER and len(data) >= 24:
+            # 4 | sequence, 4 | universe, 1 | port, 1 | padding, 2 | flags, 2 | length, 2 | start code
+            size = int.from_bytes(data[20:22], 'little')
+            return data[16], data[24: 24 + size]
+
+        return None
@@ -1,5 +1,18 @@
+from struct import pack as s_pack
+from typing import cast
+
+import pyartnet
 from pyartnet.base import BaseUniverse
 
 
 class KiNetUniverse(BaseUniverse):
-    pass
+    def _build_packet(self):
+        size = self._data_size
+        node = cast('pyartnet.impl_kinet.KiNetNode', self._node)
+
+        packet = bytearray(node._packet_base)
+        if node._portout:
+            # port, padding, flags, length, start code
+            packet.extend(s_pack('<BBHHH', self._universe, 0, 0, size, 0x0FFF))
+        packet.extend(bytes(size))
+        self._packet = packet
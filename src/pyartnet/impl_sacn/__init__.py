@@ -1,2 +1,3 @@
 from .node import SacnNode
+from .receiver import SacnReceiver
 from .universe import SacnUniverse
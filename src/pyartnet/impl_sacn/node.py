@@ -1,10 +1,8 @@
 # flake8: noqa: E262
-import logging
-from logging import DEBUG as LVL_DEBUG
 from typing import Final, Optional, Tuple, Union
 from uuid import uuid4
 
-import pyartnet.impl_sacn.universe
+import pyartnet
 from pyartnet.base import BaseNode
 from pyartnet.errors import InvalidCidError, InvalidUniverseAddressError
 
@@ -13,8 +11,6 @@ from pyartnet.errors import InvalidCidError, InvalidUniverseAddressError
 # https://tsp.esta.org/tsp/documents/published_docs.php
 # -----------------------------------------------------------------------------
 
-log = logging.getLogger('pyartnet.SacnNode')
-
 
 # Package constant
 ACN_PACKET_IDENTIFIER: Final = (0x41, 0x53, 0x43, 0x2d, 0x45, 0x31, 0x2e, 0x31, 0x37, 0x00, 0x00, 0x00)
@@ -24,6 +20,12 @@ VECTOR_ROOT_E131_DATA: Final = b'\x00\x00\x00\x04'
 VECTOR_E131_DATA_PACKET: Final = b'\x00\x00\x00\x02'
 VECTOR_DMP_SET_PROPERTY: Final = 0x02
 
+# Offsets in the data packet
+PACKET_ROOT_LENGTH: Final = 16
+PACKET_FRAMING_LENGTH: Final = 38
+PACKET_SEQUENCE: Final = 111
+PACKET_DATA: Final = 126
+
 
 class SacnNode(BaseNode['pyartnet.impl_sacn.SacnUniverse']):
     def __init__(self, ip: str, port: int, *,
@@ -71,43 +73,20 @@ class SacnNode(BaseNode['pyartnet.impl_sacn.SacnUniverse']):
         packet.append(100)                          # |  1 |Priority
         packet.extend(int(50).to_bytes(2, 'big'))   # |  2 | Synchronization universe
 
-        self._packet_base: bytearray = packet
-
+        self._packet_base = bytes(packet)
 
     def _send_universe(self, id: int, byte_size: int, values: bytearray,
-                       universe: 'pyartnet.impl_sacn.universe.SacnUniverse'):
-        packet = bytearray()
-
-        # DMX Start Code is not included in the byte size from the universe
-        prop_count = byte_size + 1
-
-        # Framing layer Part 2
-        packet.append(universe._sequence_ctr.value)             # | 1 | Sequence,
-        packet.append(0x00)                                     # | 1 | Options
-        packet.extend(id.to_bytes(2, byteorder='big'))          # | 2 | BaseUniverse Number
-
-        # DMP Layer
-        dmp_length = ((10 + prop_count) | 0x7000).to_bytes(2, 'big')
-        packet.extend(dmp_length)               # | 2 | Flags and length
-        packet.append(VECTOR_DMP_SET_PROPERTY)  # | 1 | Vector
-        packet.append(0xA1)                     # | 1 | Address Type & Data Type
-        packet.extend(b'\x00\x00')              # | 2 | First Property Address
-        packet.extend(b'\x00\x01')              # | 2 | Address Increment
-
-        packet.extend(prop_count.to_bytes(2, 'big'))    # |     2 | Property Value Count
-        packet.append(0x00)                             # |     1 | Property Values - DMX Start Code
-        packet.extend(values)                           # | 0-512 | Property Values - DMX Data
-
-        # Update length for base packet
-        base_packet = self._packet_base
-        base_packet[16:18] = ((109 + prop_count) | 0x7000).to_bytes(2, 'big')   # root layer
-        base_packet[38:40] = (( 87 + prop_count) | 0x7000).to_bytes(2, 'big')   # framing layer
+                       universe: 'pyartnet.impl_sacn.SacnUniverse'):
+        packet = universe._packet
+        packet[PACKET_SEQUENCE] = universe._sequence_ctr.value    # | 1 | Sequence
+        packet[PACKET_DATA:] = values                             # | 0-512 | Property Values - DMX Data
 
-        self._send_data(packet)
+        self._send_data(packet, id)
 
-        if log.isEnabledFor(LVL_DEBUG):
-            # log complete packet
-            log.debug(f"Sending sACN frame to {self._ip}:{self._port}: {(base_packet + packet).hex()}")
+    def _format_packet(self, packet: bytes) -> str:
+        values = ' '.join(f'{v:03d}' for v in packet[PACKET_DATA:])
+        universe = packet[PACKET_SEQUENCE + 2] << 8 | packet[PACKET_SEQUENCE + 3]
+        return f'Seq {packet[PACKET_SEQUENCE]:3d} Univ {universe:5d} Len {len(packet) - PACKET_DATA:3d}: {values}'
 
     def _create_universe(self, nr: int) -> 'pyartnet.impl_sacn.SacnUniverse':
         # 6.2.7 E1.31 Data Packet: Universe
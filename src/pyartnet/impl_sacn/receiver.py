@@ -0,0 +1,25 @@
+from typing import Final, Optional, Tuple
+
+from pyartnet.base.base_receiver import BaseReceiver
+
+from .node import ACN_PACKET_IDENTIFIER, VECTOR_DMP_SET_PROPERTY, VECTOR_E131_DATA_PACKET, VECTOR_ROOT_E131_DATA
+
+PREAMBLE: Final = b'\x00\x10\x00\x00' + bytes(ACN_PACKET_IDENTIFIER)
+
+
+class SacnReceiver(BaseReceiver):
+    """Receives E1.31 data packets"""
+
+    def _parse(self, data: memoryview) -> Optional[Tuple[int, memoryview]]:
+        # offsets see SacnNode
+        if len(data) < 126 or data[:16] != PREAMBLE or data[18:22] != VECTOR_ROOT_E131_DATA or \
+                data[40:44] != VECTOR_E131_DATA_PACKET or data[117] != VECTOR_DMP_SET_PROPERTY:
+            return None
+
+        # only DMX data
+        if data[125] != 0x00:
+            return None
+
+        universe = data[113] << 8 | data[114]
+        size = (data[123] << 8 | data[124]) - 1     # Property Value Count includes the start code
+        return universe, data[126: 126 + size]
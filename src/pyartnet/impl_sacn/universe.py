@@ -4,11 +4,40 @@ import pyartnet
 from pyartnet.base import BaseUniverse
 from pyartnet.base.seq_counter import SequenceCounter
 
+from .node import PACKET_FRAMING_LENGTH, PACKET_ROOT_LENGTH, VECTOR_DMP_SET_PROPERTY
 
-class SacnUniverse(BaseUniverse):
 
+class SacnUniverse(BaseUniverse):
     def __init__(self, node: 'pyartnet.impl_sacn.SacnNode', universe: int = 0):
         super().__init__(node, universe)
 
         # sACN has the sequence counter on the universe
         self._sequence_ctr: Final = SequenceCounter()
+
+    def _build_packet(self):
+        # DMX Start Code is not included in the byte size from the universe
+        prop_count = self._data_size + 1
+
+        packet = bytearray(self._node._packet_base)
+
+        # Update length of root and framing layer
+        packet[PACKET_ROOT_LENGTH: PACKET_ROOT_LENGTH + 2] = ((109 + prop_count) | 0x7000).to_bytes(2, 'big')
+        packet[PACKET_FRAMING_LENGTH: PACKET_FRAMING_LENGTH + 2] = (( 87 + prop_count) | 0x7000).to_bytes(2, 'big')
+
+        # Framing layer Part 2
+        packet.append(0x00)                                     # | 1 | Sequence, set when sending
+        packet.append(0x00)                                     # | 1 | Options
+        packet.extend(self._universe.to_bytes(2, 'big'))        # | 2 | BaseUniverse Number
+
+        # DMP Layer
+        dmp_length = ((10 + prop_count) | 0x7000).to_bytes(2, 'big')
+        packet.extend(dmp_length)               # | 2 | Flags and length
+        packet.append(VECTOR_DMP_SET_PROPERTY)  # | 1 | Vector
+        packet.append(0xA1)                     # | 1 | Address Type & Data Type
+        packet.extend(b'\x00\x00')              # | 2 | First Property Address
+        packet.extend(b'\x00\x01')              # | 2 | Address Increment
+
+        packet.extend(prop_count.to_bytes(2, 'big'))    # |     2 | Property Value Count
+        packet.append(0x00)                             # |     1 | Property Values - DMX Start Code
+        packet.extend(bytes(prop_count - 1))            # | 0-512 | Property Values - DMX Data
+        self._packet = packet
@@ -0,0 +1,160 @@
+from collections import deque
+from functools import lru_cache
+from itertools import repeat
+from operator import add, sub
+from typing import Any, Deque, Final, List, Literal, Optional, Tuple
+
+import pyartnet
+from pyartnet.base import ProcessJob
+from pyartnet.base.clock import monotonic
+from pyartnet.errors import BufferOutOfUniverseError
+
+# weight of a new input interval for the estimated input rate
+INTERVAL_WEIGHT: Final = 0.2
+
+
+@lru_cache(maxsize=64)
+def _diff_lut(factor: float) -> List[int]:
+    # scaled difference for every difference -255..255, negative differences use negative indices
+    return [round(i * factor) for i in range(256)] + [round(i * factor) for i in range(-255, 0)]
+
+
+def _hermite_weights(t: float) -> Tuple[float, float, float, float]:
+    # catmull-rom spline
+    t2 = t * t
+    t3 = t2 * t
+    return (-0.5 * t3 + t2 - 0.5 * t,
+            1.5 * t3 - 2.5 * t2 + 1,
+            -1.5 * t3 + 2 * t2 + 0.5 * t,
+            0.5 * t3 - 0.5 * t2)
+
+
+# noinspection PyProtectedMember
+class FrameInterpolator:
+    """Interpolates between frames of a source with a low frame rate (e.g. a media server), so the universe
+    is updated smoothly with the frame rate of the node. The output is delayed by the interval
+    of the input frames, so there is always a following frame to interpolate to.
+
+    :param universe: universe which receives the interpolated frames
+    :param mode: ``linear`` or ``hermite`` (catmull-rom spline through the frames)
+    :param start: start position of the frames in the universe (1..512)
+    """
+
+    def __init__(self, universe: 'pyartnet.base.BaseUniverse', mode: Literal['linear', 'hermite'] = 'linear',
+                 start: int = 1):
+        if mode not in ('linear', 'hermite'):
+            raise ValueError(f'Mode must be "linear" or "hermite": {mode}')
+        if not 1 <= start <= 512:
+            raise BufferOutOfUniverseError(f'Start position out of universe (1..512): {start}')
+
+        self._universe: Final = universe
+        self._mode: Final = mode
+        self._start: Final = start
+
+        self._frames: Deque[Tuple[float, bytes]] = deque(maxlen=4)
+        self._interval: Optional[float] = None
+        self._job: Optional[InterpolationJob] = None
+
+    @property
+    def delay(self) -> float:
+        """Current delay of the output in seconds"""
+        return 0 if self._interval is None else self._interval
+
+    def push(self, data: Any, timestamp: Optional[float] = None):
+        """Add a new frame
+
+        :param data: bytes-like object or any other object that supports the buffer protocol
+        :param timestamp: time of the frame (:func:`pyartnet.base.clock.monotonic`), default is now
+        """
+        frame = bytes(memoryview(data).cast('B'))
+        if self._start - 1 + len(frame) > 512:
+            raise BufferOutOfUniverseError(
+                f'Buffer out of universe (1..512): start: {self._start} length: {len(frame)}')
+        if timestamp is None:
+            timestamp = monotonic()
+
+        frames = self._frames
+        if frames:
+            last_time, last_frame = frames[-1]
+            if len(last_frame) != len(frame) or timestamp <= last_time:
+                frames.clear()
+            else:
+                interval = timestamp - last_time
+                self._interval = interval if self._interval is None else \
+                    self._interval + (interval - self._interval) * INTERVAL_WEIGHT
+        frames.append((timestamp, frame))
+
+        if self._job is None:
+            self._job = job = InterpolationJob(self)
+            node = self._universe._node
+            node._process_jobs.append(job)
+            node._process_task.start()
+
+    def _frame(self, now: float) -> Tuple[bytes, bool]:
+        """Return the interpolated frame and if it is the last frame"""
+        frames = self._frames
+        now -= self.delay
+
+        # find the frame before now
+        pos = len(frames) - 1
+        while pos > 0 and frames[pos][0] > now:
+            pos -= 1
+
+        t_a, frame_a = frames[pos]
+        if pos == len(frames) - 1:
+            return frame_a, True
+        if now <= t_a:
+            return frame_a, False
+
+        t_b, frame_b = frames[pos + 1]
+        factor = min(1.0, (now - t_a) / (t_b - t_a))
+
+        if self._mode == 'linear':
+            lut = _diff_lut(round(factor, 3))
+            return bytes(map(add, frame_a, map(lut.__getitem__, map(sub, frame_b, frame_a)))), False
+
+        # missing neighbours are replaced by the frames of the segment
+        frame_0 = frames[pos - 1][1] if pos > 0 else frame_a
+        frame_3 = frames[pos + 2][1] if pos + 2 < len(frames) else frame_b
+
+        values: Any = repeat(0.5)
+        for weight, frame in zip(_hermite_weights(factor), (frame_0, frame_a, frame_b, frame_3)):
+            values = map(add, values, map(weight.__mul__, frame))
+        out = list(map(int, values))
+        if min(out) < 0 or max(out) > 255:
+            out = list(map(min, repeat(255), map(max, repeat(0), out)))
+        return bytes(out), False
+
+    def stop(self):
+        """Stop the interpolation and remove all frames"""
+        self._frames.clear()
+        self._interval = None
+        if self._job is not None:
+            self._job.stop()
+
+
+# noinspection PyProtectedMember
+class InterpolationJob(ProcessJob):
+    def __init__(self, interpolator: FrameInterpolator):
+        super().__init__()
+        self.interpolator: Final = interpolator
+
+    def process(self):
+        interpolator = self.interpolator
+        if not interpolator._frames:
+            self.is_done = True
+            return None
+
+        frame, self.is_done = interpolator._frame(monotonic())
+        interpolator._universe.write_buffer(interpolator._start, frame)
+
+    def stop(self):
+        jobs = self.interpolator._universe._node._process_jobs
+        if self in jobs:
+            jobs.remove(self)
+        self.fade_complete()
+
+    def fade_complete(self):
+        if self.interpolator._job is self:
+            self.interpolator._job = None
+        self.event.set()
@@ -0,0 +1,162 @@
+import logging
+from asyncio import get_running_loop, TimerHandle
+from typing import Any, Final, List, Literal, Optional
+
+import pyartnet
+from pyartnet.base.clock import monotonic, TIMER_TOLERANCE
+
+log = logging.getLogger('pyartnet.Merge')
+
+
+# noinspection PyProtectedMember
+class MergeSource:
+    """Input of a :class:`UniverseMerger`, e.g. a console. Create it with :meth:`UniverseMerger.add_source`."""
+
+    def __init__(self, merger: 'UniverseMerger', name: str):
+        self._merger: Final = merger
+        self._name: Final = name
+
+        self._data: Final = bytearray(512)
+        self._size: int = 0
+        self._last_update: float = 0    # timeout
+        self._last_change: float = 0    # ltp
+        self._active: bool = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def is_active(self) -> bool:
+        """True if the source has sent data and has not timed out"""
+        return self._active
+
+    def set_data(self, data: Any):
+        """Set the data of the source and recompute the merged output of the universe
+
+        :param data: bytes-like object or any other object that supports the buffer protocol, starting at address 1
+        """
+        buf = memoryview(data).cast('B')
+        size = len(buf)
+        if size > 512:
+            raise ValueError(f'Data must not be longer than 512 bytes, got {size:d}!')
+
+        changed = not self._active or size != self._size or self._data[:size] != buf
+        self._data[:size] = buf
+        if size < self._size:
+            # the merge uses the size of the largest source
+            self._data[size:self._size] = bytes(self._size - size)
+        self._size = size
+        self._last_update = now = monotonic()
+        self._active = True
+
+        # a source which only repeats its data must not take precedence
+        if changed:
+            self._last_change = now
+            self._merger._merge()
+        self._merger._schedule_timeout()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__:s} {self._name:s} active={self._active}>'
+
+
+# noinspection PyProtectedMember
+class UniverseMerger:
+    """Merges multiple sources into one universe.
+
+    HTP (highest takes precedence) uses the highest value of all sources for every address,
+    LTP (latest takes precedence) uses the data of the source which was changed last.
+    The merged output is only computed when a source changes or times out and then written to the universe buffer.
+
+    :param universe: universe which receives the merged output
+    :param mode: ``htp`` or ``ltp``
+    :param timeout: time in seconds after which a source without updates is no longer merged (None to disable)
+    """
+
+    def __init__(self, universe: 'pyartnet.base.BaseUniverse', mode: Literal['htp', 'ltp'] = 'htp',
+                 timeout: Optional[float] = 10):
+        if mode not in ('htp', 'ltp'):
+            raise ValueError(f'Mode must be "htp" or "ltp": {mode}')
+        if timeout is not None and timeout <= 0:
+            raise ValueError('Timeout must be > 0!')
+
+        self._universe: Final = universe
+        self._mode: Final = mode
+        self._timeout: Final = timeout
+
+        self._sources: List[MergeSource] = []
+        self._merged_size: int = 0
+        self._timer: Optional[TimerHandle] = None
+
+    def add_source(self, name: str = '') -> MergeSource:
+        """Add a new source to the merger
+
+        :param name: name of the source
+        """
+        if not name:
+            name = f'Source {len(self._sources) + 1:d}'
+        source = MergeSource(self, name)
+        self._sources.append(source)
+        return source
+
+    def remove_source(self, source: MergeSource):
+        """Remove a source from the merger
+
+        :param source: source
+        """
+        self._sources.remove(source)
+        if source._active:
+            source._active = False
+            self._merge()
+
+    def _merge(self):
+        active = [s for s in self._sources if s._active]
+        size = max((s._size for s in active), default=0)
+
+        if not active:
+            merged = bytes(self._universe._data_size)
+        elif self._mode == 'htp':
+            merged = bytes(active[0]._data[:size])
+            for source in active[1:]:
+                merged = bytes(map(max, merged, source._data[:size]))
+        else:
+            latest = max(active, key=lambda s: s._last_change)
+            merged = bytes(latest._data[:size])
+
+        # addresses which are no longer part of the merged output have to be turned off
+        if len(merged) < self._merged_size:
+            merged += bytes(self._merged_size - len(merged))
+        self._merged_size = size
+
+        self._universe.write_buffer(1, merged)
+
+    def _schedule_timeout(self):
+        if self._timeout is None or self._timer is not None:
+            return None
+
+        oldest = min((s._last_update for s in self._sources if s._active), default=None)
+        if oldest is None:
+            return None
+        self._timer = get_running_loop().call_later(oldest + self._timeout - monotonic(), self._check_timeout)
+
+    def _check_timeout(self):
+        self._timer = None
+        assert self._timeout is not None
+
+        changed = False
+        now = monotonic()
+        for source in self._sources:
+            if source._active and now - source._last_update >= self._timeout - TIMER_TOLERANCE:
+                log.debug(f'{source.name:s} timed out')
+                source._active = False
+                changed = True
+
+        if changed:
+            self._merge()
+        self._schedule_timeout()
+
+    def close(self):
+        """Stop the timeout handling"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
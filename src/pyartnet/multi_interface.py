@@ -0,0 +1,350 @@
+import logging
+import socket
+from asyncio import get_running_loop
+from itertools import cycle
+from typing import Dict, Final, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
+
+import pyartnet
+from pyartnet.base.clock import monotonic
+from pyartnet.base.socket_output import SocketOutput
+from pyartnet.base.transport_output import DatagramTransportOutput
+
+log = logging.getLogger('pyartnet.MultiInterface')
+
+# time in seconds over which the throughput of an interface is measured
+RATE_WINDOW: Final = 1
+
+# least loaded: the universes are only redistributed if this reduces the load of the busiest interface by this fraction
+REDISTRIBUTE_THRESHOLD: Final = 0.25
+
+
+class InterfaceStats(NamedTuple):
+    address: str
+    bytes_per_sec: float
+    packets_per_sec: float
+    bytes: int
+    packets: int
+    dropped: int
+    universes: int
+
+
+class NodeOutput:
+    """Output of a node which sends the packets through the interfaces of a :class:`MultiInterfaceOutput`"""
+
+    def __init__(self, output: 'MultiInterfaceOutput', node: 'pyartnet.base.BaseNode'):
+        self._output: Final = output
+        self._node: Final = node
+        self._dst: Final = node._dst
+
+        # pending packets are kept by the interfaces
+        self._pending: Final[Dict[int, bytes]] = {}
+
+        # frames which were replaced by a newer frame before they could be sent
+        self._dropped: int = 0
+
+    def send(self, packet: Union[bytearray, bytes], universe: int) -> int:
+        output = self._output
+        iface = output._routes.get((self, universe))
+        if iface is None:
+            iface = output._route(self, universe)
+        if output._balance:
+            output._count(self, universe, len(packet))
+        return iface.send(self, packet, universe)
+
+    def close(self):
+        pass
+
+
+class Interface:
+    """Socket of one local interface, shared by all nodes which send through it"""
+
+    def __init__(self, address: str, device: Optional[str] = None):
+        self.address: Final = address
+        self.device: Final = device
+
+        self._socket: Final = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        # the address only sets the source address, the network card is chosen by the routing table
+        if device is not None:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, device.encode())
+        self._socket.bind((address, 0))
+
+        self._pending: Dict[Tuple[NodeOutput, int], bytes] = {}
+        self._writer_active = False
+
+        self.universes: int = 0
+
+        # statistics
+        self.bytes: int = 0
+        self.packets: int = 0
+        self.dropped: int = 0
+        self.bytes_per_sec: float = 0
+        self.packets_per_sec: float = 0
+        self._window_start: float = monotonic()
+        self._window_bytes: int = 0
+        self._window_packets: int = 0
+
+    def send(self, output: NodeOutput, packet: Union[bytearray, bytes], universe: int) -> int:
+        # keep the order if there are already pending packets
+        if self._pending:
+            self._queue(output, packet, universe)
+            return 0
+
+        try:
+            ret = self._socket.sendto(packet, output._dst)
+        except BlockingIOError:
+            self._queue(output, packet, universe)
+            return 0
+
+        self._sent(ret)
+        return ret
+
+    def _sent(self, size: int):
+        self.bytes += size
+        self.packets += 1
+        self._window_bytes += size
+        self._window_packets += 1
+
+        now = monotonic()
+        if now - self._window_start >= RATE_WINDOW:
+            self._update_rate(now)
+
+    def _update_rate(self, now: float):
+        duration = now - self._window_start
+        if duration <= 0:
+            return None
+        self.bytes_per_sec = self._window_bytes / duration
+        self.packets_per_sec = self._window_packets / duration
+        self._window_start = now
+        self._window_bytes = 0
+        self._window_packets = 0
+
+    def _queue(self, output: NodeOutput, packet: Union[bytearray, bytes], universe: int):
+        key = (output, universe)
+        if key in self._pending:
+            output._dropped += 1
+            self.dropped += 1
+        self._pending[key] = bytes(packet)
+
+        if not self._writer_active:
+            get_running_loop().add_writer(self._socket, self._flush)
+            self._writer_active = True
+            log.debug(f'Socket buffer of {self.address:s} full, {len(self._pending):d} frame(s) pending')
+
+    def _flush(self):
+        pending = self._pending
+        while pending:
+            key = next(iter(pending))
+            try:
+                ret = self._socket.sendto(pending[key], key[0]._dst)
+            except BlockingIOError:
+                return None
+            del pending[key]
+            self._sent(ret)
+
+        self._stop_writer()
+
+    def _stop_writer(self):
+        if self._writer_active:
+            get_running_loop().remove_writer(self._socket)
+            self._writer_active = False
+
+    def close(self):
+        self._stop_writer()
+        self._socket.close()
+
+
+# noinspection PyProtectedMember
+class MultiInterfaceOutput:
+    """Sends the packets of nodes through multiple local interfaces, e.g. one network card per lighting network.
+    Every interface has its own socket. A universe is assigned to an interface when it is sent the first time.
+    With ``static`` and ``round_robin`` the universe then stays on this interface,
+    so the packets of a universe are always sent in order.
+
+    Binding a socket to a local address only sets the source address of the packets, the operating system still
+    chooses the network card through the routing table of the destination. To send through a specific network card
+    pass the name of the device together with the address (Linux only, requires ``CAP_NET_RAW``)
+    or set up policy routing for the source addresses.
+    Otherwise ``round_robin`` and ``least_loaded`` do not distribute the load over the network cards.
+
+    ``static`` sends through the interface assigned with :meth:`assign` (or the first interface),
+    ``round_robin`` assigns the universes to the interfaces in turn and
+    ``least_loaded`` assigns a new universe to the interface with the lowest throughput. Every second the universes
+    are redistributed by their measured throughput, but only if this reduces the load of the busiest interface
+    significantly. Universes of an interface with pending frames are not moved.
+
+    :param addresses: local addresses of the interfaces or tuples of local address and device name (e.g. ``eth0``)
+    :param policy: ``static``, ``round_robin`` or ``least_loaded``
+    """
+
+    def __init__(self, addresses: Sequence[Union[str, Tuple[str, str]]],
+                 policy: Literal['static', 'round_robin', 'least_loaded'] = 'static'):
+        if policy not in ('static', 'round_robin', 'least_loaded'):
+            raise ValueError(f'Policy must be "static", "round_robin" or "least_loaded": {policy}')
+        if not addresses:
+            raise ValueError('No interfaces specified!')
+
+        interfaces: List[Tuple[str, Optional[str]]] = [
+            (obj, None) if isinstance(obj, str) else (obj[0], obj[1]) for obj in addresses]
+        if len({address for address, _ in interfaces}) != len(interfaces):
+            raise ValueError('Interfaces must be unique!')
+        if any(device is not None for _, device in interfaces) and not hasattr(socket, 'SO_BINDTODEVICE'):
+            raise ValueError('Binding to a device is not supported on this platform!')
+
+        self._policy: Final = policy
+        self._interfaces: Final = tuple(Interface(address, device) for address, device in interfaces)
+        self._interface_map: Final = {i.address: i for i in self._interfaces}
+        self._round_robin: Final = cycle(self._interfaces)
+
+        self._outputs: Dict['pyartnet.base.BaseNode', NodeOutput] = {}
+        self._static: Dict[Tuple['pyartnet.base.BaseNode', Optional[int]], Interface] = {}
+        self._routes: Dict[Tuple[NodeOutput, int], Interface] = {}
+
+        # least loaded: bytes per universe since the last redistribution
+        self._balance: Final = policy == 'least_loaded'
+        self._balance_start: float = monotonic()
+        self._route_bytes: Dict[Tuple[NodeOutput, int], int] = {}
+
+    def add_node(self, node: 'pyartnet.base.BaseNode', interface: Optional[str] = None):
+        """Send the packets of the node through the interfaces
+
+        :param node: node
+        :param interface: address of the interface through which all universes of the node are sent
+        """
+        if node in self._outputs:
+            raise ValueError(f'Node {node._ip}:{node._port} is already added!')
+        old = node._output
+        if not isinstance(old, (SocketOutput, DatagramTransportOutput)):
+            raise ValueError(f'Node {node._ip}:{node._port} sends through a {old.__class__.__name__:s}!')
+
+        self._outputs[node] = output = NodeOutput(self, node)
+        if interface is not None:
+            self.assign(node, interface)
+
+        # move pending frames to the new output
+        old.close()
+        for universe, packet in old._pending.items():
+            output.send(packet, universe)
+        output._dropped = old._dropped
+        node._output = output  # type: ignore[assignment]
+
+        # the socket of the node is no longer used, the transport closes the socket by itself
+        if isinstance(old, SocketOutput):
+            node._socket.close()
+        return self
+
+    def assign(self, node: 'pyartnet.base.BaseNode', interface: str, universe: Optional[int] = None):
+        """Assign a node or a universe of a node to an interface
+
+        :param node: node
+        :param interface: address of the interface
+        :param universe: universe number or ``None`` to assign all universes of the node
+        """
+        iface = self._interface_map.get(interface)
+        if iface is None:
+            raise ValueError(f'Interface {interface} does not exist!')
+
+        self._static[(node, universe)] = iface
+
+        # the universes will be assigned again when they are sent the next time
+        output = self._outputs.get(node)
+        if output is not None:
+            for key in [k for k in self._routes if k[0] is output and (universe is None or k[1] == universe)]:
+                self._routes.pop(key).universes -= 1
+        return self
+
+    def _get_static(self, output: NodeOutput, universe: int) -> Optional[Interface]:
+        node = output._node
+        iface = self._static.get((node, universe))
+        if iface is None:
+            iface = self._static.get((node, None))
+        return iface
+
+    def _route(self, output: NodeOutput, universe: int) -> Interface:
+        node = output._node
+        iface = self._get_static(output, universe)
+        if iface is None:
+            if self._policy == 'round_robin':
+                iface = next(self._round_robin)
+            elif self._policy == 'least_loaded':
+                now = monotonic()
+                for i in self._interfaces:
+                    if now - i._window_start >= RATE_WINDOW:
+                        i._update_rate(now)
+                iface = min(self._interfaces, key=lambda i: (i.bytes_per_sec, i.universes))
+            else:
+                iface = self._interfaces[0]
+
+        self._routes[(output, universe)] = iface
+        iface.universes += 1
+        log.debug(f'Universe {universe:d} of {node._ip}:{node._port} is sent through {iface.address:s}')
+        return iface
+
+    def _count(self, output: NodeOutput, universe: int, size: int):
+        key = (output, universe)
+        route_bytes = self._route_bytes
+        route_bytes[key] = route_bytes.get(key, 0) + size
+
+        now = monotonic()
+        if now - self._balance_start >= RATE_WINDOW:
+            self._redistribute(now)
+
+    def _redistribute(self, now: float):
+        duration = now - self._balance_start
+        self._balance_start = now
+        route_bytes = self._route_bytes
+        self._route_bytes = {}
+        if duration <= 0:
+            return None
+
+        load = {i: 0. for i in self._interfaces}
+        count = {i: 0 for i in self._interfaces}
+        current_load = {i: 0. for i in self._interfaces}
+
+        movable = []
+        for key, iface in self._routes.items():
+            rate = route_bytes.get(key, 0) / duration
+            current_load[iface] += rate
+            # universes of an interface with pending frames stay, so the frames are not sent out of order
+            if self._get_static(*key) is not None or iface._pending:
+                load[iface] += rate
+                count[iface] += 1
+            else:
+                movable.append((rate, key, iface))
+
+        # the universes with the highest throughput first, each to the interface with the lowest load
+        movable.sort(key=lambda x: x[0], reverse=True)
+        moves = []
+        for rate, key, current in movable:
+            iface = min(self._interfaces, key=lambda i: (load[i], count[i], i is not current))
+            load[iface] += rate
+            count[iface] += 1
+            if iface is not current:
+                moves.append((key, current, iface))
+
+        # hysteresis, so the universes do not move between the interfaces every time
+        if not moves or max(load.values()) >= max(current_load.values()) * (1 - REDISTRIBUTE_THRESHOLD):
+            return None
+
+        for key, current, iface in moves:
+            self._routes[key] = iface
+            current.universes -= 1
+            iface.universes += 1
+            log.debug(f'Universe {key[1]:d} of {key[0]._dst[0]}:{key[0]._dst[1]} '
+                      f'moved from {current.address:s} to {iface.address:s}')
+
+    def stats(self) -> Tuple[InterfaceStats, ...]:
+        """Throughput of the interfaces"""
+        now = monotonic()
+        ret = []
+        for i in self._interfaces:
+            if now - i._window_start >= RATE_WINDOW:
+                i._update_rate(now)
+            ret.append(InterfaceStats(i.address, i.bytes_per_sec, i.packets_per_sec,
+                                      i.bytes, i.packets, i.dropped, i.universes))
+        return tuple(ret)
+
+    def close(self):
+        """Close the sockets of the interfaces"""
+        for i in self._interfaces:
+            i.close()
@@ -0,0 +1,146 @@
+from typing import Any, Dict, Final, Iterable, List, Optional, Tuple
+
+import pyartnet
+from pyartnet.errors import BufferOutOfUniverseError
+
+COLORS: Final = 'RGB'
+
+
+def _build_runs(pairs: List[Tuple[int, int]]) -> List[Tuple[slice, slice]]:
+    """Combine (dst, src) pairs (sorted by dst) to runs with a constant step which can be copied with one slice"""
+    runs: List[Tuple[slice, slice]] = []
+
+    i = 0
+    count = len(pairs)
+    while i < count:
+        dst_start, src_start = pairs[i]
+        dst_step, src_step = 1, 1
+        j = i + 1
+        if j < count:
+            dst_step = pairs[j][0] - dst_start
+            src_step = pairs[j][1] - src_start
+            while j < count and pairs[j][0] - pairs[j - 1][0] == dst_step and pairs[j][1] - pairs[j - 1][1] == src_step:
+                j += 1
+            if src_step == 0:
+                # the same source value for multiple addresses can not be copied with a slice
+                dst_step, src_step, j = 1, 1, i + 1
+
+        length = j - i
+        dst_stop = dst_start + dst_step * length
+        src_stop: Optional[int] = src_start + src_step * length
+        if src_stop is not None and src_stop < 0:
+            src_stop = None
+        runs.append((slice(dst_start, dst_stop, dst_step), slice(src_start, src_stop, src_step)))
+        i = j
+    return runs
+
+
+# noinspection PyProtectedMember
+class PixelMapper:
+    """Maps RGB frames (e.g. video frames with the shape height x width x 3) to the buffers of multiple universes.
+    The layout is compiled once to slices, so a frame can be distributed with a few slice copies per universe.
+
+    :param width: width of the frame in pixels
+    :param height: height of the frame in pixels
+    """
+
+    def __init__(self, width: int, height: int):
+        if width <= 0 or height <= 0:
+            raise ValueError('Width and height must be > 0!')
+
+        self._width: Final = width
+        self._height: Final = height
+        self._frame_size: Final = width * height * 3
+
+        # layout: universe -> list of (dst, src) for every color position of the pixel
+        self._layout: Dict['pyartnet.base.BaseUniverse', Tuple[List[Tuple[int, int]], ...]] = {}
+        self._compiled: Optional[Tuple[Tuple['pyartnet.base.BaseUniverse', Tuple[Tuple[slice, slice], ...]], ...]] = \
+            None
+
+    def add_pixel(self, universe: 'pyartnet.base.BaseUniverse', address: int, x: int, y: int,
+                  color_order: str = 'RGB'):
+        """Map a pixel of the frame to a universe
+
+        :param universe: universe the pixel will be written to
+        :param address: start address of the pixel in the universe (1..510)
+        :param x: x coordinate of the pixel in the frame
+        :param y: y coordinate of the pixel in the frame
+        :param color_order: order of the colors of the pixel, e.g. ``RGB`` or ``GRB``
+        """
+        if not 0 <= x < self._width or not 0 <= y < self._height:
+            raise ValueError(f'Pixel {x}/{y} is not in the frame ({self._width:d}x{self._height:d})!')
+        if len(color_order) != 3 or set(color_order) != set(COLORS):
+            raise ValueError(f'Invalid color order: {color_order}')
+        if not 1 <= address <= 510:
+            raise BufferOutOfUniverseError(
+                f'Pixel out of universe (1..512): start: {address} length: 3 -> {address + 2}')
+
+        src = (y * self._width + x) * 3
+        dst = address - 1
+        layout = self._layout.get(universe)
+        if layout is None:
+            self._layout[universe] = layout = ([], [], [])
+        for i, color in enumerate(color_order):
+            layout[i].append((dst + i, src + COLORS.index(color)))
+
+        self._compiled = None
+        return self
+
+    def add_strip(self, universe: 'pyartnet.base.BaseUniverse', address: int, pixels: Iterable[Tuple[int, int]],
+                  color_order: str = 'RGB'):
+        """Map consecutive pixels in a universe to pixels of the frame
+
+        :param universe: universe the pixels will be written to
+        :param address: start address of the first pixel in the universe
+        :param pixels: x/y coordinates of the pixels in the frame in the order of the strip
+        :param color_order: order of the colors of the pixels, e.g. ``RGB`` or ``GRB``
+        """
+        for i, (x, y) in enumerate(pixels):
+            self.add_pixel(universe, address + i * 3, x, y, color_order)
+        return self
+
+    def compile(self):
+        """Compile the layout. This is done automatically on the first frame after the layout changed."""
+        compiled = []
+        for universe, layout in self._layout.items():
+            pairs = sorted(pair for color_pairs in layout for pair in color_pairs)
+            for (dst_a, _), (dst_b, _) in zip(pairs, pairs[1:]):
+                if dst_a == dst_b:
+                    raise ValueError(f'Address {dst_a + 1:d} in universe {universe._universe:d} is mapped twice!')
+
+            # Try to copy everything at once (e.g. RGB pixels in the same order as in the frame)
+            # and per color position (e.g. different color order or reversed strips) and use whatever needs fewer runs
+            runs = _build_runs(pairs)
+            runs_color = [run for color_pairs in layout for run in _build_runs(sorted(color_pairs))]
+            if len(runs_color) < len(runs):
+                runs = runs_color
+
+            universe._reserve_data(pairs[-1][0] + 1)
+            compiled.append((universe, tuple(runs)))
+
+        self._compiled = tuple(compiled)
+        return self
+
+    def set_frame(self, frame: Any):
+        """Distribute a frame to the universes and mark them as changed.
+
+        :param frame: bytes-like object or any object which supports the buffer protocol with the colors of the
+                      pixels row by row, e.g. a contiguous numpy array with the shape height x width x 3 and dtype uint8
+        """
+        # one copy of the frame: slicing bytes with a step is much faster than slicing a memoryview
+        src = bytes(memoryview(frame).cast('B'))
+        if len(src) != self._frame_size:
+            raise ValueError(f'Frame must have {self._frame_size:d} bytes ({self._width:d}x{self._height:d}x3), '
+                             f'got {len(src):d}!')
+
+        if self._compiled is None:
+            self.compile()
+            assert self._compiled is not None
+
+        for universe, runs in self._compiled:
+            data = universe._data
+            for dst, src_slice in runs:
+                data[dst] = src[src_slice]
+
+            universe._mark_changed()
+        return self
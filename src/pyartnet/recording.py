@@ -0,0 +1,202 @@
+import logging
+from array import array
+from asyncio import get_running_loop, sleep
+from bisect import bisect_left
+from functools import partial
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from typing import Dict, Final, Generator, List, Optional, Tuple, Union
+
+import pyartnet
+from pyartnet.base.clock import monotonic
+from pyartnet.errors import InvalidRecordingError, UniverseNotFoundError
+
+log = logging.getLogger('pyartnet.Recording')
+
+
+# -----------------------------------------------------------------------------
+# File format:
+#   magic
+#   followed by the frames: header (timestamp, node index, universe, size) + universe data
+# -----------------------------------------------------------------------------
+MAGIC: Final = b'PYARTNET-REC\x00\x00\x00\x01'
+FRAME_HEADER: Final = Struct('<dBHH')
+
+
+# noinspection PyProtectedMember
+class FrameRecorder:
+    """Records every universe frame which is sent by the nodes to an append only binary file.
+    The frames are recorded as they are sent, including the master dimmers.
+
+    :param path: path of the file, an existing file will be overwritten
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._file: Final = open(path, 'wb')
+        self._file.write(MAGIC)
+
+        self._start: Final = monotonic()
+        self._nodes: List['pyartnet.base.BaseNode'] = []
+
+    def add_node(self, node: 'pyartnet.base.BaseNode') -> int:
+        """Start recording the frames of a node
+
+        :param node: node
+        :return: index of the node in the recording
+        """
+        if node._record_frame is not None:
+            raise ValueError(f'Node {node._ip}:{node._port} is already recorded!')
+        if len(self._nodes) >= 256:
+            raise ValueError('Can not record more than 256 nodes!')
+
+        index = len(self._nodes)
+        self._nodes.append(node)
+        node._record_frame = partial(self._record, index)
+        return index
+
+    def _record(self, node_index: int, universe: int, data: bytearray):
+        write = self._file.write
+        write(FRAME_HEADER.pack(monotonic() - self._start, node_index, universe, len(data)))
+        write(data)
+
+    def close(self):
+        """Stop recording and close the file"""
+        for node in self._nodes:
+            node._record_frame = None
+        self._nodes.clear()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# noinspection PyProtectedMember
+class FramePlayer:
+    """Plays back a file created by the :class:`FrameRecorder`.
+    The file is memory mapped, only an index with the timestamp and the file position of the frames is kept in memory.
+
+    :param path: path of the recording
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        with open(path, 'rb') as f:
+            self._mmap: Final = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise InvalidRecordingError(f'{path} is not a valid recording!')
+
+        self._times: Final = array('d')
+        self._offsets: Final = array('Q')
+        self._build_index()
+
+    def _build_index(self):
+        buf = self._mmap
+        size = len(buf)
+        header_size = FRAME_HEADER.size
+        unpack_from = FRAME_HEADER.unpack_from
+
+        pos = len(MAGIC)
+        while pos + header_size <= size:
+            timestamp, _, _, data_size = unpack_from(buf, pos)
+            if pos + header_size + data_size > size:
+                # e.g. the recorder was not closed properly
+                log.warning(f'Recording is truncated at position {pos:d}')
+                break
+            self._times.append(timestamp)
+            self._offsets.append(pos)
+            pos += header_size + data_size
+
+    @property
+    def duration(self) -> float:
+        """Duration of the recording in seconds"""
+        return self._times[-1] if self._times else 0.
+
+    def __len__(self):
+        return len(self._times)
+
+    def frames(self, start: float = 0,
+               end: Optional[float] = None) -> Generator[Tuple[float, int, int, memoryview], None, None]:
+        """Iterate over the recorded frames in a time window.
+        The data is a view into the recording and must be released before the player is closed.
+
+        :param start: start time in seconds
+        :param end: end time in seconds
+        :return: timestamp, node index, universe number, universe data
+        """
+        buf = memoryview(self._mmap)
+        header_size = FRAME_HEADER.size
+        unpack_from = FRAME_HEADER.unpack_from
+        times = self._times
+
+        try:
+            for i in range(bisect_left(times, start), len(times)):
+                pos = self._offsets[i]
+                timestamp, node_index, universe, data_size = unpack_from(buf, pos)
+                if end is not None and timestamp > end:
+                    break
+                pos += header_size
+                yield timestamp, node_index, universe, buf[pos: pos + data_size]
+        finally:
+            buf.release()
+
+    async def play(self, *nodes: 'pyartnet.base.BaseNode', start: float = 0, speed: float = 1.):
+        """Play back the recording through the nodes with the recorded timing.
+        Universes which do not exist on the node will be created.
+        The recording already contains the master dimmers, so the masters of the universes and nodes
+        are not applied during playback.
+
+        :param nodes: nodes in the same order as they were added to the recorder
+        :param start: start time in seconds
+        :param speed: playback speed
+        """
+        loop = get_running_loop()
+        play_start = loop.time() - start / speed
+
+        universes: Dict[Tuple[int, int], 'pyartnet.base.BaseUniverse'] = {}
+
+        frames = self.frames(start)
+        data: Optional[memoryview] = None
+        try:
+            for timestamp, node_index, universe_nr, data in frames:
+                delay = play_start + timestamp / speed - loop.time()
+                if delay > 0:
+                    await sleep(delay)
+
+                universe = universes.get((node_index, universe_nr))
+                if universe is None:
+                    node = nodes[node_index]
+                    try:
+                        universe = node.get_universe(universe_nr)
+                    except UniverseNotFoundError:
+                        universe = node.add_universe(universe_nr)
+                    universes[(node_index, universe_nr)] = universe
+                    universe._master_bypass = True
+
+                universe.write_buffer(1, data)
+                data.release()
+                universe.send_data()
+        finally:
+            # e.g. if the playback was cancelled, otherwise the recording can not be closed
+            if data is not None:
+                data.release()
+            frames.close()
+
+            for universe in universes.values():
+                universe._master_bypass = False
+                if universe._master_lut is not None:
+                    universe._mark_changed()
+
+    def close(self):
+        """Close the recording"""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
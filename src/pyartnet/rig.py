@@ -0,0 +1,378 @@
+import json
+import logging
+import pickle
+from hashlib import sha256
+from os import replace
+from pathlib import Path
+from typing import Any, Dict, Final, Mapping, NamedTuple, Optional, Tuple, Type, Union
+
+import pyartnet
+from pyartnet.__version__ import __version__
+from pyartnet.base.channel import ARRAY_TYPE
+from pyartnet.errors import ChannelExistsError, ChannelNotFoundError, ChannelOutOfUniverseError, ChannelWidthError, \
+    DuplicateUniverseError, InvalidRigError, InvalidUniverseAddressError, NodeNotFoundError, OverlappingChannelError
+
+try:
+    import tomllib
+except ImportError:     # Python < 3.11
+    tomllib = None      # type: ignore[assignment]
+
+log = logging.getLogger('pyartnet.Rig')
+
+# increase when the compiled format changes, so old snapshots are not used any more
+SNAPSHOT_VERSION: Final = 1
+
+NODE_TYPES: Final[Dict[str, Type['pyartnet.base.BaseNode']]] = {
+    'artnet': pyartnet.ArtNetNode,
+    'sacn': pyartnet.SacnNode,
+    'kinet': pyartnet.KiNetNode,
+}
+
+# node options and their allowed types
+NODE_OPTIONS: Final[Dict[str, Dict[str, Tuple[type, ...]]]] = {
+    'artnet': {'sequence_counter': (bool, )},
+    'sacn': {'cid': (str, ), 'source_name': (str, )},
+    'kinet': {'portout': (bool, )},
+}
+COMMON_NODE_OPTIONS: Final[Dict[str, Tuple[type, ...]]] = {
+    'max_fps': (int, ),
+    'refresh_every': (int, float),
+    'start_refresh_task': (bool, ),
+    'source_address': (list, ),
+}
+
+# valid universe numbers, same as in _create_universe of the nodes
+UNIVERSE_RANGES: Final[Dict[str, Tuple[int, int]]] = {
+    'artnet': (0, 32767),
+    'sacn': (1, 63998),
+    'kinet': (0, 32767),
+    'kinet_portout': (1, 255),
+}
+
+OUTPUT_CORRECTIONS: Final = {
+    'linear': pyartnet.output_correction.linear,
+    'quadratic': pyartnet.output_correction.quadratic,
+    'cubic': pyartnet.output_correction.cubic,
+    'quadruple': pyartnet.output_correction.quadruple,
+}
+
+
+# name, start, width, byte size, byte order, output correction, intensity
+# plain tuples are used because they are much faster to unpickle than named tuples
+ChannelSpec = Tuple[str, int, int, int, str, Optional[str], bool]
+
+
+class UniverseSpec(NamedTuple):
+    nr: int
+    output_correction: Optional[str]
+    channels: Tuple[ChannelSpec, ...]
+
+
+class NodeSpec(NamedTuple):
+    name: str
+    type: str
+    ip: str
+    port: int
+    options: Tuple[Tuple[str, Any], ...]
+    output_correction: Optional[str]
+    universes: Tuple[UniverseSpec, ...]
+
+
+# noinspection PyProtectedMember
+class Rig:
+    """Nodes, universes and channels which were created from a rig description.
+    Channels are addressed with ``node name/universe/channel name``."""
+
+    def __init__(self, nodes: Dict[str, 'pyartnet.base.BaseNode'], channels: Dict[str, 'pyartnet.base.Channel']):
+        self._nodes: Final = nodes
+        self._channels: Final = channels
+
+    @property
+    def nodes(self) -> Tuple['pyartnet.base.BaseNode', ...]:
+        return tuple(self._nodes.values())
+
+    def get_node(self, name: str) -> 'pyartnet.base.BaseNode':
+        """Return a node by name or raise an exception
+
+        :param name: name of the node
+        """
+        try:
+            return self._nodes[name]
+        except KeyError:
+            raise NodeNotFoundError(f'Node "{name}" not found in the rig!') from None
+
+    def get_channel(self, path: str) -> 'pyartnet.base.Channel':
+        """Return a channel or raise an exception
+
+        :param path: ``node name/universe/channel name``, e.g. ``stage/0/dimmer``
+        """
+        try:
+            return self._channels[path]
+        except KeyError:
+            raise ChannelNotFoundError(f'Channel "{path}" not found in the rig!') from None
+
+    def __getitem__(self, path: str) -> 'pyartnet.base.Channel':
+        return self.get_channel(path)
+
+    def __len__(self):
+        return len(self._channels)
+
+
+# noinspection PyProtectedMember
+class CompiledRig:
+    """Validated rig description which can be cached and from which the nodes are created
+
+    :param nodes: compiled nodes
+    """
+
+    def __init__(self, nodes: Tuple[NodeSpec, ...]):
+        self.nodes: Final = nodes
+
+    def create(self) -> Rig:
+        """Create the nodes, universes and channels"""
+        nodes: Dict[str, 'pyartnet.base.BaseNode'] = {}
+        channels: Dict[str, 'pyartnet.base.Channel'] = {}
+
+        for node_spec in self.nodes:
+            node = NODE_TYPES[node_spec.type](node_spec.ip, node_spec.port, **dict(node_spec.options))
+            if node_spec.output_correction is not None:
+                node.set_output_correction(OUTPUT_CORRECTIONS[node_spec.output_correction])
+            nodes[node_spec.name] = node
+
+            for universe_spec in node_spec.universes:
+                universe = node.add_universe(universe_spec.nr)
+                if universe_spec.output_correction is not None:
+                    universe.set_output_correction(OUTPUT_CORRECTIONS[universe_spec.output_correction])
+
+                specs = universe_spec.channels
+                created = universe._add_channels(spec[:5] for spec in specs)  # type: ignore[misc]
+
+                intensity = False
+                prefix = f'{node_spec.name:s}/{universe_spec.nr:d}/'
+                for spec, channel in zip(specs, created):
+                    name, _, _, _, _, correction, channel_intensity = spec
+                    if correction is not None:
+                        channel.set_output_correction(OUTPUT_CORRECTIONS[correction])
+                    if channel_intensity:
+                        channel._intensity = intensity = True
+                    channels[prefix + name] = channel
+                if intensity:
+                    universe._update_intensity()
+
+        return Rig(nodes, channels)
+
+
+def compile_rig(config: Mapping[str, Any]) -> CompiledRig:
+    """Validate a rig description and compile it
+
+    :param config: parsed rig description
+    """
+    _check_type(config, dict, 'rig')
+    _check_keys(config, ('nodes', ), 'rig')
+
+    nodes = []
+    names = set()
+    for i, obj in enumerate(_get(config, 'nodes', list, 'rig')):
+        node = _compile_node(obj, f'nodes[{i:d}]')
+        if node.name in names:
+            raise InvalidRigError(f'nodes[{i:d}]: Node "{node.name:s}" does already exist!')
+        names.add(node.name)
+        nodes.append(node)
+    return CompiledRig(tuple(nodes))
+
+
+def load_rig(path: Union[str, Path], cache_dir: Union[str, Path, None] = None) -> Rig:
+    """Load a rig description (``.json`` or ``.toml``) and create the nodes, universes and channels.
+    If a cache directory is passed the compiled rig is stored there as a snapshot and
+    as long as the file does not change the snapshot is used instead of validating the description again.
+    Only use a cache directory which can not be written by others, since the snapshots are pickled.
+
+    :param path: path of the rig description
+    :param cache_dir: directory for the compiled snapshots
+    """
+    path = Path(path)
+    content = path.read_bytes()
+
+    if cache_dir is None:
+        return compile_rig(_parse(path, content)).create()
+
+    key = sha256(content + f'|{SNAPSHOT_VERSION:d}|{__version__:s}'.encode()).hexdigest()
+    snapshot = Path(cache_dir) / f'{key:s}.rig'
+
+    compiled: Optional[CompiledRig] = None
+    if snapshot.is_file():
+        try:
+            with snapshot.open('rb') as file:
+                compiled = pickle.load(file)
+        except Exception as e:
+            log.warning(f'Could not load snapshot {snapshot}: {e}')
+        if not isinstance(compiled, CompiledRig):
+            compiled = None
+
+    if compiled is not None:
+        return compiled.create()
+
+    compiled = compile_rig(_parse(path, content))
+    rig = compiled.create()
+
+    # only store rigs which could be created
+    snapshot.parent.mkdir(parents=True, exist_ok=True)
+    tmp = snapshot.with_suffix('.tmp')
+    with tmp.open('wb') as file:
+        pickle.dump(compiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+    replace(tmp, snapshot)
+    return rig
+
+
+def _parse(path: Path, content: bytes) -> Any:
+    suffix = path.suffix.lower()
+    try:
+        if suffix == '.json':
+            return json.loads(content)
+        if suffix == '.toml':
+            if tomllib is None:
+                raise InvalidRigError('TOML rig descriptions require Python 3.11 or newer!')
+            return tomllib.loads(content.decode('utf-8'))
+    except ValueError as e:
+        raise InvalidRigError(f'Could not parse {path.name:s}: {e}') from None
+    raise InvalidRigError(f'Rig description must be a .json or .toml file: {path.name:s}')
+
+
+# -----------------------------------------------------------------------------
+# Validation
+# -----------------------------------------------------------------------------
+_MISSING: Final = object()
+
+
+def _check_type(value: Any, types: Union[type, Tuple[type, ...]], path: str):
+    if not isinstance(types, tuple):
+        types = (types, )
+    # bool is a subclass of int
+    if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+        expected = ' or '.join(t.__name__ for t in types)
+        raise InvalidRigError(f'{path:s}: Expected {expected:s} but got {value!r}!')
+
+
+def _check_keys(obj: Mapping[str, Any], allowed, path: str):
+    for key in obj:
+        if key not in allowed:
+            raise InvalidRigError(f'{path:s}: Unknown entry "{key}"!')
+
+
+def _get(obj: Mapping[str, Any], key: str, types: Union[type, Tuple[type, ...]], path: str,
+         default: Any = _MISSING) -> Any:
+    if key not in obj:
+        if default is _MISSING:
+            raise InvalidRigError(f'{path:s}: "{key:s}" is missing!')
+        return default
+
+    value = obj[key]
+    _check_type(value, types, f'{path:s}.{key:s}')
+    return value
+
+
+def _get_correction(obj: Mapping[str, Any], path: str) -> Optional[str]:
+    name = _get(obj, 'output_correction', str, path, None)
+    if name is not None and name not in OUTPUT_CORRECTIONS:
+        raise InvalidRigError(
+            f'{path:s}.output_correction: Must be one of {", ".join(OUTPUT_CORRECTIONS):s}: {name:s}')
+    return name
+
+
+def _compile_node(obj: Any, path: str) -> NodeSpec:
+    _check_type(obj, dict, path)
+
+    node_type = _get(obj, 'type', str, path)
+    if node_type not in NODE_TYPES:
+        raise InvalidRigError(f'{path:s}.type: Must be one of {", ".join(NODE_TYPES):s}: {node_type:s}')
+
+    option_types = {**COMMON_NODE_OPTIONS, **NODE_OPTIONS[node_type]}
+    _check_keys(obj, ('name', 'type', 'ip', 'port', 'output_correction', 'universes', *option_types), path)
+
+    ip = _get(obj, 'ip', str, path)
+    port = _get(obj, 'port', int, path)
+    if not 0 < port <= 65535:
+        raise InvalidRigError(f'{path:s}.port: Must be 1..65535: {port:d}')
+    name = _get(obj, 'name', str, path, f'{ip:s}:{port:d}')
+
+    options: Dict[str, Any] = {}
+    for key, types in option_types.items():
+        if key not in obj:
+            continue
+        value = _get(obj, key, types, path)
+        if key == 'source_address':
+            if len(value) != 2 or not isinstance(value[0], str) or not isinstance(value[1], int):
+                raise InvalidRigError(f'{path:s}.source_address: Expected [host, port] but got {value!r}!')
+            value = (value[0], value[1])
+        elif key == 'cid':
+            try:
+                value = bytes.fromhex(value)
+            except ValueError:
+                value = b''
+            if len(value) != 16:
+                raise InvalidRigError(f'{path:s}.cid: Expected 16 bytes as hex string!')
+        options[key] = value
+
+    universe_range = UNIVERSE_RANGES['kinet_portout' if options.get('portout') else node_type]
+
+    universes = []
+    numbers = set()
+    for i, universe_obj in enumerate(_get(obj, 'universes', list, path, [])):
+        universe = _compile_universe(universe_obj, f'{path:s}.universes[{i:d}]', universe_range)
+        if universe.nr in numbers:
+            raise DuplicateUniverseError(f'{path:s}.universes[{i:d}]: Universe {universe.nr:d} does already exist!')
+        numbers.add(universe.nr)
+        universes.append(universe)
+
+    return NodeSpec(name, node_type, ip, port, tuple(options.items()), _get_correction(obj, path), tuple(universes))
+
+
+def _compile_universe(obj: Any, path: str, universe_range: Tuple[int, int]) -> UniverseSpec:
+    _check_type(obj, dict, path)
+    _check_keys(obj, ('nr', 'output_correction', 'channels'), path)
+
+    nr = _get(obj, 'nr', int, path)
+    nr_min, nr_max = universe_range
+    if not nr_min <= nr <= nr_max:
+        raise InvalidUniverseAddressError(f'{path:s}.nr: Universe must be {nr_min:d}..{nr_max:d}: {nr:d}')
+
+    channels = [_compile_channel(c, f'{path:s}.channels[{i:d}]')
+                for i, c in enumerate(_get(obj, 'channels', list, path, []))]
+
+    names = set()
+    for channel in channels:
+        if channel[0] in names:
+            raise ChannelExistsError(f'{path:s}: Channel "{channel[0]:s}" does already exist in the universe!')
+        names.add(channel[0])
+
+    # sorted by start, so only neighbours have to be checked
+    prev_name, prev_stop = '', 0
+    for name, start, width, byte_size, *_ in sorted(channels, key=lambda c: c[1]):
+        if start <= prev_stop:
+            raise OverlappingChannelError(f'{path:s}: Channel {name:s} is overlapping with channel {prev_name:s}!')
+        prev_name, prev_stop = name, start + width * byte_size - 1
+
+    return UniverseSpec(nr, _get_correction(obj, path), tuple(channels))
+
+
+def _compile_channel(obj: Any, path: str) -> ChannelSpec:
+    _check_type(obj, dict, path)
+    _check_keys(obj, ('name', 'start', 'width', 'byte_size', 'byte_order', 'output_correction', 'intensity'), path)
+
+    start = _get(obj, 'start', int, path)
+    width = _get(obj, 'width', int, path, 1)
+    byte_size = _get(obj, 'byte_size', int, path, 1)
+    byte_order = _get(obj, 'byte_order', str, path, 'little')
+
+    if width <= 0:
+        raise ChannelWidthError(f'{path:s}.width: Channel width must be > 0: {width:d}')
+    if byte_size not in ARRAY_TYPE:
+        raise InvalidRigError(f'{path:s}.byte_size: Must be {", ".join(map(str, ARRAY_TYPE))}: {byte_size:d}')
+    if byte_order not in ('big', 'little'):
+        raise InvalidRigError(f'{path:s}.byte_order: Must be "big" or "little": {byte_order:s}')
+    if start < 1 or start + width * byte_size - 1 > 512:
+        raise ChannelOutOfUniverseError(
+            f'{path:s}: Channel out of universe (1..512): start: {start:d} width: {width:d} * {byte_size:d}bytes')
+
+    return (_get(obj, 'name', str, path, f'{start:d}/{width:d}'), start, width, byte_size, byte_order,
+            _get_correction(obj, path), _get(obj, 'intensity', bool, path, False))
@@ -0,0 +1,211 @@
+import logging
+from asyncio import sleep
+from mmap import mmap
+from pathlib import Path
+from struct import Struct
+from typing import Dict, Final, List, Optional, Tuple, Union
+
+import pyartnet
+from pyartnet.base.background_task import SimpleBackgroundTask
+
+log = logging.getLogger('pyartnet.State')
+
+
+# -----------------------------------------------------------------------------
+# File format:
+#   magic + header (slot count, slot size)
+#   followed by the slots: slot header (node, universe, size) + universe data [+ raw channel values]
+# -----------------------------------------------------------------------------
+MAGIC: Final = b'PYARTNET-STATE\x00\x01'
+HEADER: Final = Struct('<HH')
+SLOT_HEADER: Final = Struct('<62sHH')
+SLOT_GROW: Final = 16
+
+
+# noinspection PyProtectedMember
+class StateStore:
+    """Periodically saves the universe buffers to a memory mapped file and restores them when a node is added,
+    so a restart of the application does not black out the fixtures.
+    A checkpoint only copies the universe buffers into the mapped memory, writing the file is done by the OS.
+
+    :param path: path of the file, it will be created if it does not exist
+    :param interval: time in seconds between two checkpoints
+    :param channel_values: also save and restore the (uncorrected) values of the channels,
+                           so e.g. fades continue from the restored values.
+                           The channel values are encoded with every checkpoint.
+    """
+
+    def __init__(self, path: Union[str, Path], interval: float = 1, channel_values: bool = False):
+        if interval <= 0:
+            raise ValueError('Interval must be > 0!')
+
+        self._interval: Final = interval
+        self._channel_values: Final = channel_values
+        self._slot_size: Final = SLOT_HEADER.size + (1024 if channel_values else 512)
+
+        self._nodes: List['pyartnet.base.BaseNode'] = []
+        self._slots: Dict[Tuple[bytes, int], int] = {}
+        self._slot_count: int = 0
+
+        self._file: Final = open(path, 'a+b')
+        self._map: Optional[mmap] = None
+        self._load()
+
+        self._task: Final = SimpleBackgroundTask(self._checkpoint_worker, 'State checkpoint')
+
+    def _load(self):
+        file = self._file
+        file.seek(0)
+        header = file.read(len(MAGIC) + HEADER.size)
+
+        count = 0
+        if header[:len(MAGIC)] == MAGIC:
+            count, slot_size = HEADER.unpack_from(header, len(MAGIC))
+            if slot_size != self._slot_size:
+                log.warning(f'State file was saved with a different layout and is discarded: {file.name}')
+                count = 0
+
+        self._slot_count = count
+        self._resize(count)
+
+        mem = self._map
+        assert mem is not None
+        for i in range(count):
+            node_key, universe, _ = SLOT_HEADER.unpack_from(mem, self._slot_offset(i))
+            self._slots[(node_key.rstrip(b'\x00'), universe)] = i
+
+    def _slot_offset(self, slot: int) -> int:
+        return len(MAGIC) + HEADER.size + slot * self._slot_size
+
+    def _resize(self, count: int):
+        if self._map is not None:
+            self._map.close()
+
+        self._file.truncate(self._slot_offset(count))
+        self._map = mem = mmap(self._file.fileno(), self._slot_offset(count))
+        mem[:len(MAGIC)] = MAGIC
+        HEADER.pack_into(mem, len(MAGIC), self._slot_count, self._slot_size)
+
+    def _get_slot(self, node_key: bytes, universe: int) -> int:
+        slot = self._slots.get((node_key, universe))
+        if slot is not None:
+            return slot
+
+        slot = self._slot_count
+        if self._slot_offset(slot + 1) > len(self._map):    # type: ignore[arg-type]
+            self._resize(slot + SLOT_GROW)
+
+        mem = self._map
+        assert mem is not None
+        self._slot_count += 1
+        self._slots[(node_key, universe)] = slot
+        HEADER.pack_into(mem, len(MAGIC), self._slot_count, self._slot_size)
+        SLOT_HEADER.pack_into(mem, self._slot_offset(slot), node_key, universe, 0)
+        return slot
+
+    @staticmethod
+    def _node_key(node: 'pyartnet.base.BaseNode') -> bytes:
+        return f'{node._ip:s}:{node._port:d}'.encode()[:62]
+
+    def add_node(self, node: 'pyartnet.base.BaseNode'):
+        """Restore the saved state of the universes of the node and save them with every checkpoint.
+        Add the node after the universes and channels were created and before the first frame is sent.
+
+        :param node: node
+        """
+        if node in self._nodes:
+            raise ValueError(f'Node {node._ip}:{node._port} is already added!')
+
+        node_key = self._node_key(node)
+        for universe in node._universes:
+            slot = self._slots.get((node_key, universe._universe))
+            if slot is not None:
+                self._restore(universe, slot)
+
+        self._nodes.append(node)
+        self._task.start()
+        return self
+
+    def _restore(self, universe: 'pyartnet.base.BaseUniverse', slot: int):
+        mem = self._map
+        assert mem is not None
+
+        offset = self._slot_offset(slot)
+        _, _, size = SLOT_HEADER.unpack_from(mem, offset)
+        if not size:
+            return None
+        offset += SLOT_HEADER.size
+
+        # the layout of the channels might have changed
+        if universe._channels:
+            size = min(size, universe._data_size)
+        view = memoryview(mem)
+        try:
+            universe.write_buffer(1, view[offset: offset + size])
+
+            if not self._channel_values:
+                return None
+
+            raw = view[offset + 512: offset + 512 + size]
+            for channel in universe._channels.values():
+                start = channel._buf_start
+                byte_size = channel._byte_size
+                stop = start + channel._width * byte_size
+                if stop > size:
+                    continue
+                if byte_size == 1:
+                    channel.set_values(raw[start: stop])
+                else:
+                    channel.set_values([int.from_bytes(raw[i: i + byte_size], channel._byte_order)
+                                        for i in range(start, stop, byte_size)])
+        finally:
+            view.release()
+
+        log.debug(f'Restored universe {universe._universe:d} of {universe._node._ip}:{universe._node._port}')
+
+    def checkpoint(self):
+        """Save the current state of all universes"""
+        mem = self._map
+        if mem is None:
+            return None
+
+        for node in self._nodes:
+            node_key = self._node_key(node)
+            for universe in node._universes:
+                slot = self._get_slot(node_key, universe._universe)
+                mem = self._map
+                assert mem is not None
+
+                size = universe._data_size
+                offset = self._slot_offset(slot)
+                SLOT_HEADER.pack_into(mem, offset, node_key, universe._universe, size)
+                offset += SLOT_HEADER.size
+
+                data = universe._data
+                if mem[offset: offset + size] != data:
+                    mem[offset: offset + size] = data
+
+                # with an output correction different channel values can result in the same output
+                if self._channel_values:
+                    raw = bytearray(size)
+                    for channel in universe._channels.values():
+                        channel._to_buffer(channel._values_raw, raw)
+                    if mem[offset + 512: offset + 512 + size] != raw:
+                        mem[offset + 512: offset + 512 + size] = raw
+
+    async def _checkpoint_worker(self):
+        while self._map is not None:
+            await sleep(self._interval)
+            self.checkpoint()
+
+    def close(self):
+        """Save a last checkpoint, write the file and close it"""
+        self._task.cancel()
+        if self._map is None:
+            return None
+
+        self.checkpoint()
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        self._file.close()
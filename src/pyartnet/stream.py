@@ -0,0 +1,156 @@
+import logging
+from asyncio import Event, sleep
+from typing import Any, AsyncIterable, Final, Literal, Sequence, Union
+
+import pyartnet
+from pyartnet.base import ProcessJob
+from pyartnet.base.background_task import SimpleBackgroundTask
+from pyartnet.errors import PyArtNetError
+
+log = logging.getLogger('pyartnet.Stream')
+
+TYPE_TARGET = Union['pyartnet.base.BaseUniverse', 'pyartnet.base.Channel', Sequence['pyartnet.base.Channel']]
+
+
+# noinspection PyProtectedMember
+class FrameStream:
+    """Streams frames from an async iterator (e.g. an async generator) to a universe or channels.
+    The node takes one frame every time it processes its frame, so production and output stay in sync
+    without additional timers. If the producer is too slow the last frame is kept.
+    An invalid frame stops the stream, the other jobs of the node keep running.
+
+    Frames for a universe are bytes-like objects which are written starting at address 1,
+    frames for a channel are the channel values and frames for multiple channels are the values for every channel.
+
+    :param source: async iterator which produces the frames
+    :param target: universe, channel or sequence of channels
+    :param policy: what happens if the producer is faster than the node:
+                   ``block`` pulls the next frame only when the previous frame was taken,
+                   ``latest`` replaces a frame which was not yet taken and
+                   ``drop`` drops new frames until the pending frame was taken
+    """
+
+    def __init__(self, source: AsyncIterable[Any], target: TYPE_TARGET,
+                 policy: Literal['block', 'latest', 'drop'] = 'block'):
+        if policy not in ('block', 'latest', 'drop'):
+            raise ValueError(f'Policy must be "block", "latest" or "drop": {policy}')
+
+        if isinstance(target, pyartnet.base.BaseUniverse):
+            node = target._node
+        elif isinstance(target, pyartnet.base.Channel):
+            node = target._parent_node
+        else:
+            target = tuple(target)
+            if not target:
+                raise ValueError('No channels specified!')
+            node = target[0]._parent_node
+            if any(c._parent_node is not node for c in target):
+                raise ValueError('All channels must belong to the same node!')
+
+        self._source: Final = source
+        self._target: Final = target
+        self._node: Final = node
+        self._policy: Final = policy
+
+        self._frame: Any = None
+        self._pending: bool = False
+        self._taken: Final = Event()
+        self._taken.set()
+        self._finished: bool = False
+
+        # frames which were replaced or dropped because the producer was too fast
+        self.dropped_frames: int = 0
+
+        self._task: Final = SimpleBackgroundTask(self._produce, 'FrameStream')
+        self._task.start()
+        self._job: Final = StreamJob(self)
+        node._process_jobs.append(self._job)
+        node._process_task.start()
+
+    async def _produce(self):
+        iterator = self._source.__aiter__()
+        block = self._policy == 'block'
+        try:
+            while True:
+                if block:
+                    await self._taken.wait()
+
+                try:
+                    frame = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+
+                if self._pending:
+                    self.dropped_frames += 1
+                    if self._policy == 'drop':
+                        await sleep(0)
+                        continue
+
+                self._frame = frame
+                self._pending = True
+                self._taken.clear()
+
+                if not block:
+                    # a producer which never awaits must not block the event loop
+                    await sleep(0)
+        finally:
+            self._finished = True
+
+    def _apply(self, frame: Any):
+        target = self._target
+        if isinstance(target, pyartnet.base.BaseUniverse):
+            target.write_buffer(1, frame)
+        elif isinstance(target, pyartnet.base.Channel):
+            target.set_values(frame)
+        else:
+            if len(frame) != len(target):
+                raise ValueError(f'Expected values for {len(target):d} channels but got {len(frame):d}!')
+            for channel, values in zip(target, frame):
+                channel.set_values(values)
+
+    def stop(self):
+        """Stop the stream"""
+        self._task.cancel()
+        self._finished = True
+        self._pending = False
+        self._job.stop()
+
+    def __await__(self):
+        """Wait until the source is exhausted and all frames were sent"""
+        yield from self._job.event.wait().__await__()
+
+
+# noinspection PyProtectedMember
+class StreamJob(ProcessJob):
+    def __init__(self, stream: FrameStream):
+        super().__init__()
+        self.stream: Final = stream
+
+    def process(self):
+        stream = self.stream
+        if stream._pending:
+            stream._pending = False
+            frame = stream._frame
+            stream._frame = None
+            stream._taken.set()
+            try:
+                stream._apply(frame)
+            except (ValueError, TypeError, PyArtNetError) as e:
+                # the error must not stop the process task of the node
+                log.error(f'Invalid frame, stream is stopped: {e}')
+                stream._task.cancel()
+                stream._finished = True
+                self.is_done = True
+            return None
+
+        if stream._finished:
+            self.is_done = True
+
+    def stop(self):
+        jobs = self.stream._node._process_jobs
+        if self in jobs:
+            jobs.remove(self)
+        self.event.set()
+
+    def fade_complete(self):
+        self.event.set()
@@ -0,0 +1,193 @@
+from array import array
+from bisect import bisect_right
+from math import isnan, nan
+from typing import Collection, Dict, Final, List, Mapping, Optional, Tuple, Union
+
+import pyartnet
+from pyartnet.base import ProcessJob
+from pyartnet.base.clock import monotonic
+from pyartnet.errors import ChannelValueOutOfBoundsError, ValueCountDoesNotMatchChannelWidthError
+
+
+# noinspection PyProtectedMember
+class Timeline:
+    """A show which is compiled to keyframe arrays for every channel.
+    The values are interpolated linearly between the keyframes and the timeline is evaluated directly
+    in the frame loop of the nodes, so there is no task or callback per step or per sequence.
+
+    :param loop: restart the timeline from the beginning when it is finished
+    """
+
+    def __init__(self, loop: bool = False):
+        self._loop: Final = loop
+
+        self._keyframes: Dict['pyartnet.base.Channel', List[Tuple[float, Optional[Tuple[float, ...]]]]] = {}
+        self._cue_end: float = 0
+        self._duration: float = 0
+
+        # compiled tracks: channel, times in ms, flattened values (nan -> value of the channel on start)
+        self._tracks: Optional[Tuple[Tuple['pyartnet.base.Channel', array, array], ...]] = None
+        self._jobs: List['TimelineJob'] = []
+
+    @property
+    def duration(self) -> float:
+        """Duration of the timeline in ms"""
+        return self._duration
+
+    def add_keyframe(self, channel: 'pyartnet.base.Channel', time_ms: float,
+                     values: Optional[Collection[Union[int, float]]]):
+        """Add a keyframe for a channel. Before the first keyframe the channel fades from
+        the value it has when the timeline is started.
+
+        :param channel: channel
+        :param time_ms: time of the keyframe in ms
+        :param values: values of the channel or ``None`` to hold the values of the previous keyframe
+        """
+        if time_ms < 0:
+            raise ValueError('Keyframe time must be >= 0!')
+
+        if values is not None:
+            if len(values) != channel._width:
+                raise ValueCountDoesNotMatchChannelWidthError(
+                    f'Not enough values specified, expected {channel._width} but got {len(values)}!')
+            for val in values:
+                if not 0 <= val <= channel._value_max:
+                    raise ChannelValueOutOfBoundsError(
+                        f'Keyframe value out of bounds! 0 <= {val} <= {channel._value_max}')
+            values = tuple(values)
+
+        self._keyframes.setdefault(channel, []).append((time_ms, values))
+        self._duration = max(self._duration, time_ms)
+        self._tracks = None
+        return self
+
+    def add_cue(self, values: Mapping['pyartnet.base.Channel', Collection[Union[int, float]]],
+                fade_ms: float = 0, hold_ms: float = 0):
+        """Add a cue after the previous cue. The channels crossfade from the values of the previous cue
+        to the new values and then hold the values.
+
+        :param values: target values for the channels
+        :param fade_ms: fade time in ms
+        :param hold_ms: hold time in ms after the fade
+        """
+        start = self._cue_end
+        for channel, channel_values in values.items():
+            self.add_keyframe(channel, start, None)
+            self.add_keyframe(channel, start + fade_ms, channel_values)
+
+        self._cue_end = start + fade_ms + hold_ms
+        self._duration = max(self._duration, self._cue_end)
+        return self
+
+    def compile(self):
+        """Compile the keyframes. This is done automatically when the timeline is started."""
+        tracks = []
+        for channel, keyframes in self._keyframes.items():
+            times = array('d')
+            values = array('d')
+
+            start_values = (nan, ) * channel._width
+            prev = start_values
+            if min(t for t, _ in keyframes) > 0:
+                times.append(0)
+                values.extend(start_values)
+
+            for time_ms, keyframe_values in sorted(keyframes, key=lambda x: x[0]):
+                if keyframe_values is None:
+                    keyframe_values = prev
+                times.append(time_ms)
+                values.extend(keyframe_values)
+                prev = keyframe_values
+
+            tracks.append((channel, times, values))
+
+        self._tracks = tuple(tracks)
+        return self
+
+    def start(self):
+        """Start the timeline. If it is already running it will be restarted."""
+        self.stop()
+        if self._tracks is None:
+            self.compile()
+            assert self._tracks is not None
+
+        nodes: Dict['pyartnet.base.BaseNode', List[Tuple['pyartnet.base.Channel', array, array]]] = {}
+        for channel, times, values in self._tracks:
+            # replace placeholders with the current values
+            if any(isnan(v) for v in values):
+                values = array('d', values)
+                width = channel._width
+                for i, val in enumerate(values):
+                    if isnan(val):
+                        values[i] = channel._values_raw[i % width]
+            nodes.setdefault(channel._parent_node, []).append((channel, times, values))
+
+        start = monotonic()
+        for node, tracks in nodes.items():
+            job = TimelineJob(self, tracks, start)
+            self._jobs.append(job)
+            node._process_jobs.append(job)
+            node._process_task.start()
+        return self
+
+    def stop(self):
+        """Stop the timeline"""
+        for job in self._jobs:
+            job.cancel()
+        self._jobs.clear()
+
+    def __await__(self):
+        for job in tuple(self._jobs):
+            yield from job.event.wait().__await__()
+
+
+# noinspection PyProtectedMember
+class TimelineJob(ProcessJob):
+    def __init__(self, timeline: Timeline, tracks: List[Tuple['pyartnet.base.Channel', array, array]], start: float):
+        super().__init__()
+        self.timeline: Optional[Timeline] = timeline
+        self.node: Final = tracks[0][0]._parent_node
+        self.tracks: Final = tracks
+        self.start: Final = start
+        self.duration: Final = timeline._duration
+        self.loop: Final = timeline._loop
+
+    def process(self):
+        now = (monotonic() - self.start) * 1000
+        if now >= self.duration:
+            if self.loop and self.duration > 0:
+                now %= self.duration
+            else:
+                now = self.duration
+                self.is_done = True
+
+        for channel, times, values in self.tracks:
+            width = channel._width
+            pos = bisect_right(times, now) - 1
+
+            # hold the last value
+            if pos >= len(times) - 1:
+                start = pos * width
+                channel.set_values(values[start: start + width])
+                continue
+
+            t_a = times[pos]
+            factor = (now - t_a) / (times[pos + 1] - t_a)
+            start = pos * width
+            stop = start + width
+            channel.set_values([a + (b - a) * factor for a, b in zip(values[start: stop], values[stop: stop + width])])
+
+    def cancel(self):
+        if self.timeline is None:
+            return None
+        self.timeline = None
+        self.event.set()
+        if self in self.node._process_jobs:
+            self.node._process_jobs.remove(self)
+
+    def fade_complete(self):
+        self.timeline = None
+        self.event.set()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__:s} tracks={len(self.tracks):d}, is_done={self.is_done}>'
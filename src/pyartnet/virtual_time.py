@@ -0,0 +1,65 @@
+import selectors
+from asyncio import all_tasks, gather, SelectorEventLoop
+from time import monotonic
+from typing import Coroutine, List, Optional, Tuple, TypeVar
+
+_T = TypeVar('_T')
+
+
+class VirtualTimeSelector(selectors.DefaultSelector):
+    """Selector which does not wait for a timeout but advances the virtual time instead"""
+
+    def __init__(self, start: float):
+        super().__init__()
+        self.time: float = start
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        ready = super().select(0)
+        if ready or timeout is not None and timeout <= 0:
+            return ready
+
+        # nothing is scheduled so we can only wait for io
+        if timeout is None:
+            return super().select(None)
+
+        self.time += timeout
+        return ready
+
+
+class VirtualTimeEventLoop(SelectorEventLoop):
+    """Event loop with a virtual clock. When there is nothing to do the clock advances instantly to the next
+    scheduled callback (e.g. the end of a sleep), so e.g. a show of 30 minutes can be rendered in a few seconds
+    and timing results are reproducible.
+
+    :param start: start time of the virtual clock, default is the current system time
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        self._virtual_selector = selector = VirtualTimeSelector(monotonic() if start is None else start)
+        super().__init__(selector)
+
+    def time(self) -> float:
+        return self._virtual_selector.time
+
+
+def run_virtual_time(main: Coroutine[None, None, _T], start: Optional[float] = None) -> _T:
+    """Run the coroutine in a new :class:`VirtualTimeEventLoop` (like :func:`asyncio.run`)
+
+    :param main: coroutine
+    :param start: start time of the virtual clock, default is the current system time
+    :return: return value of the coroutine
+    """
+    loop = VirtualTimeEventLoop(start)
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            # cancel e.g. the refresh tasks of the nodes
+            tasks = all_tasks(loop)
+            if tasks:
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
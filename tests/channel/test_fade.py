@@ -1,5 +1,6 @@
 import asyncio
 from time import monotonic
+from unittest.mock import Mock
 
 from pyartnet.base import BaseUniverse
 from pyartnet.base.channel import Channel
@@ -152,3 +153,30 @@ async def test_up_down_fade(node: TestingNode, universe: BaseUniverse, caplog):
 
         assert a.get_values() == [0]
         assert node.data == ['80', 'ff', '80', '00']
+
+
+async def test_fade_queue(node: TestingNode, universe: BaseUniverse, caplog):
+    a = Channel(universe, 1, 1)
+    a.callback_fade_finished = finished = Mock()
+
+    # starts immediately
+    a.queue_fade([2], 2 * STEP_MS)
+    assert a._current_fade is not None
+    assert not a._fade_queue
+
+    a.queue_fade([0], 2 * STEP_MS)
+    a.queue_fade([4], 2 * STEP_MS)
+    assert len(a._fade_queue) == 2
+
+    assert await a
+    assert a.get_values() == [4]
+    assert node.data == ['01', '02', '01', '00', '02', '04']
+    finished.assert_called_once_with(a)
+
+    # set_fade removes queued fades
+    a.queue_fade([0], 2 * STEP_MS)
+    a.queue_fade([255], 2 * STEP_MS)
+    a.set_fade([2], 2 * STEP_MS)
+    assert not a._fade_queue
+    await a
+    assert a.get_values() == [2]
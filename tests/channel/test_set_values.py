@@ -1,5 +1,11 @@
+from array import array
+
+import pytest
+
 from pyartnet.base import BaseUniverse
 from pyartnet.base.channel import Channel
+from pyartnet.errors import ChannelValueOutOfBoundsError, ValueCountDoesNotMatchChannelWidthError
+from pyartnet.output_correction import quadratic
 from tests.conftest import TestingNode
 
 
@@ -18,3 +24,56 @@ async def test_channel_set_values(node: TestingNode, universe: BaseUniverse, cap
 
     await node.sleep_steps(1)
     assert node.data == ['ff', '7d']
+
+
+@pytest.mark.parametrize('byte_size', (1, 2, 3))
+@pytest.mark.parametrize('correction', (None, quadratic))
+@pytest.mark.parametrize('type_code', ('B', 'H', 'i', 'Q'))
+async def test_channel_set_values_buffer(universe: BaseUniverse, byte_size, correction, type_code):
+    values = [0, 1, 17, 128, 255]
+
+    a = universe.add_channel(1, 5, byte_size=byte_size)
+    b = universe.add_channel(50, 5, byte_size=byte_size)
+    universe.set_output_correction(correction)
+
+    a.set_values(values)
+    b.set_values(array(type_code, values))
+    assert a.get_values() == b.get_values()
+    assert a._values_act == b._values_act
+    assert a._values_raw.typecode == b._values_raw.typecode
+
+    # memoryview
+    b.set_values(memoryview(array(type_code, values[::-1])))
+    assert b.get_values() == values[::-1]
+
+
+async def test_channel_set_values_buffer_bounds(universe: BaseUniverse):
+    a = universe.add_channel(1, 3)
+
+    with pytest.raises(ChannelValueOutOfBoundsError) as e:
+        a.set_values(array('h', [0, -1, 5]))
+    assert str(e.value) == 'Channel value out of bounds! 0 <= -1 <= 255'
+
+    with pytest.raises(ChannelValueOutOfBoundsError) as e:
+        a.set_values(array('H', [0, 256, 5]))
+    assert str(e.value) == 'Channel value out of bounds! 0 <= 256 <= 255'
+
+    with pytest.raises(ValueCountDoesNotMatchChannelWidthError):
+        a.set_values(array('B', [0, 1]))
+
+    # floats are processed like a list
+    a.set_values(array('d', [0.2, 1.4, 254.6]))
+    assert a.get_values() == [0, 1, 255]
+
+
+async def test_channel_set_values_buffer_changed(node: TestingNode, universe: BaseUniverse):
+    a = universe.add_channel(1, 3)
+
+    a.set_values(array('B', [1, 2, 3]))
+    await node.sleep_steps(2)
+    assert node.data == ['01020300']
+
+    # no change
+    a.set_values(array('B', [1, 2, 3]))
+    await node.sleep_steps(2)
+    assert node.data == ['01020300']
@@ -11,7 +11,7 @@ class MockedSocket:
         self.mp = MonkeyPatch()
 
     def mock(self):
-        m_socket_obj = Mock(['sendto', 'setblocking'], name='socket_obj')
+        m_socket_obj = Mock(['sendto', 'setblocking', 'close'], name='socket_obj')
         m_socket_obj.sendto = m_sendto = Mock(name='socket_obj.sendto')
 
         m = Mock(['socket', 'AF_INET', 'SOCK_DGRAM'], name='Mock socket package')
@@ -1,3 +1,4 @@
+from asyncio import sleep
 from time import monotonic
 
 import pytest
@@ -78,3 +79,118 @@ async def test_fade_await(node: TestingNode, universe: BaseUniverse, caplog):
 
     await check_no_wait_time_when_no_fade()
     await node.wait_for_task_finish()
+
+
+async def test_universe_max_fps(node: TestingNode):
+    fast = node.add_universe(1)
+    slow = node.add_universe(2).set_max_fps(1000 / (STEP_MS * 4))
+    assert fast.output_fps == node.add_universe(3).output_fps
+    assert slow.output_fps == pytest.approx(1000 / (STEP_MS * 4))
+
+    with pytest.raises(ValueError, match='max_fps must be > 0!'):
+        slow.set_max_fps(0)
+
+    sent = []
+    node._send_universe = lambda id, byte_size, values, universe: sent.append(id)
+
+    fast.write_buffer(1, b'\x01')
+    slow.write_buffer(1, b'\x01')
+    await node.sleep_steps(2)
+    for i in range(2, 8):
+        fast.write_buffer(1, bytes([i]))
+        slow.write_buffer(1, bytes([i]))
+        await node.sleep_steps(1)
+    await node.sleep_steps(6)
+
+    assert sent.count(1) > sent.count(2)
+    assert 2 <= sent.count(2) <= 4
+
+    # last change is not lost
+    assert slow._data[0] == 7
+    assert not slow._data_changed
+
+
+def test_adaptive_fps(node: TestingNode):
+    low = node.add_universe(1)
+    high = node.add_universe(2).set_priority(1)
+    node.set_adaptive_fps()
+
+    budget = node._process_every
+
+    # overrun -> low priority is slowed down first
+    for _ in range(3):
+        node._adapt_fps(budget * 2)
+    assert low._throttle == 2
+    assert high._throttle == 1
+    assert low.output_fps == pytest.approx(1 / (budget * 2))
+
+    for _ in range(3 * 2):
+        node._adapt_fps(budget * 2)
+    assert low._throttle == 8
+    assert high._throttle == 1
+
+    for _ in range(3):
+        node._adapt_fps(budget * 2)
+    assert high._throttle == 2
+
+    # recover -> high priority first
+    for _ in range(25):
+        node._adapt_fps(0)
+    assert high._throttle == 1
+    assert low._throttle == 8
+
+    for _ in range(25):
+        node._adapt_fps(0)
+    assert low._throttle == 4
+
+    node.set_adaptive_fps(False)
+    assert low._throttle == 1
+    assert low._send_every == 0
+
+
+async def test_immediate_send(node: TestingNode, universe: BaseUniverse):
+    with pytest.raises(ValueError, match='burst must be >= 1!'):
+        node.set_immediate_send(burst=0)
+    node.set_immediate_send(max_fps=1000 / (STEP_MS * 2))
+
+    # changes in the same loop iteration are sent together and right away
+    universe.write_buffer(1, b'\x01')
+    universe.write_buffer(2, b'\x02')
+    await sleep(0)
+    assert node.data == ['0102']
+
+    # no token left -> sent by the frame loop
+    universe.write_buffer(1, b'\x03')
+    await sleep(0)
+    assert node.data == ['0102']
+
+    await node.sleep_steps(4)
+    assert node.data == ['0102', '0302']
+
+    await node.wait_for_task_finish()
+
+
+async def test_pacing(node: TestingNode):
+    with pytest.raises(ValueError, match='Pacing fraction must be between 0 and 1!'):
+        node.set_pacing(1.5)
+    node.set_pacing(0.5)
+
+    universes = [node.add_universe(i) for i in range(6)]
+
+    sent = []
+    node._send_universe = lambda id, byte_size, values, universe: sent.append((id, monotonic()))
+
+    for u in universes:
+        u.write_buffer(1, b'\x01')
+    await node.sleep_steps(3)
+
+    assert [i for i, _ in sent] == list(range(6))
+
+    # spread over half the frame period
+    duration = sent[-1][1] - sent[0][1]
+    period = node._process_every
+    assert period * 0.5 * 5 / 6 * 0.9 <= duration < period
+
+    await node.wait_for_task_finish()
+    node.set_pacing(None)
+    assert node._pacing == 0
@@ -0,0 +1,87 @@
+import pytest
+
+from pyartnet.base import BaseUniverse
+from pyartnet.color import ColorStage
+from pyartnet.errors import ChannelWidthError
+
+
+def test_validation(universe: BaseUniverse):
+    with pytest.raises(ValueError, match='Invalid layout: RGX'):
+        ColorStage('RGX')
+    with pytest.raises(ValueError, match='Invalid layout: RGBB'):
+        ColorStage('RGBB')
+    with pytest.raises(ChannelWidthError):
+        ColorStage('RGBW', universe.add_channel(1, 3))
+
+    stage = ColorStage('RGB', universe.add_channel(10, 6))
+    assert len(stage) == 2
+    with pytest.raises(ValueError, match='Expected 2 values but got 3!'):
+        stage.set_rgb([1, 1, 1], 0, 0)
+
+
+async def test_hsv(universe: BaseUniverse):
+    strip = universe.add_channel(1, 12)
+    stage = ColorStage('RGB', strip)
+
+    stage.set_hsv([0, 1 / 3, 2 / 3, 1 / 6], 1, 1)
+    assert strip.get_values() == [255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 255, 0]
+
+    stage.set_hsv(0, [1, 0.5, 0, 1], [1, 1, 1, 0.5])
+    assert strip.get_values() == [255, 0, 0, 255, 128, 128, 255, 255, 255, 128, 0, 0]
+
+    # hue wraps around
+    stage.set_hsv(1.5, 1, 1)
+    assert strip.get_values() == [0, 255, 255] * 4
+
+
+async def test_hsi(universe: BaseUniverse):
+    strip = universe.add_channel(1, 9)
+    stage = ColorStage('RGB', strip)
+
+    stage.set_hsi([0, 1 / 6, 0], [1, 1, 0], [1 / 3, 1 / 3, 1 / 3])
+    assert strip.get_values() == pytest.approx([255, 0, 0, 128, 128, 0, 85, 85, 85], abs=1)
+
+
+async def test_white_amber(universe: BaseUniverse):
+    c1 = universe.add_channel(1, 4)
+    c2 = universe.add_channel(5, 4)
+    stage = ColorStage('RGBW', c1, c2)
+
+    stage.set_rgb([1, 1], [1, 0.5], [1, 0])
+    assert c1.get_values() == [0, 0, 0, 255]
+    assert c2.get_values() == [255, 128, 0, 0]
+
+    strip = universe.add_channel(10, 10)
+    stage = ColorStage('WRGBA', strip)
+    stage.set_rgb([1, 1], [1, 0.5], [1, 0.25])
+    assert strip.get_values() == [255, 0, 0, 0, 0, 64, 64, 0, 0, 128]
+
+
+async def test_calibration(universe: BaseUniverse):
+    strip = universe.add_channel(1, 6)
+    stage = ColorStage('RGB', strip)
+
+    stage.set_white_balance(1, [1, 0.5, 0.8])
+    stage.set_rgb(1, 1, 1)
+    assert strip.get_values() == [255, 255, 255, 255, 128, 204]
+
+    # swap red and blue
+    stage.set_matrix(0, [0, 0, 1, 0, 1, 0, 1, 0, 0])
+    stage.set_rgb(1, 0, 0)
+    assert strip.get_values() == [0, 0, 255, 255, 0, 0]
+
+    stage.set_matrix(0, None)
+    stage.set_white_balance(1, None)
+    stage.set_rgb(1, 0, 0)
+    assert strip.get_values() == [255, 0, 0, 255, 0, 0]
+
+
+async def test_cct(universe: BaseUniverse):
+    strip = universe.add_channel(1, 6)
+    stage = ColorStage('RGB', strip)
+
+    stage.set_cct([6600, 2700], [1, 0.5])
+    values = strip.get_values()
+    assert values[:3] == pytest.approx([255, 255, 255], abs=3)
+    assert values[3] == 128
+    assert values[3] > values[4] > values[5]
@@ -0,0 +1,66 @@
+import pytest
+
+from pyartnet.base import BaseUniverse
+from pyartnet.effects import Chase, Rainbow, SineWave
+from pyartnet.errors import BufferOutOfUniverseError, ChannelWidthError
+from pyartnet.output_correction import quadratic
+from tests.conftest import TestingNode
+
+
+def test_patterns():
+    assert Chase(4, 1, width=2, value=10).build_pattern() == b'\x0a\x0a\x00\x00'
+    assert Chase(3, 1, components=2).build_pattern() == b'\xff\xff\x00\x00\x00\x00'
+    assert SineWave(4, 1).build_pattern() == b'\x80\xff\x80\x00'
+    assert SineWave(2, 1, components=2, min_value=10, max_value=20).build_pattern() == b'\x0f\x0f\x0f\x0f'
+    assert Rainbow(3, 1).build_pattern() == b'\xff\x00\x00\x00\xff\x00\x00\x00\xff'
+
+
+async def test_universe(node: TestingNode, universe: BaseUniverse):
+    job = Chase(3, 100, width=1, value=255).start(universe, 2, 4)
+    assert job in node._process_jobs
+
+    job.process()
+    assert universe._data == b'\x00\xff\x00\x00\xff\x00'
+
+    # pattern moves forward
+    job._start_time -= 0.015
+    job.process()
+    assert universe._data == b'\x00\x00\xff\x00\x00\x00'
+
+    job._start_time -= 0.01
+    job.process()
+    assert universe._data == b'\x00\x00\x00\xff\x00\x00'
+
+    job.stop()
+    assert job not in node._process_jobs
+    await job.event.wait()
+
+
+async def test_universe_correction(node: TestingNode, universe: BaseUniverse):
+    universe.set_output_correction(quadratic)
+    job = Chase(2, 0, value=128).start(universe, 1, 2)
+    job.process()
+    assert universe._data == b'\x40\x00'
+    job.stop()
+
+
+async def test_channel(node: TestingNode, universe: BaseUniverse):
+    c = universe.add_channel(1, 6)
+    c.set_output_correction(quadratic)
+    job = Rainbow(2, 0).start_channel(c)
+    job.process()
+    assert c.get_values() == [255, 0, 0, 0, 255, 255]
+    assert universe._data == b'\xff\x00\x00\x00\xff\xff'
+    job.stop()
+
+    with pytest.raises(ChannelWidthError):
+        Rainbow(2, 0).start_channel(universe.add_channel(10, 4))
+
+
+async def test_errors(universe: BaseUniverse):
+    with pytest.raises(BufferOutOfUniverseError):
+        Chase(2, 1, components=3).start(universe, 500, 5)
+    with pytest.raises(ValueError, match='Pixels must be > 0!'):
+        Chase(2, 1).start(universe, 1, 0)
+    with pytest.raises(ValueError, match='Size must be > 0!'):
+        Chase(0, 1)
@@ -0,0 +1,76 @@
+import pytest
+
+from pyartnet import ArtNetNode, KiNetNode, SacnNode
+from pyartnet.base.clock import monotonic
+from pyartnet.frame_tap import FrameTap
+
+
+async def test_ring_buffer():
+    node = ArtNetNode('ip', 9999, start_refresh_task=False)
+    u1 = node.add_universe(1)
+    u2 = node.add_universe(2)
+
+    tap = FrameTap(3).add_node(node)
+    with pytest.raises(ValueError, match='Node ip:9999 is already tapped!'):
+        tap.add_node(node)
+
+    u1.write_buffer(1, b'\x01')
+    u1.send_data()
+    u2.write_buffer(1, b'\x02')
+    u2.send_data()
+    assert len(tap) == 2
+
+    packets = list(tap.packets())
+    assert [p.universe for p in packets] == [1, 2]
+    assert packets[0].node is node
+    assert packets[0].data == bytes(u1._packet)
+
+    # oldest packets are overwritten
+    middle = monotonic()
+    for i in range(3, 6):
+        u1.write_buffer(1, bytes([i]))
+        u1.send_data()
+    assert len(tap) == 3
+    assert [p.data[18] for p in tap.packets()] == [3, 4, 5]
+
+    # filter
+    u2.send_data()
+    assert [p.universe for p in tap.packets(universe=2)] == [2]
+    assert [p.data[18] for p in tap.packets(start=middle, universe=1)] == [4, 5]
+    assert list(tap.packets(end=middle)) == []
+
+    tap.clear()
+    assert list(tap.packets()) == []
+
+    u1.send_data()
+    tap.close()
+    assert len(tap) == 0
+    assert not tap._nodes
+    assert node._tap_packet is None
+
+    u1.send_data()
+    assert len(tap) == 0
+
+    # the node can be tapped again
+    FrameTap(size=3).add_node(node).close()
+
+
+@pytest.mark.parametrize(
+    ('cls', 'expected'), (
+        (ArtNetNode, 'Seq   1 Univ     1 Len   4: 001 002 000 000'),
+        (SacnNode, 'Seq   0 Univ     1 Len   4: 001 002 000 000'),
+        (KiNetNode, 'Len   4: 001 002 000 000'),
+    )
+)
+async def test_dump(cls, expected: str):
+    node = cls('ip', 9999, start_refresh_task=False)
+    u = node.add_universe(1)
+    u.add_channel(1, 4)
+
+    tap = FrameTap().add_node(node)
+    u.write_buffer(1, b'\x01\x02')
+    u.send_data()
+
+    packet, = tap.packets(node=node)
+    assert packet.format() == expected
+    assert tap.dump().endswith(f' ip:9999 Universe 1: {expected}')
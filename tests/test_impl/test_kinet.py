@@ -0,0 +1,48 @@
+import pytest
+
+from pyartnet import KiNetNode, KiNetReceiver
+from pyartnet.errors import InvalidUniverseAddressError
+
+
+async def test_kinet_dmxout(patched_socket):
+    node = KiNetNode('ip', 6038, start_refresh_task=False)
+    universe = node.add_universe(0)
+    universe.add_channel(1, 300).set_values([1] * 300)
+    universe.send_data()
+
+    packet = bytes(node._socket.sendto.call_args[0][0])
+    # magic, version, type, sequence, port, padding, flags, timer, start code
+    assert packet[:21] == bytes.fromhex('0401dc4a01000101' '00000000' '00' '00' '0000' 'ffffffff' '00')
+    assert packet[21:] == b'\x01' * 300
+
+
+async def test_kinet_portout(patched_socket):
+    node = KiNetNode('ip', 6038, start_refresh_task=False, portout=True)
+    ports = [node.add_universe(port) for port in range(1, 17)]
+    ports[0].add_channel(1, 3).set_values([1, 2, 3])
+    ports[15].add_channel(1, 512)
+
+    packets = []
+    for universe in (ports[0], ports[15]):
+        universe.send_data()
+        packets.append(bytes(node._socket.sendto.call_args[0][0]))
+
+    # magic, version, type, sequence, universe, port, padding, flags, length, start code
+    assert packets[0] == bytes.fromhex('0401dc4a02000801' '00000000' 'ffffffff' '01' '00' '0000' '0400' 'ff0f') + \
+        b'\x01\x02\x03\x00'
+    assert packets[1][16] == 16
+    assert packets[1][20:22] == (512).to_bytes(2, 'little')
+    assert len(packets[1]) == 24 + 512
+
+    assert node._format_packet(packets[0]) == 'Port   1 Len   4: 001 002 003 000'
+
+    with pytest.raises(InvalidUniverseAddressError):
+        node.add_universe(256)
+    with pytest.raises(InvalidUniverseAddressError):
+        node.add_universe(0)
+
+    # received through the receiver
+    received = []
+    r = KiNetReceiver(lambda u, d: received.append((u, bytes(d))))
+    r.datagram_received(packets[0], ('ip', 1234))
+    assert received == [(1, b'\x01\x02\x03\x00')]
@@ -0,0 +1,82 @@
+import socket
+from asyncio import create_task, run, sleep, wait_for
+
+import pytest
+
+from pyartnet import ArtNetNode, ArtNetReceiver, KiNetNode, KiNetReceiver, SacnNode, SacnReceiver
+
+
+@pytest.mark.parametrize(('node_cls', 'receiver_cls', 'nr'), (
+    (ArtNetNode, ArtNetReceiver, 5), (SacnNode, SacnReceiver, 5), (KiNetNode, KiNetReceiver, 0)))
+async def test_receive(node_cls, receiver_cls, nr):
+    received = []
+
+    node = node_cls('ip', 9999)
+    universe = node.add_universe(nr)
+    universe.add_channel(1, 10).set_values(range(1, 11))
+    universe.send_data()
+    packet = node._socket.sendto.call_args[0][0]
+
+    r = receiver_cls(lambda u, d: received.append((u, bytes(d))))
+    r.datagram_received(bytes(packet), ('ip', 1234))
+    assert received == [(nr, bytes(range(1, 11)))]
+    assert r.get_data(nr) == bytes(range(1, 11))
+    assert r.get_data(nr + 1) is None
+
+    # invalid packets are ignored
+    r.datagram_received(b'asdf', ('ip', 1234))
+    r.datagram_received(bytes(packet[:7]), ('ip', 1234))
+    assert len(received) == 1
+
+    # iterator
+    assert await r.__anext__() == (nr, bytes(range(1, 11)))
+    node.stop_refresh()
+
+
+async def test_loopback():
+    r = ArtNetReceiver()
+    await r.listen('127.0.0.1', 0)
+    port = r._transport.get_extra_info('sockname')[1]
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for i in range(3):
+        packet = b'Art-Net\x00\x00\x50\x00\x0e\x01\x00' + bytes([i, 0]) + b'\x00\x02' + bytes([i, 255])
+        sock.sendto(packet, ('127.0.0.1', port))
+    sock.sendto(b'Art-Net\x00\x00\x50\x00\x0e\x01\x00\x00\x00\x00\x02\xff\xff', ('127.0.0.1', port))
+    sock.close()
+    await sleep(0.05)
+
+    received = []
+    async for universe, data in r:
+        received.append((universe, bytes(data)))
+        if len(received) == 3:
+            break
+
+    # universe 0 was coalesced
+    assert received == [(0, b'\xff\xff'), (1, b'\x01\xff'), (2, b'\x02\xff')]
+
+    r.close()
+    await sleep(0)
+    assert r._transport is None
+
+
+def test_created_outside_loop():
+    # the receiver can be created before the event loop is running
+    r = ArtNetReceiver()
+
+    async def receive():
+        await r.listen('127.0.0.1', 0)
+        port = r._transport.get_extra_info('sockname')[1]
+
+        task = create_task(r.__anext__())
+        await sleep(0.01)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.sendto(b'Art-Net\x00\x00\x50\x00\x0e\x01\x00\x01\x00\x00\x02\x01\xff', ('127.0.0.1', port))
+        sock.close()
+
+        universe, data = await wait_for(task, 1)
+        r.close()
+        await sleep(0)
+        return universe, bytes(data)
+
+    assert run(receive()) == (1, b'\x01\xff')
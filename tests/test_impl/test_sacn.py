@@ -23,3 +23,33 @@ async def test_sacn(patched_socket):
 
 
     await channel
+
+
+async def test_sacn_universe_sizes(patched_socket):
+    sacn = SacnNode('ip', 9999999, cid=bytes(16), source_name='name', start_refresh_task=False)
+    u1 = sacn.add_universe(1)
+    u1.add_channel(1, 2)
+    u2 = sacn.add_universe(2)
+    u2.add_channel(1, 6)
+
+    packets = []
+    for u in (u1, u2, u1):
+        u.send_data()
+        packets.append(bytes(sacn._socket.sendto.call_args[0][0]))
+
+    # root and framing layer length are built per universe
+    assert packets[0][16:18] == ((109 + 3) | 0x7000).to_bytes(2, 'big')
+    assert packets[1][16:18] == ((109 + 7) | 0x7000).to_bytes(2, 'big')
+    assert packets[2][16:18] == packets[0][16:18]
+    assert packets[2][38:40] == ((87 + 3) | 0x7000).to_bytes(2, 'big')
+
+    # only the sequence changed
+    assert packets[0][111] == 0
+    assert packets[2][111] == 1
+    assert packets[0][:111] == packets[2][:111]
+    assert packets[0][112:] == packets[2][112:]
+
+    # size change rebuilds the packet
+    u1.add_channel(5, 1)
+    u1.send_data()
+    assert sacn._socket.sendto.call_args[0][0][123:125] == (7).to_bytes(2, 'big')
@@ -0,0 +1,77 @@
+import pytest
+
+from pyartnet.base import BaseUniverse
+from pyartnet.base.clock import monotonic
+from pyartnet.errors import BufferOutOfUniverseError
+from pyartnet.interpolation import FrameInterpolator
+from tests.conftest import TestingNode
+
+
+async def test_linear(universe: BaseUniverse):
+    i = FrameInterpolator(universe)
+    i.push(b'\x00\xff\x10', timestamp=10)
+    assert i.delay == 0
+    assert i._frame(10) == (b'\x00\xff\x10', True)
+
+    i.push(b'\xff\x00\x10', timestamp=11)
+    assert i.delay == 1
+
+    # output is delayed by one input frame
+    assert i._frame(11) == (b'\x00\xff\x10', False)
+    assert i._frame(11.5) == (b'\x80\x7f\x10', False)
+    assert i._frame(11.75) == (b'\xbf\x40\x10', False)
+    assert i._frame(12) == (b'\xff\x00\x10', True)
+    i.stop()
+
+
+async def test_hermite(universe: BaseUniverse):
+    i = FrameInterpolator(universe, 'hermite')
+    for t, v in enumerate((0, 100, 200, 250)):
+        i.push(bytes([v]), timestamp=t)
+    assert i.delay == pytest.approx(1)
+
+    # passes through the frames
+    assert i._frame(2) == (b'\x64', False)
+    assert i._frame(3) == (b'\xc8', False)
+
+    # between the frames the curve is smooth
+    assert i._frame(2.5)[0][0] == 153
+    assert i._frame(3.5)[0][0] == 231
+    i.stop()
+
+
+async def test_reset_and_errors(universe: BaseUniverse):
+    with pytest.raises(ValueError, match='Mode must be "linear" or "hermite": cubic'):
+        FrameInterpolator(universe, 'cubic')   # type: ignore[arg-type]
+
+    i = FrameInterpolator(universe, start=511)
+    with pytest.raises(BufferOutOfUniverseError):
+        i.push(b'\x00\x00\x00')
+
+    i.push(b'\x00\x00', timestamp=1)
+    i.push(b'\x01\x01', timestamp=2)
+    assert len(i._frames) == 2
+
+    # size changed -> history is discarded
+    i.push(b'\x01', timestamp=3)
+    assert len(i._frames) == 1
+    i.stop()
+
+
+async def test_output(node: TestingNode, universe: BaseUniverse):
+    i = FrameInterpolator(universe)
+
+    now = monotonic()
+    i.push(b'\x00', timestamp=now - 0.2)
+    i.push(b'\xc8', timestamp=now)
+
+    await node.sleep_steps(20)
+    values = [int(v[:2], 16) for v in node.data]
+    assert values[0] < 50
+    assert values[-1] == 200
+    # smooth steps in between
+    assert len(values) > 10
+    assert values == sorted(values)
+
+    await node.wait_for_task_finish()
+    assert i._job is None
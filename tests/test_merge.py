@@ -0,0 +1,118 @@
+from asyncio import sleep
+
+import pytest
+
+from pyartnet.base import BaseUniverse
+from pyartnet.merge import UniverseMerger
+
+
+async def test_htp(universe: BaseUniverse):
+    m = UniverseMerger(universe, 'htp')
+    s1 = m.add_source()
+    s2 = m.add_source('console')
+    assert s1.name == 'Source 1'
+    assert s2.name == 'console'
+
+    s1.set_data(b'\x10\x00\xff')
+    assert universe._data == b'\x10\x00\xff\x00'
+
+    s2.set_data(b'\x05\x20\x00\x30')
+    assert universe._data == b'\x10\x20\xff\x30'
+
+    m.remove_source(s1)
+    assert universe._data == b'\x05\x20\x00\x30'
+    m.close()
+
+
+async def test_shrinking_output(universe: BaseUniverse):
+    m = UniverseMerger(universe, 'htp')
+    s1 = m.add_source()
+    s2 = m.add_source()
+
+    s1.set_data(b'\xff\xff\xff\xff')
+    s2.set_data(b'\x00')
+    assert universe._data == b'\xff\xff\xff\xff'
+
+    # the channels of the removed source are turned off
+    m.remove_source(s1)
+    assert universe._data == b'\x00\x00\x00\x00'
+
+    # shrinking source
+    s2.set_data(b'\x10\x20\x30')
+    s2.set_data(b'\x10')
+    assert universe._data == b'\x10\x00\x00\x00'
+
+    # the old data of a shrunk source is not merged again
+    s3 = m.add_source()
+    s3.set_data(b'\x00\x00\x01')
+    assert universe._data == b'\x10\x00\x01\x00'
+    m.close()
+
+
+async def test_ltp(universe: BaseUniverse):
+    m = UniverseMerger(universe, 'ltp')
+    s1 = m.add_source()
+    s2 = m.add_source()
+
+    s1.set_data(b'\x10\x00')
+    s2.set_data(b'\x05\x20')
+    assert universe._data == b'\x05\x20'
+    s1.set_data(b'\x01\x01')
+    assert universe._data == b'\x01\x01'
+    m.close()
+
+
+async def test_ltp_repeat(universe: BaseUniverse):
+    m = UniverseMerger(universe, 'ltp')
+    s1 = m.add_source()
+    s2 = m.add_source()
+    s3 = m.add_source()
+
+    s1.set_data(b'\x10\x00')
+    await sleep(0.001)
+    s2.set_data(b'\x05\x20')
+    await sleep(0.001)
+
+    # s1 keeps sending the same data while s2 changes
+    s1.set_data(b'\x10\x00')
+    await sleep(0.001)
+    s2.set_data(b'\x06\x21')
+    await sleep(0.001)
+    s1.set_data(b'\x10\x00')
+    assert universe._data == b'\x06\x21'
+
+    # recompute because another source is removed
+    await sleep(0.001)
+    s3.set_data(b'\x01\x01')
+    assert universe._data == b'\x01\x01'
+    m.remove_source(s3)
+    assert universe._data == b'\x06\x21'
+    m.close()
+
+
+async def test_timeout(universe: BaseUniverse):
+    m = UniverseMerger(universe, 'htp', timeout=0.05)
+    s1 = m.add_source()
+    s2 = m.add_source()
+
+    s1.set_data(b'\x10\x00')
+    await sleep(0.03)
+    s2.set_data(b'\x05\x20')
+    assert universe._data == b'\x10\x20'
+
+    await sleep(0.035)
+    assert not s1.is_active
+    assert s2.is_active
+    assert universe._data == b'\x05\x20'
+
+    await sleep(0.03)
+    assert not s2.is_active
+    assert universe._data == b'\x00\x00'
+    assert m._timer is None
+
+
+def test_errors(universe: BaseUniverse):
+    with pytest.raises(ValueError, match='Mode must be "htp" or "ltp": asdf'):
+        UniverseMerger(universe, 'asdf')
+    with pytest.raises(ValueError, match='Timeout must be > 0!'):
+        UniverseMerger(universe, timeout=0)
@@ -0,0 +1,197 @@
+import socket
+from typing import Dict
+from unittest.mock import Mock
+
+import pytest
+
+import pyartnet.multi_interface
+from pyartnet import ArtNetNode
+from pyartnet.base.transport_output import DatagramTransportOutput
+from pyartnet.multi_interface import MultiInterfaceOutput
+
+
+@pytest.fixture()
+def sockets(monkeypatch) -> Dict[str, Mock]:
+    created: Dict[str, Mock] = {}
+
+    def create(*args):
+        sock = Mock(['sendto', 'setblocking', 'setsockopt', 'bind', 'close'])
+        sock.sendto = Mock(side_effect=lambda data, dst: len(data))
+        sock.bind = Mock(side_effect=lambda addr: created.__setitem__(addr[0], sock))
+        return sock
+
+    m = Mock(['socket', 'AF_INET', 'SOCK_DGRAM', 'SOL_SOCKET', 'SO_BINDTODEVICE'])
+    m.socket = Mock(side_effect=create)
+    m.AF_INET = socket.AF_INET
+    m.SOCK_DGRAM = socket.SOCK_DGRAM
+    m.SOL_SOCKET = socket.SOL_SOCKET
+    m.SO_BINDTODEVICE = 25
+    monkeypatch.setattr(pyartnet.multi_interface, 'socket', m)
+    return created
+
+
+def sent_universes(sock: Mock):
+    # ArtNet universe is at byte 14
+    return [call.args[0][14] for call in sock.sendto.call_args_list]
+
+
+async def send(node: ArtNetNode, *universes: int):
+    for nr in universes:
+        universe = node.get_universe(nr) if nr in node._universe_map else node.add_universe(nr)
+        universe.send_data()
+
+
+async def test_static(sockets):
+    out = MultiInterfaceOutput(['10.0.1.1', '10.0.2.1'])
+    a = ArtNetNode('10.0.1.100', 6454, start_refresh_task=False)
+    b = ArtNetNode('10.0.2.100', 6454, start_refresh_task=False)
+    out.add_node(a)
+    out.add_node(b, '10.0.2.1')
+    out.assign(a, '10.0.2.1', universe=3)
+
+    await send(a, 1, 2, 3)
+    await send(b, 1)
+
+    assert sent_universes(sockets['10.0.1.1']) == [1, 2]
+    assert sent_universes(sockets['10.0.2.1']) == [3, 1]
+    assert sockets['10.0.2.1'].sendto.call_args_list[-1].args[1] == ('10.0.2.100', 6454)
+
+    # reassign
+    out.assign(a, '10.0.2.1')
+    await send(a, 1)
+    assert sent_universes(sockets['10.0.2.1']) == [3, 1, 1]
+
+    with pytest.raises(ValueError, match='Interface 10.0.3.1 does not exist!'):
+        out.assign(a, '10.0.3.1')
+    with pytest.raises(ValueError, match='is already added'):
+        out.add_node(a)
+    out.close()
+
+
+async def test_round_robin(sockets):
+    out = MultiInterfaceOutput(['10.0.0.1', '10.0.0.2'], 'round_robin')
+    node = ArtNetNode('10.0.0.100', 6454, start_refresh_task=False)
+    out.add_node(node)
+
+    await send(node, 1, 2, 3, 4)
+    # assignment is sticky
+    await send(node, 1, 2)
+
+    assert sent_universes(sockets['10.0.0.1']) == [1, 3, 1]
+    assert sent_universes(sockets['10.0.0.2']) == [2, 4, 2]
+
+    stats = out.stats()
+    assert [s.universes for s in stats] == [2, 2]
+    assert [s.packets for s in stats] == [3, 3]
+    assert stats[0].bytes == 3 * 18
+    out.close()
+
+
+async def test_least_loaded(sockets):
+    out = MultiInterfaceOutput(['10.0.0.1', '10.0.0.2'], 'least_loaded')
+    node = ArtNetNode('10.0.0.100', 6454, start_refresh_task=False)
+    out.add_node(node)
+
+    iface_1, iface_2 = out._interfaces
+    iface_1.bytes_per_sec = 1000
+    await send(node, 1)
+    assert sent_universes(sockets['10.0.0.2']) == [1]
+
+    # same load -> fewer universes
+    iface_2.bytes_per_sec = 1000
+    await send(node, 2)
+    assert sent_universes(sockets['10.0.0.1']) == [2]
+    out.close()
+
+
+async def test_least_loaded_redistribute(sockets, monkeypatch):
+    now = 0.
+    monkeypatch.setattr(pyartnet.multi_interface, 'monotonic', lambda: now)
+
+    out = MultiInterfaceOutput(['10.0.0.1', '10.0.0.2'], 'least_loaded')
+    node = ArtNetNode('10.0.0.100', 6454, start_refresh_task=False)
+    out.add_node(node)
+    out.assign(node, '10.0.0.1', universe=4)
+
+    # all rates are 0 -> the universes are assigned in turn
+    await send(node, 1, 2, 3, 4)
+    assert sent_universes(sockets['10.0.0.1']) == [1, 3, 4]
+    assert sent_universes(sockets['10.0.0.2']) == [2]
+
+    # universe 1 and 3 have the most traffic, so they are sent through different interfaces
+    for _ in range(5):
+        await send(node, 1, 3)
+    now = 1
+    await send(node, 2)
+
+    sockets['10.0.0.1'].sendto.reset_mock()
+    sockets['10.0.0.2'].sendto.reset_mock()
+    await send(node, 1, 2, 3, 4)
+    assert sent_universes(sockets['10.0.0.1']) == [3, 4]
+    assert sent_universes(sockets['10.0.0.2']) == [1, 2]
+    assert [s.universes for s in out.stats()] == [2, 2]
+
+    # a small imbalance does not move the universes
+    routes = dict(out._routes)
+    await send(node, 1)
+    now = 2
+    await send(node, 1)
+    assert out._routes == routes
+    assert [s.universes for s in out.stats()] == [2, 2]
+    out.close()
+
+
+async def test_add_transport_node(sockets):
+    out = MultiInterfaceOutput(['10.0.0.1'])
+    node = ArtNetNode('10.0.0.100', 6454, start_refresh_task=False)
+
+    # not yet connected -> the frames are pending
+    old = DatagramTransportOutput(node._dst)
+    old.send(b'\x00' * 14 + b'\x01', 1)
+    old.send(b'\x00' * 14 + b'\x02', 2)
+    node._output = old  # type: ignore[assignment]
+
+    out.add_node(node)
+    assert sent_universes(sockets['10.0.0.1']) == [1, 2]
+
+    # the old output does not send anymore and the transport is closed
+    transport = Mock(['sendto', 'close'])
+    old.connection_made(transport)
+    old.send(b'\x00' * 15, 1)
+    transport.sendto.assert_not_called()
+    transport.close.assert_called_once_with()
+
+    # the node can not switch to another output
+    with pytest.raises(ValueError, match='Node 10.0.0.100:6454 sends through a NodeOutput!'):
+        await node.use_datagram_transport()
+    other = MultiInterfaceOutput(['10.0.0.2'])
+    with pytest.raises(ValueError, match='Node 10.0.0.100:6454 sends through a NodeOutput!'):
+        other.add_node(node)
+    other.close()
+    out.close()
+
+
+async def test_close_node_socket(sockets):
+    out = MultiInterfaceOutput(['10.0.0.1'])
+    node = ArtNetNode('10.0.0.100', 6454, start_refresh_task=False)
+    node._socket.close.assert_not_called()
+    out.add_node(node)
+    node._socket.close.assert_called_once_with()
+    out.close()
+
+
+async def test_device(sockets):
+    out = MultiInterfaceOutput([('10.0.0.1', 'eth1'), '10.0.0.2'])
+    sockets['10.0.0.1'].setsockopt.assert_called_once_with(socket.SOL_SOCKET, 25, b'eth1')
+    sockets['10.0.0.2'].setsockopt.assert_not_called()
+    assert [i.device for i in out._interfaces] == ['eth1', None]
+    out.close()
+
+
+async def test_errors(sockets):
+    with pytest.raises(ValueError, match='Policy must be "static", "round_robin" or "least_loaded": random'):
+        MultiInterfaceOutput(['10.0.0.1'], 'random')    # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='Interfaces must be unique!'):
+        MultiInterfaceOutput(['10.0.0.1', '10.0.0.1'])
+    with pytest.raises(ValueError, match='Interfaces must be unique!'):
+        MultiInterfaceOutput(['10.0.0.1', ('10.0.0.1', 'eth0')])
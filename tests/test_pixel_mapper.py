@@ -0,0 +1,65 @@
+import pytest
+
+from pyartnet.base import BaseNode
+from pyartnet.errors import BufferOutOfUniverseError
+from pyartnet.pixel_mapper import PixelMapper
+from tests.conftest import TestingNode
+
+
+def get_frame(width: int, height: int) -> bytes:
+    return bytes((i * 7) % 256 for i in range(width * height * 3))
+
+
+def get_pixel(frame: bytes, width: int, x: int, y: int, color_order: str) -> bytes:
+    start = (y * width + x) * 3
+    return bytes(frame[start + 'RGB'.index(c)] for c in color_order)
+
+
+@pytest.mark.parametrize('color_order', ('RGB', 'GRB', 'BGR'))
+async def test_mapper(node: TestingNode, color_order: str):
+    width, height = 5, 4
+    u1 = node.add_universe(1)
+    u2 = node.add_universe(2)
+
+    # serpentine layout, two rows per universe
+    coords = [[(x, y) for x in (range(width) if not y % 2 else reversed(range(width)))] for y in range(height)]
+    m = PixelMapper(width, height)
+    m.add_strip(u1, 1, coords[0] + coords[1], color_order)
+    m.add_strip(u2, 4, coords[2] + coords[3], color_order)
+    m.add_pixel(u2, 100, 2, 2)
+
+    frame = get_frame(width, height)
+    m.set_frame(frame)
+
+    expected = b''.join(get_pixel(frame, width, x, y, color_order) for x, y in coords[0] + coords[1])
+    assert u1._data == expected
+    assert u1._data_changed
+
+    expected = b''.join(get_pixel(frame, width, x, y, color_order) for x, y in coords[2] + coords[3])
+    assert u2._data_size == 102
+    assert u2._data[3:33] == expected
+    assert u2._data[99:102] == get_pixel(frame, width, 2, 2, 'RGB')
+
+    await node.sleep_steps(2)
+    assert len(node.data) == 2
+
+
+async def test_mapper_errors(node: BaseNode):
+    u = node.add_universe(1)
+    m = PixelMapper(2, 2)
+
+    with pytest.raises(ValueError, match='Pixel 2/0 is not in the frame'):
+        m.add_pixel(u, 1, 2, 0)
+    with pytest.raises(ValueError, match='Invalid color order: RGW'):
+        m.add_pixel(u, 1, 0, 0, 'RGW')
+    with pytest.raises(BufferOutOfUniverseError):
+        m.add_pixel(u, 511, 0, 0)
+
+    m.add_pixel(u, 1, 0, 0)
+    m.add_pixel(u, 3, 0, 1)
+    with pytest.raises(ValueError, match='Address 3 in universe 1 is mapped twice!'):
+        m.compile()
+
+    m = PixelMapper(2, 2)
+    with pytest.raises(ValueError, match=r'Frame must have 12 bytes \(2x2x3\), got 3!'):
+        m.set_frame(b'\x00\x00\x00')
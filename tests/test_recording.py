@@ -0,0 +1,108 @@
+from asyncio import CancelledError, create_task, sleep
+
+import pytest
+
+from pyartnet.errors import InvalidRecordingError
+from pyartnet.recording import FramePlayer, FrameRecorder
+from tests.conftest import TestingNode
+
+
+async def test_record_play(node: TestingNode, tmp_path):
+    file = tmp_path / 'show.rec'
+
+    node2 = TestingNode('IP2', 9999)
+    c1 = node.add_universe(1).add_channel(1, 3)
+    c2 = node2.add_universe(5).add_channel(1, 1)
+
+    with FrameRecorder(file) as recorder:
+        assert recorder.add_node(node) == 0
+        assert recorder.add_node(node2) == 1
+
+        with pytest.raises(ValueError, match='Node IP:9999 is already recorded!'):
+            recorder.add_node(node)
+
+        c1.set_fade([3, 6, 9], 45)
+        c2.set_values([255])
+        await c1
+    assert node._record_frame is None
+    assert node2._record_frame is None
+
+    with FramePlayer(file) as player:
+        assert len(player) == 4
+
+        frames = [(node_idx, universe, bytes(data)) for _, node_idx, universe, data in player.frames()]
+        assert frames == [
+            (0, 1, b'\x01\x02\x03\x00'), (1, 5, b'\xff\x00'), (0, 1, b'\x02\x04\x06\x00'), (0, 1, b'\x03\x06\x09\x00')
+        ]
+
+        times = [ts for ts, *_ in player.frames()]
+        assert times == sorted(times)
+        assert player.duration == times[-1]
+        assert [ts for ts, *_ in player.frames(times[1], times[2])] == times[1:3]
+
+        # playback through new nodes
+        play1 = TestingNode('IP', 9999)
+        play2 = TestingNode('IP2', 9999)
+        play2.add_universe(5)
+        await player.play(play1, play2)
+
+    assert play1.data == ['01020300', '02040600', '03060900']
+    assert play2.data == ['ff00']
+    assert play1[1]._data == b'\x03\x06\x09\x00'
+
+
+async def test_invalid_file(tmp_path):
+    file = tmp_path / 'show.rec'
+    file.write_bytes(b'asdf' * 10)
+
+    with pytest.raises(InvalidRecordingError):
+        FramePlayer(file)
+
+
+async def test_master(node: TestingNode, tmp_path):
+    file = tmp_path / 'show.rec'
+
+    def create(n: TestingNode):
+        u = n.add_universe(1)
+        u.add_channel(1, 1).set_intensity()
+        u.set_master(0.5)
+        return u
+
+    universe = create(node)
+    with FrameRecorder(file) as recorder:
+        recorder.add_node(node)
+        universe.get_channel('1/1').set_values([200])
+        universe.send_data()
+    assert node.data == ['6400']
+
+    # the frames are recorded as they were sent and the master is not applied again
+    play = TestingNode('IP', 9999)
+    play_universe = create(play)
+    with FramePlayer(file) as player:
+        assert [bytes(data) for *_, data in player.frames()] == [b'\x64\x00']
+        await player.play(play)
+    assert play.data == ['6400']
+
+    # the master applies again after the playback
+    assert not play_universe._master_bypass
+    assert play_universe._data_changed
+
+
+async def test_cancel_play(node: TestingNode, tmp_path):
+    file = tmp_path / 'show.rec'
+
+    c = node.add_universe(1).add_channel(1, 1)
+    with FrameRecorder(file) as recorder:
+        recorder.add_node(node)
+        c.set_fade([200], 300)
+        await c
+
+    player = FramePlayer(file)
+    task = create_task(player.play(TestingNode('IP', 9999)))
+    await sleep(0.1)
+    task.cancel()
+    with pytest.raises(CancelledError):
+        await task
+
+    # all views into the recording are released
+    player.close()
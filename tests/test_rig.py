@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from pyartnet import ArtNetNode, SacnNode
+from pyartnet.errors import ChannelNotFoundError, ChannelOutOfUniverseError, DuplicateUniverseError, \
+    InvalidRigError, InvalidUniverseAddressError, NodeNotFoundError, OverlappingChannelError
+from pyartnet.output_correction import cubic, quadratic
+from pyartnet.rig import compile_rig, load_rig
+
+RIG = {
+    'nodes': [
+        {'name': 'stage', 'type': 'artnet', 'ip': '127.0.0.1', 'port': 6454, 'max_fps': 40,
+         'start_refresh_task': False, 'output_correction': 'quadratic',
+         'universes': [
+             {'nr': 0, 'channels': [
+                 {'name': 'dimmer', 'start': 1, 'intensity': True},
+                 {'name': 'rgb', 'start': 2, 'width': 3, 'output_correction': 'cubic'},
+                 {'start': 5, 'width': 2, 'byte_size': 2, 'byte_order': 'big'},
+             ]},
+             {'nr': 1},
+         ]},
+        {'type': 'sacn', 'ip': '127.0.0.2', 'port': 5568, 'start_refresh_task': False,
+         'source_name': 'rig', 'universes': [{'nr': 1, 'channels': [{'start': 10}]}]},
+    ]
+}
+
+
+def test_create():
+    rig = compile_rig(RIG).create()
+
+    stage = rig.get_node('stage')
+    assert isinstance(stage, ArtNetNode)
+    assert stage._process_every == 1 / 40
+    assert stage._correction_output is quadratic
+    assert len(stage) == 2
+
+    assert isinstance(rig.get_node('127.0.0.2:5568'), SacnNode)
+
+    assert len(rig) == 4
+    dimmer = rig['stage/0/dimmer']
+    assert dimmer._intensity
+    assert dimmer._parent_universe._intensity_ranges
+    assert rig['stage/0/rgb']._correction_current is cubic
+
+    wide = rig['stage/0/5/2']
+    assert wide._byte_size == 2
+    assert wide._byte_order == 'big'
+    assert wide._parent_universe._data_size == 8
+
+    with pytest.raises(NodeNotFoundError):
+        rig.get_node('asdf')
+    with pytest.raises(ChannelNotFoundError):
+        rig.get_channel('stage/0/asdf')
+
+
+@pytest.mark.parametrize('channels, error, msg', (
+    ([{'start': 1, 'width': 2}, {'start': 2}], OverlappingChannelError, 'overlapping'),
+    ([{'start': 511, 'width': 2, 'byte_size': 2}], ChannelOutOfUniverseError, 'out of universe'),
+    ([{'start': 1, 'byte_order': 'middle'}], InvalidRigError, 'Must be "big" or "little"'),
+    ([{'start': 1, 'width': True}], InvalidRigError, r'channels\[0\].width: Expected int but got True'),
+    ([{'start': 1, 'size': 2}], InvalidRigError, 'Unknown entry "size"'),
+    ([{'start': 1, 'output_correction': 'log'}], InvalidRigError, 'Must be one of linear'),
+))
+def test_invalid_channels(channels, error, msg):
+    node = {'type': 'artnet', 'ip': 'IP', 'port': 1, 'universes': [{'nr': 0, 'channels': channels}]}
+    with pytest.raises(error, match=msg):
+        compile_rig({'nodes': [node]})
+
+
+def test_invalid_nodes():
+    with pytest.raises(InvalidRigError, match=r'nodes\[0\]: "ip" is missing!'):
+        compile_rig({'nodes': [{'type': 'artnet', 'port': 1}]})
+    with pytest.raises(InvalidRigError, match='Unknown entry "cid"'):
+        compile_rig({'nodes': [{'type': 'artnet', 'ip': 'IP', 'port': 1, 'cid': '00'}]})
+    with pytest.raises(InvalidRigError, match='Expected 16 bytes'):
+        compile_rig({'nodes': [{'type': 'sacn', 'ip': 'IP', 'port': 1, 'cid': '00'}]})
+    with pytest.raises(DuplicateUniverseError):
+        compile_rig({'nodes': [{'type': 'kinet', 'ip': 'IP', 'port': 1, 'universes': [{'nr': 0}, {'nr': 0}]}]})
+    with pytest.raises(InvalidRigError, match='Node "IP:1" does already exist'):
+        compile_rig({'nodes': [{'type': 'kinet', 'ip': 'IP', 'port': 1}, {'type': 'artnet', 'ip': 'IP', 'port': 1}]})
+
+
+def test_load_toml(tmp_path: Path):
+    pytest.importorskip('tomllib')
+
+    file = tmp_path / 'rig.toml'
+    file.write_text(
+        '[[nodes]]\ntype = "kinet"\nip = "127.0.0.1"\nport = 6038\nstart_refresh_task = false\n'
+        '[[nodes.universes]]\nnr = 0\nchannels = [{name = "a", start = 1, width = 3}]\n'
+    )
+    rig = load_rig(file)
+    assert rig['127.0.0.1:6038/0/a']._width == 3
+
+
+def test_snapshot(tmp_path: Path, monkeypatch):
+    file = tmp_path / 'rig.json'
+    file.write_text(json.dumps(RIG))
+    cache = tmp_path / 'cache'
+
+    load_rig(file, cache)
+    snapshots = list(cache.iterdir())
+    assert len(snapshots) == 1
+    assert snapshots[0].suffix == '.rig'
+
+    # snapshot is used -> no validation
+    def fail(config):
+        raise AssertionError()
+    monkeypatch.setattr('pyartnet.rig.compile_rig', fail)
+    rig = load_rig(file, cache)
+    assert len(rig) == 4
+
+    # changed content -> new snapshot
+    monkeypatch.undo()
+    file.write_text(json.dumps({'nodes': []}))
+    assert len(load_rig(file, cache)) == 0
+    assert len(list(cache.iterdir())) == 2
+
+    with pytest.raises(InvalidRigError, match='must be a .json or .toml file'):
+        load_rig(tmp_path / 'cache' / snapshots[0].name)
+
+
+@pytest.mark.parametrize('node, nr, valid', (
+    ({'type': 'sacn'}, 40000, True),
+    ({'type': 'sacn'}, 0, False),
+    ({'type': 'artnet'}, 40000, False),
+    ({'type': 'kinet'}, 300, True),
+    ({'type': 'kinet', 'portout': True}, 255, True),
+    ({'type': 'kinet', 'portout': True}, 300, False),
+    ({'type': 'kinet', 'portout': True}, 0, False),
+))
+def test_universe_range(node, nr, valid):
+    config = {'nodes': [{**node, 'ip': 'IP', 'port': 1, 'start_refresh_task': False, 'universes': [{'nr': nr}]}]}
+    if not valid:
+        with pytest.raises(InvalidUniverseAddressError, match=r'universes\[0\].nr: Universe must be'):
+            compile_rig(config)
+        return None
+
+    rig = compile_rig(config).create()
+    assert rig.nodes[0].get_universe(nr)._universe == nr
+
+
+def test_no_snapshot_on_error(tmp_path: Path, monkeypatch):
+    file = tmp_path / 'rig.json'
+    file.write_text(json.dumps(RIG))
+    cache = tmp_path / 'cache'
+
+    def fail(self):
+        raise ValueError('create failed')
+    monkeypatch.setattr('pyartnet.rig.CompiledRig.create', fail)
+    with pytest.raises(ValueError, match='create failed'):
+        load_rig(file, cache)
+    assert not cache.is_dir() or not list(cache.iterdir())
@@ -0,0 +1,57 @@
+from asyncio import get_running_loop
+from unittest.mock import Mock
+
+from pyartnet import ArtNetNode
+from pyartnet.base.socket_output import SocketOutput
+
+
+async def test_backpressure(monkeypatch):
+    loop = get_running_loop()
+    add_writer = Mock()
+    remove_writer = Mock()
+    monkeypatch.setattr(loop, 'add_writer', add_writer)
+    monkeypatch.setattr(loop, 'remove_writer', remove_writer)
+
+    sock = Mock()
+    sock.sendto = Mock(side_effect=BlockingIOError)
+    o = SocketOutput(sock, ('ip', 1))
+
+    assert o.send(b'u1_1', 1) == 0
+    add_writer.assert_called_once_with(sock, o._flush)
+
+    # still busy, packets are queued and replaced
+    sock.sendto.side_effect = None
+    sock.sendto.reset_mock()
+    o.send(b'u2_1', 2)
+    o.send(b'u1_2', 1)
+    sock.sendto.assert_not_called()
+    assert o._pending == {1: b'u1_2', 2: b'u2_1'}
+    assert o._dropped == 1
+
+    # partial flush
+    sock.sendto.side_effect = [None, BlockingIOError]
+    o._flush()
+    assert o._pending == {2: b'u2_1'}
+    remove_writer.assert_not_called()
+
+    sock.sendto.side_effect = None
+    o._flush()
+    assert not o._pending
+    remove_writer.assert_called_once_with(sock)
+    assert [c[0][0] for c in sock.sendto.call_args_list] == [b'u1_2', b'u2_1', b'u2_1']
+
+    # socket free again -> directly sent
+    sock.sendto.reset_mock()
+    o.send(b'u1_3', 1)
+    sock.sendto.assert_called_once_with(b'u1_3', ('ip', 1))
+
+
+async def test_node_dropped_frames(monkeypatch):
+    node = ArtNetNode('ip', 9999, start_refresh_task=False)
+    monkeypatch.setattr(get_running_loop(), 'add_writer', Mock())
+
+    node._socket.sendto.side_effect = BlockingIOError
+    u = node.add_universe(1)
+    u.send_data()
+    u.send_data()
+    assert node.dropped_frames == 1
@@ -0,0 +1,109 @@
+from pathlib import Path
+
+from pyartnet.state import StateStore
+from tests.conftest import TestingNode
+
+
+def create_node() -> TestingNode:
+    node = TestingNode('IP', 9999)
+    u = node.add_universe(1)
+    u.add_channel(1, 3, 'rgb')
+    u.add_channel(4, 1, 'dimmer').set_output_correction(lambda val, max_val: val / 2)
+    u.add_channel(5, 1, 'pan', byte_size=2, byte_order='big')
+    node.add_universe(2).write_buffer(1, b'\x01\x02\x03\x04')
+    return node
+
+
+async def test_restore(tmp_path: Path):
+    file = tmp_path / 'state'
+
+    node = create_node()
+    node[1]['rgb'].set_values([1, 2, 3])
+    node[1]['dimmer'].set_values([200])
+    node[1]['pan'].set_values([0x1234])
+
+    store = StateStore(file)
+    store.add_node(node)
+    store.checkpoint()
+    node[2].write_buffer(1, b'\x05\x06')
+    store.close()
+
+    node = create_node()
+    StateStore(file).add_node(node).close()
+    assert node[1]._data == b'\x01\x02\x03\x64\x12\x34'
+    assert node[2]._data == b'\x05\x06\x03\x04'
+
+    # channel values are not restored
+    assert node[1]['dimmer'].get_values() == [0]
+
+
+async def test_restore_channel_values(tmp_path: Path):
+    file = tmp_path / 'state'
+
+    node = create_node()
+    node[1]['rgb'].set_values([1, 2, 3])
+    node[1]['dimmer'].set_values([200])
+    node[1]['pan'].set_values([0x1234])
+    StateStore(file, channel_values=True).add_node(node).close()
+
+    node = create_node()
+    StateStore(file, channel_values=True).add_node(node).close()
+    assert node[1]._data == b'\x01\x02\x03\x64\x12\x34'
+    assert node[1]['rgb'].get_values() == [1, 2, 3]
+    assert node[1]['dimmer'].get_values() == [200]
+    assert node[1]['pan'].get_values() == [0x1234]
+
+
+async def test_channel_values_same_output(tmp_path: Path):
+    file = tmp_path / 'state'
+
+    node = create_node()
+    store = StateStore(file, channel_values=True).add_node(node)
+    node[1]['dimmer'].set_values([200])
+    store.checkpoint()
+
+    # the output correction maps both values to the same output
+    data = bytes(node[1]._data)
+    node[1]['dimmer'].set_values([201])
+    assert node[1]._data == data
+    store.close()
+
+    node = create_node()
+    StateStore(file, channel_values=True).add_node(node).close()
+    assert node[1]['dimmer'].get_values() == [201]
+
+
+async def test_different_layout(tmp_path: Path, caplog):
+    file = tmp_path / 'state'
+
+    node = create_node()
+    node[1]['rgb'].set_values([1, 2, 3])
+    StateStore(file, channel_values=True).add_node(node).close()
+
+    node = create_node()
+    StateStore(file).add_node(node).close()
+    assert node[1]._data == bytes(6)
+
+    assert caplog.messages[-1].startswith('State file was saved with a different layout and is discarded')
+    caplog.clear()
+
+
+async def test_periodic_checkpoint(tmp_path: Path):
+    file = tmp_path / 'state'
+
+    node = TestingNode('IP', 9999)
+    store = StateStore(file, interval=0.01)
+    store.add_node(node)
+
+    # universes which are added later are saved, too
+    for nr in range(20):
+        node.add_universe(nr).write_buffer(1, bytes([nr]))
+    await node.sleep_steps(2)
+
+    # file is not closed, e.g. because the process crashed
+    node = TestingNode('IP', 9999)
+    for nr in range(20):
+        node.add_universe(nr)
+    StateStore(file).add_node(node).close()
+    assert [u._data[0] for u in node._universes] == list(range(20))
+    store.close()
@@ -0,0 +1,111 @@
+from asyncio import sleep
+
+import pytest
+
+from pyartnet.base import BaseUniverse
+from pyartnet.stream import FrameStream
+from tests.conftest import TestingNode
+
+
+async def frames(count: int, delay: float = 0):
+    for i in range(count):
+        yield bytes([i, 255 - i])
+        if delay:
+            await sleep(delay)
+
+
+async def test_block(node: TestingNode, universe: BaseUniverse):
+    universe.add_channel(1, 2)
+    stream = FrameStream(frames(5), universe)
+    await stream
+    await node.wait_for_task_finish()
+
+    # every frame is sent exactly once
+    assert node.data == ['00ff', '01fe', '02fd', '03fc', '04fb']
+    assert stream.dropped_frames == 0
+
+
+async def test_slow_producer(node: TestingNode, universe: BaseUniverse):
+    c = universe.add_channel(1, 2)
+    stream = FrameStream(frames(2, node._process_every * 4), c)
+    await stream
+
+    # the last value is held until the next frame arrives
+    assert c.get_values() == [1, 254]
+    assert node.data[0] == '00ff'
+    assert node.data[-1] == '01fe'
+    assert len(node.data) == 2
+
+
+@pytest.mark.parametrize('policy, expected', (('latest', '6400'), ('drop', '0100')))
+async def test_fast_producer(node: TestingNode, universe: BaseUniverse, policy, expected):
+    c = universe.add_channel(1, 1)
+
+    async def fast():
+        for i in range(100):
+            yield [i + 1]
+
+    stream = FrameStream(fast(), c, policy=policy)
+    await stream
+    await node.wait_for_task_finish()
+
+    assert node.data[0] == expected
+    assert stream.dropped_frames == 99
+
+
+async def test_channel_group(node: TestingNode, universe: BaseUniverse):
+    a = universe.add_channel(1, 1)
+    b = universe.add_channel(2, 2)
+
+    async def source():
+        yield [5], [6, 7]
+
+    await FrameStream(source(), (a, b))
+    assert node.data == ['05060700']
+
+
+async def test_stop(node: TestingNode, universe: BaseUniverse):
+    universe.add_channel(1, 2)
+
+    async def endless():
+        i = 0
+        while True:
+            yield bytes([i % 256, 0])
+            i += 1
+
+    stream = FrameStream(endless(), universe)
+    await node.sleep_steps(3)
+    stream.stop()
+    await stream
+    assert not node._process_jobs
+    assert node.data
+
+
+@pytest.mark.parametrize('frame', ([1, 2], [256]))
+async def test_invalid_frame(node: TestingNode, universe: BaseUniverse, caplog, frame):
+    c = universe.add_channel(1, 1)
+    fade = universe.add_channel(2, 1)
+
+    async def source():
+        yield [5]
+        yield frame
+        yield [6]
+
+    fade.set_fade([100], 100)
+    stream = FrameStream(source(), c)
+    await stream
+
+    # only the stream is stopped
+    await fade
+    assert c.get_values() == [5]
+    assert fade.get_values() == [100]
+
+    assert [m for m in caplog.messages if m.startswith('Invalid frame, stream is stopped: ')]
+    caplog.clear()
+
+
+async def test_errors(node: TestingNode, universe: BaseUniverse):
+    with pytest.raises(ValueError, match='Policy must be "block", "latest" or "drop": fifo'):
+        FrameStream(frames(1), universe, 'fifo')    # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='No channels specified!'):
+        FrameStream(frames(1), [])
@@ -0,0 +1,78 @@
+import pytest
+
+from pyartnet.base import BaseUniverse
+from pyartnet.errors import ChannelValueOutOfBoundsError, ValueCountDoesNotMatchChannelWidthError
+from pyartnet.timeline import Timeline
+from tests.conftest import STEP_MS, TestingNode
+
+
+def test_compile(universe: BaseUniverse):
+    c1 = universe.add_channel(1, 2)
+    c2 = universe.add_channel(3, 1)
+
+    t = Timeline()
+    t.add_cue({c1: [10, 20]}, fade_ms=100, hold_ms=50)
+    t.add_cue({c1: [0, 0], c2: [255]}, fade_ms=100)
+    assert t.duration == 250
+    t.compile()
+
+    (ch1, times1, values1), (ch2, times2, values2) = t._tracks
+    assert ch1 is c1
+    assert list(times1) == [0, 100, 150, 250]
+    assert list(values1[2:]) == [10, 20, 10, 20, 0, 0]
+
+    assert ch2 is c2
+    assert list(times2) == [0, 150, 250]
+    assert list(values2[2:]) == [255]
+
+
+def test_errors(universe: BaseUniverse):
+    c = universe.add_channel(1, 2)
+    t = Timeline()
+
+    with pytest.raises(ValueCountDoesNotMatchChannelWidthError):
+        t.add_keyframe(c, 0, [1])
+    with pytest.raises(ChannelValueOutOfBoundsError):
+        t.add_keyframe(c, 0, [1, 256])
+    with pytest.raises(ValueError, match='Keyframe time must be >= 0!'):
+        t.add_keyframe(c, -1, [1, 2])
+
+
+async def test_run(node: TestingNode, universe: BaseUniverse):
+    c1 = universe.add_channel(1, 1)
+    c2 = universe.add_channel(2, 1)
+    c1.set_values([100])
+
+    t = Timeline()
+    t.add_keyframe(c1, 4 * STEP_MS, [0])
+    t.add_cue({c2: [200]}, fade_ms=4 * STEP_MS, hold_ms=2 * STEP_MS)
+    t.start()
+    assert len(node._process_jobs) == 1
+
+    await t
+    assert not node._process_jobs
+    assert c1.get_values() == [0]
+    assert c2.get_values() == [200]
+
+    # values were interpolated
+    values = [int(v[2:4], 16) for v in node.data]
+    assert values == sorted(values)
+    assert len(values) >= 3
+
+
+async def test_loop_stop(node: TestingNode, universe: BaseUniverse):
+    c = universe.add_channel(1, 1)
+
+    t = Timeline(loop=True)
+    t.add_keyframe(c, 0, [0])
+    t.add_keyframe(c, 2 * STEP_MS, [255])
+    t.start()
+
+    await node.sleep_steps(10)
+    assert len(node._process_jobs) == 1
+    values = [int(v[:2], 16) for v in node.data]
+    assert values != sorted(values)
+
+    t.stop()
+    assert not node._process_jobs
+    await t
@@ -0,0 +1,61 @@
+import socket
+from asyncio import sleep
+
+from pyartnet import ArtNetNode, ArtNetReceiver
+from pyartnet.base.transport_output import DatagramTransportOutput
+
+
+async def test_transport_output():
+    received = []
+    r = ArtNetReceiver(lambda u, d: received.append((u, bytes(d))))
+    await r.listen('127.0.0.1', 0)
+    port = r._transport.get_extra_info('sockname')[1]
+
+    node = ArtNetNode('127.0.0.1', port, start_refresh_task=False)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    object.__setattr__(node, '_socket', sock)
+
+    await node.use_datagram_transport()
+    assert isinstance(node._output, DatagramTransportOutput)
+
+    u = node.add_universe(3)
+    u.add_channel(1, 2).set_values([1, 2])
+    u.send_data()
+    await sleep(0.05)
+    assert received == [(3, b'\x01\x02')]
+
+    node._output._transport.close()
+    r.close()
+    await sleep(0)
+
+
+async def test_paused():
+    o = DatagramTransportOutput(('ip', 1))
+
+    # not connected yet
+    o.send(b'1', 1)
+    o.send(b'2', 1)
+    assert o._pending == {1: b'2'}
+    assert o._dropped == 1
+
+    class Transport:
+        def __init__(self):
+            self.sent = []
+
+        def sendto(self, data, addr):
+            self.sent.append(data)
+
+    t = Transport()
+    o.connection_made(t)
+    assert t.sent == [b'2']
+
+    o.pause_writing()
+    o.send(b'3', 1)
+    o.send(b'4', 2)
+    assert t.sent == [b'2']
+    o.resume_writing()
+    assert t.sent == [b'2', b'3', b'4']
+
+    o.send(b'5', 2)
+    assert t.sent == [b'2', b'3', b'4', b'5']
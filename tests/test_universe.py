@@ -1,8 +1,11 @@
+from array import array
+
 import pytest
 
 from pyartnet import errors
 from pyartnet.base import BaseUniverse
 from pyartnet.errors import ChannelNotFoundError
+from tests.conftest import TestingNode
 
 
 def test_exceptions(universe: BaseUniverse):
@@ -76,3 +79,89 @@ def test_access(universe: BaseUniverse):
     assert len(universe) == 2
     assert universe.get_channel('2/1') is c
     assert universe['2/1'] is c
+
+
+async def test_write_buffer(node, universe: BaseUniverse):
+    universe.add_channel(1, 2)
+    universe._data_changed = False
+
+    universe.write_buffer(2, b'\x01\x02\x03')
+    assert universe._data_size == 4
+    assert universe._data == b'\x00\x01\x02\x03'
+    assert universe._data_changed
+
+    # buffer protocol objects
+    universe._data_changed = False
+    universe.write_buffer(1, array('B', [5, 6]))
+    assert universe._data == b'\x05\x06\x02\x03'
+    assert universe._data_changed
+
+    # no change -> universe is not marked as changed
+    universe._data_changed = False
+    universe.write_buffer(1, memoryview(b'\x05\x06'))
+    assert not universe._data_changed
+
+    # raw size is kept when the universe is resized
+    universe.add_channel(3, 1)
+    assert universe._data_size == 4
+
+    universe.write_buffer(4, b'\x04')
+    await node.sleep_steps(2)
+    assert node.data == ['05060204']
+
+
+async def test_write_buffer_boundaries(universe: BaseUniverse):
+    with pytest.raises(errors.BufferOutOfUniverseError) as e:
+        universe.write_buffer(0, b'\x00')
+    assert str(e.value) == 'Buffer out of universe (1..512): start: 0 length: 1 -> 0'
+
+    with pytest.raises(errors.BufferOutOfUniverseError) as e:
+        universe.write_buffer(512, b'\x00\x00')
+    assert str(e.value) == 'Buffer out of universe (1..512): start: 512 length: 2 -> 513'
+
+    universe.write_buffer(511, b'\x00\x00')
+    assert universe._data_size == 512
+
+
+async def test_master(node: TestingNode, universe: BaseUniverse):
+    dimmer = universe.add_channel(1, 2).set_intensity()
+    color = universe.add_channel(3, 2)
+    dimmer_16 = universe.add_channel(5, 1, byte_size=2, byte_order='big').set_intensity()
+
+    dimmer.set_values([255, 100])
+    color.set_values([255, 100])
+    dimmer_16.set_values([0xFFFF])
+
+    universe.send_data()
+    assert node.data[-1] == 'ff64ff64ffff'
+
+    with pytest.raises(ValueError, match='Master must be between 0 and 1!'):
+        universe.set_master(1.5)
+
+    universe.set_master(0.5)
+    assert universe._data_changed
+    universe.send_data()
+    assert node.data[-1] == '8032ff648000'
+
+    # universe and node master are combined
+    node.set_master(0.5)
+    universe.send_data()
+    assert node.data[-1] == '4019ff644000'
+
+    # channel values are unchanged
+    assert dimmer.get_values() == [255, 100]
+    assert universe._data.hex() == 'ff64ff64ffff'
+
+    node.set_master(1)
+    universe.set_master(1)
+    assert universe._master_lut is None
+    universe.send_data()
+    assert node.data[-1] == 'ff64ff64ffff'
+
+    # unmarked channel
+    universe.set_master(0)
+    dimmer.set_intensity(False)
+    universe.send_data()
+    assert node.data[-1] == 'ff64ff640000'
+
+    await node.wait_for_task_finish()
@@ -0,0 +1,55 @@
+from asyncio import get_running_loop, sleep
+from time import monotonic
+
+import pytest
+
+from pyartnet.base.clock import monotonic as clock
+from pyartnet.virtual_time import run_virtual_time
+from tests.conftest import TestingNode
+
+
+def test_virtual_sleep():
+    async def main():
+        start = get_running_loop().time()
+        await sleep(3600)
+        assert clock() - start == 3600
+        return 'done'
+
+    real_start = monotonic()
+    assert run_virtual_time(main(), start=1000) == 'done'
+    assert monotonic() - real_start < 1
+
+
+def test_virtual_fade():
+    async def main():
+        node = TestingNode('ip', 9999)
+        node.start_refresh()
+        c = node.add_universe(1).add_channel(1, 1)
+
+        start = clock()
+        c.set_fade([255], 30 * 60 * 1000)
+        await c
+        return node.data, clock() - start
+
+    real_start = monotonic()
+    data, duration = run_virtual_time(main())
+    assert monotonic() - real_start < 10
+
+    # the step time of the fade is rounded to full ms
+    assert duration == pytest.approx(30 * 60, rel=0.015)
+
+    # every value and the refresh every 2 secs
+    assert list(dict.fromkeys(data)) == [f'{i:02x}00' for i in range(256)]
+    assert 256 + 255 * 2 < len(data) <= 256 + 255 * 3
+    assert data[-1] == 'ff00'
+
+
+def test_virtual_time_reproducible():
+    async def main():
+        node = TestingNode('ip', 9999)
+        c = node.add_universe(1).add_channel(1, 1)
+        c.set_fade([255], 5000)
+        await c
+        return node.data
+
+    assert run_virtual_time(main(), start=0) == run_virtual_time(main(), start=0)